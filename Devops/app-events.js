@@ -0,0 +1,27 @@
+// App lifecycle events - shared by the tourist places and food places pages
+//
+// Every milestone is appended to window.cityQuestEvents (so late listeners,
+// like automated tests, can still see it) and dispatched on the document as
+// a 'cityquest:<name>' CustomEvent.
+//
+//   first-cards       { count }                    first streamed records shown
+//   data-loaded       { count }                    every record streamed in and shown
+//   location-resolved { granted, latitude, longitude } or { granted: false, reason }
+//   filters-applied   { count, total }             cards on screen match the filters
+//   nearest-ranked    { count, examined, elapsedMs }  "Show Nearest" cards on screen
+//   nearest-refined   { count, elapsedMs }         ... and road distances filled in
+//   nearest-updated   { count, changed, examined, routed, elapsedMs }  "Follow Me" re-ranked after a move
+//   details-loaded    { id }                       an expanded card's details filled in
+//   filter-worker-ready { count }                  filtering moved to the worker
+
+window.cityQuestEvents = window.cityQuestEvents || [];
+
+function publishAppEvent(name, detail = {}) {
+    window.cityQuestEvents.push({
+        name,
+        detail,
+        seq: window.cityQuestEvents.length + 1,
+        time: performance.now()
+    });
+    document.dispatchEvent(new CustomEvent(`cityquest:${name}`, { detail }));
+}
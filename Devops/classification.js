@@ -0,0 +1,25 @@
+// Filter group classification - which filter options each place_type matches
+//
+// The rules live in cityquest/classification.py; the build resolves them
+// for every raw place_type into generated/classification-<page>.json, so a
+// lookup here is a single Map access instead of substring matching.
+
+class ClassificationTable {
+    // section: { options: [labels], groups: { raw place_type: [labels] } }
+    constructor(section) {
+        this.options = section.options;
+        this.groups = new Map(Object.entries(section.groups).map(([placeType, labels]) => [placeType, new Set(labels)]));
+    }
+
+    // Does a record with this raw place_type match filter option `label`?
+    matches(placeType, label) {
+        const labels = this.groups.get(placeType);
+        return labels !== undefined && labels.has(label);
+    }
+}
+
+// Fetch the table for one page ('destinations' or 'food')
+async function loadClassification(page) {
+    const response = await fetch(`${window.CityQuestConfig.dataBaseUrl}/classification-${page}.json`);
+    return new ClassificationTable(await response.json());
+}
@@ -0,0 +1,42 @@
+// Site configuration
+//
+// Edit the defaults below for on-prem deployments (e.g. point routingBaseUrl
+// at `python -m cityquest.routing`), or define window.CityQuestConfig before
+// this script runs to override individual settings - the test harness does
+// that to use its local routing stand-in.
+
+window.CityQuestConfig = Object.assign({
+    // Where the pages load the build's datasets and indexes from
+    dataBaseUrl: 'generated',
+    // OSRM-compatible routing service used for road distances
+    routingBaseUrl: 'https://router.project-osrm.org',
+    // Parallel /route requests when the routing service has no /table support
+    routingConcurrency: 3,
+    // How many places "Show Nearest" ranks and refines with road distances
+    nearestCount: 5,
+    // Road distance cache: origin grid cell size (~500 m), size and lifetime
+    distanceCacheGridDegrees: 0.005,
+    distanceCacheMaxEntries: 500,
+    distanceCacheTtlMs: 24 * 60 * 60 * 1000,
+    // How many food places "Show Nearby" lists when no radius is selected
+    nearbyCount: 10,
+    // Food page spatial index cell size (~1 km)
+    nearbyGridCellDegrees: 0.01,
+    // Result grids with more cards than this only keep the cards near the
+    // viewport in the page, plus this much overscan above and below
+    windowedGridThreshold: 200,
+    windowedGridOverscanPx: 800,
+    // Datasets with more records than this filter, search and rank by
+    // distance in a Web Worker, keeping the main thread free for input
+    filterWorkerThreshold: 5000,
+    // Filter inputs are applied once per animation frame (0), or once they
+    // have been idle for this many ms
+    filterIdleMs: 0,
+    // Results of this many recent filter combinations are kept per page
+    filterCacheEntries: 50,
+    // Give up waiting for the user's location (permission prompt included)
+    // after this long; the page works without it either way
+    locationTimeoutMs: 10000,
+    // "Follow Me" re-ranks the nearest places once the user has moved this far
+    liveMoveThresholdMeters: 50
+}, window.CityQuestConfig || {});
@@ -0,0 +1,39 @@
+// Detail chunks - card details fetched on demand
+//
+// The build splits the destinations into a slim list, with what the
+// collapsed cards and the filters need (streamed, see ndjson-stream.js),
+// and detail files of `chunkSize`
+// records each (see cityquest/build/destination_payloads.py). A chunk is
+// fetched the first time one of its records' details is asked for, e.g.
+// when a card is hovered or expanded, and kept for the rest of the visit.
+
+class DetailChunks {
+    constructor(baseUrl, chunkSize) {
+        this.baseUrl = baseUrl;
+        this.chunkSize = chunkSize;
+        this.chunks = new Map();  // chunk number -> Promise of its records' details
+    }
+
+    // Promise of the details of the record at `position` in the list
+    get(position) {
+        const chunk = Math.floor(position / this.chunkSize);
+        let details = this.chunks.get(chunk);
+        if (!details) {
+            details = fetch(`${this.baseUrl}/${chunk}.json`).then(response => {
+                if (!response.ok) throw new Error(`Detail chunk ${chunk}: HTTP ${response.status}`);
+                return response.json();
+            });
+            // Forget failed fetches so the next request retries
+            details.catch(() => this.chunks.delete(chunk));
+            this.chunks.set(chunk, details);
+        }
+        return details.then(records => records[position % this.chunkSize]);
+    }
+}
+
+// A row of the destination list as an object, with its position in the list
+function listRecord(fields, row, position) {
+    const record = { position };
+    fields.forEach((field, i) => { record[field] = row[i]; });
+    return record;
+}
@@ -0,0 +1,167 @@
+// Bitset facet engine - filtering and live option counts for both pages
+//
+// Every filter option gets one bitset over the records, built once at load:
+// bit i is set when record i matches the option. A query ORs the selected
+// options within each facet and ANDs the facets together, a few hundred
+// word operations even for large datasets. The count next to an option is
+// how many results it would give with every other facet's selection
+// applied. cityquest/facets.py is the Python reference implementation.
+
+function popcount32(word) {
+    word = word - ((word >>> 1) & 0x55555555);
+    word = (word & 0x33333333) + ((word >>> 2) & 0x33333333);
+    return (((word + (word >>> 4)) & 0x0F0F0F0F) * 0x01010101) >>> 24;
+}
+
+class FacetEngine {
+    // facets: { name: [{ value, test(record) }, ...] } in display order; an
+    // option can give its ready-made `bits` instead of a test
+    constructor(records, facets) {
+        this.records = records;
+        this.facets = facets;
+        this.sizeBitsets();
+        this.bits = {};
+        this.stale = new Set();
+        this.version = 0;  // bumped whenever a query could answer differently
+        Object.keys(facets).forEach(name => this.rebuildFacet(name));
+    }
+
+    // Bitset length and the all-records bitset for the current records
+    sizeBitsets() {
+        const count = this.records.length;
+        this.words = Math.ceil(count / 32);
+        this.all = new Uint32Array(this.words).fill(0xFFFFFFFF);
+        if (count % 32) this.all[this.words - 1] = (2 ** (count % 32) - 1) >>> 0;
+    }
+
+    // Add `records` to the end of the records array the engine was given,
+    // e.g. as a streamed payload arrives. Only the new records are tested
+    // against each option.
+    append(records) {
+        const start = this.records.length;
+        records.forEach(record => this.records.push(record));
+        this.sizeBitsets();
+        this.version++;
+        Object.keys(this.facets).forEach(name => {
+            this.facets[name].forEach(option => {
+                const bits = new Uint32Array(this.words);
+                bits.set(this.bits[name].get(option.value));
+                for (let i = start; i < this.records.length; i++) {
+                    if (option.test(this.records[i])) bits[i >>> 5] |= 1 << (i & 31);
+                }
+                this.bits[name].set(option.value, bits);
+            });
+        });
+    }
+
+    // Mark a facet whose inputs changed; it is rebuilt before the next query
+    invalidate(name) {
+        this.stale.add(name);
+        this.version++;
+    }
+
+    // Recompute one facet's bitsets, e.g. after user distances change
+    rebuildFacet(name) {
+        this.bits[name] = new Map();
+        this.facets[name].forEach(option => {
+            if (option.bits) {
+                this.bits[name].set(option.value, option.bits);
+                return;
+            }
+            const bits = new Uint32Array(this.words);
+            this.records.forEach((record, i) => {
+                if (option.test(record)) bits[i >>> 5] |= 1 << (i & 31);
+            });
+            this.bits[name].set(option.value, bits);
+        });
+    }
+
+    // Copies of a facet's bitsets, [{ value, bits }] in display order, e.g.
+    // to hand to a worker
+    copyBits(name) {
+        if (this.stale.delete(name)) this.rebuildFacet(name);
+        return Array.from(this.bits[name], ([value, bits]) => ({ value, bits: bits.slice() }));
+    }
+
+    // Bitset of the record positions in `indexes`, e.g. search results
+    bitsOf(indexes) {
+        const bits = new Uint32Array(this.words);
+        for (let i = 0; i < indexes.length; i++) bits[indexes[i] >>> 5] |= 1 << (indexes[i] & 31);
+        return bits;
+    }
+
+    // Records at `indexes`, in that order, whose bit is set in `bits`
+    recordsAt(indexes, bits) {
+        const records = [];
+        for (let i = 0; i < indexes.length; i++) {
+            if (bits[indexes[i] >>> 5] & (1 << (indexes[i] & 31))) records.push(this.records[indexes[i]]);
+        }
+        return records;
+    }
+
+    // Records matching `selection` ({ facet: [values] }) among `within`
+    // (a bitset, default all records); `exclude` skips a facet
+    matchBits(selection, exclude = null, within = this.all) {
+        const result = within.slice();
+        const union = new Uint32Array(this.words);
+        Object.entries(selection).forEach(([name, values]) => {
+            if (name === exclude || values.length === 0) return;
+            union.fill(0);
+            values.forEach(value => {
+                const bits = this.bits[name].get(value);
+                if (!bits) return;
+                for (let w = 0; w < this.words; w++) union[w] |= bits[w];
+            });
+            for (let w = 0; w < this.words; w++) result[w] &= union[w];
+        });
+        return result;
+    }
+
+    // { matches: [records in original order], bits, counts: { facet: Map(value -> count) } }
+    // `within` narrows everything, counts included, to a bitset of records
+    query(selection, within = this.all) {
+        this.stale.forEach(name => this.rebuildFacet(name));
+        this.stale.clear();
+        const result = this.matchBits(selection, null, within);
+        const matches = [];
+        for (let w = 0; w < this.words; w++) {
+            let word = result[w];
+            while (word) {
+                const low = word & -word;
+                matches.push(this.records[(w << 5) + 31 - Math.clz32(low)]);
+                word ^= low;
+            }
+        }
+
+        const counts = {};
+        Object.keys(this.facets).forEach(name => {
+            const others = selection[name] && selection[name].length ? this.matchBits(selection, name, within) : result;
+            counts[name] = new Map();
+            this.bits[name].forEach((bits, value) => {
+                let count = 0;
+                for (let w = 0; w < this.words; w++) {
+                    const word = bits[w] & others[w];
+                    if (word) count += popcount32(word);
+                }
+                counts[name].set(value, count);
+            });
+        });
+        return { matches, bits: result, counts };
+    }
+}
+
+// Show `count` next to each checkbox; `valueOf(checkbox)` gives its option value
+function updateOptionCounts(checkboxes, counts, valueOf) {
+    checkboxes.forEach(checkbox => {
+        const label = checkbox.parentElement;
+        let badge = label.querySelector('.option-count');
+        if (!badge) {
+            badge = document.createElement('span');
+            badge.className = 'option-count';
+            label.appendChild(badge);
+        }
+        const count = counts.get(valueOf(checkbox)) || 0;
+        badge.textContent = `(${count})`;
+        label.classList.toggle('no-results-option', count === 0 && !checkbox.checked);
+    });
+}
@@ -0,0 +1,120 @@
+// Filter client - the main thread's side of filter-worker.js
+//
+// FilterClient.start() hands a page's filter data to a new worker and
+// resolves once it can answer, or with null if workers are unavailable (the
+// page then keeps filtering on the main thread). query() resolves with the
+// worker's answer, or with null once a newer query has been made: only the
+// latest query's result is ever rendered.
+
+class FilterClient {
+    constructor(worker) {
+        this.worker = worker;
+        this.nextId = 1;
+        this.waiting = new Map();  // id -> resolve
+        this.latestQuery = 0;
+        this.failed = false;
+        worker.onmessage = ({ data }) => {
+            const resolve = this.waiting.get(data.id);
+            if (!resolve) return;
+            this.waiting.delete(data.id);
+            resolve(data.cancelled ? null : data);
+        };
+        worker.onerror = event => {
+            console.error('Filter worker failed:', event.message);
+            this.failed = true;
+            this.waiting.forEach(resolve => resolve(null));
+            this.waiting.clear();
+        };
+    }
+
+    // options: { records, engine, facets: [names to copy from engine],
+    //            distanceRanges?: [{ value, min, max }], searchPage }
+    static start({ records, engine, facets, distanceRanges = null, searchPage }) {
+        if (typeof Worker === 'undefined') return Promise.resolve(null);
+        return new Promise(resolve => {
+            let worker;
+            try {
+                worker = new Worker('filter-worker.js');
+            } catch (err) {
+                console.error('Filter worker unavailable:', err);
+                resolve(null);
+                return;
+            }
+            worker.onmessage = ({ data }) => {
+                if (data.type === 'ready') {
+                    resolve(new FilterClient(worker));
+                    return;
+                }
+                console.error('Filter worker setup failed:', data.error);
+                worker.terminate();
+                resolve(null);
+            };
+            worker.onerror = event => {
+                console.error('Filter worker failed:', event.message);
+                worker.terminate();
+                resolve(null);
+            };
+
+            const column = valueOf => Float64Array.from(records, record => {
+                const value = valueOf(record);
+                return typeof value === 'number' ? value : NaN;
+            });
+            const message = {
+                type: 'init',
+                count: records.length,
+                facets: {},
+                distanceRanges,
+                latitude: column(record => record.latitude),
+                longitude: column(record => record.longitude),
+                distances: column(record => record.user_distance),
+                cellDegrees: window.CityQuestConfig.nearbyGridCellDegrees,
+                searchUrl: searchIndexUrl(searchPage)
+            };
+            const transfer = [message.latitude.buffer, message.longitude.buffer, message.distances.buffer];
+            facets.forEach(name => {
+                message.facets[name] = engine.copyBits(name);
+                message.facets[name].forEach(option => transfer.push(option.bits.buffer));
+            });
+            worker.postMessage(message, transfer);
+        });
+    }
+
+    request(message, id = this.nextId++) {
+        return new Promise(resolve => {
+            if (this.failed) {
+                resolve(null);
+                return;
+            }
+            this.waiting.set(id, resolve);
+            this.worker.postMessage({ ...message, id });
+        });
+    }
+
+    // { selection: { facet: [values] }, text, nearest?: { lat, lon, k, maxKm } }
+    // -> { positions, km, counts, examined, elapsedMs }, or null if overtaken
+    query(request) {
+        this.cancel();
+        this.latestQuery = this.nextId++;
+        return this.request({ type: 'query', nearest: null, ...request }, this.latestQuery);
+    }
+
+    // The `k` records nearest to (lat, lon), nearest first:
+    // -> { positions, km, examined }
+    locate(lat, lon, k) {
+        return this.request({ type: 'locate', lat, lon, k });
+    }
+
+    // Whatever the latest query returns is stale now: resolve it with null
+    cancel() {
+        const older = this.waiting.get(this.latestQuery);
+        if (older) {
+            this.waiting.delete(this.latestQuery);
+            older(null);
+        }
+    }
+
+    // Tell the worker some records' distances changed, e.g. to road distances
+    setDistances(positions, km) {
+        if (!this.failed) this.worker.postMessage({ type: 'distances', positions, km });
+    }
+}
@@ -0,0 +1,53 @@
+// Filter result cache - recent filter results, shared by both pages
+//
+// Entries are keyed on FilterSelection.key(), the canonical filter state,
+// so flipping back to a combination seen before shows its cards without
+// filtering again. The cache is a bounded LRU in memory. Every entry belongs
+// to one data version (more records streamed in, distances changed, the
+// search index arrived); a new version drops them all.
+//
+// The page's cache is window.cityQuestFilterCache; its stats count hits,
+// misses and the time spent looking entries up.
+
+class FilterResultCache {
+    constructor({ maxEntries }) {
+        this.maxEntries = maxEntries;
+        this.version = null;
+        this.entries = new Map(); // key -> result, oldest first
+        this.stats = { hits: 0, misses: 0, lookupMs: 0 };
+        window.cityQuestFilterCache = this;
+    }
+
+    // The data results are computed from is now at `version`
+    setVersion(version) {
+        if (version === this.version) return;
+        this.version = version;
+        this.entries.clear();
+    }
+
+    get(key) {
+        const started = performance.now();
+        const result = this.entries.get(key);
+        if (result === undefined) {
+            this.stats.misses++;
+        } else {
+            // Move to the most recently used end
+            this.entries.delete(key);
+            this.entries.set(key, result);
+            this.stats.hits++;
+        }
+        this.stats.lookupMs += performance.now() - started;
+        return result;
+    }
+
+    // Store a result computed at data `version` (e.g. by the filter worker),
+    // unless the data has changed since
+    set(key, result, version = this.version) {
+        if (version !== this.version) return;
+        this.entries.delete(key);
+        this.entries.set(key, result);
+        while (this.entries.size > this.maxEntries) {
+            this.entries.delete(this.entries.keys().next().value);
+        }
+    }
+}
@@ -0,0 +1,121 @@
+// Filter scheduler - one filter run per burst of filter input
+//
+// Filter inputs don't filter. A checkbox's change listener records its new
+// state in a FilterSelection, the page's in-memory copy of the filters, and
+// asks a FilterScheduler for a run. Every request made before the next
+// animation frame is answered by a single run, so three quick clicks filter
+// and render once. With CityQuestConfig.filterIdleMs set, the run instead
+// waits until the inputs have been quiet for that long.
+//
+// The page's scheduler is window.cityQuestFilterRuns; its stats count
+// requests, runs and renders, so tests can check what an interaction cost.
+//
+// A FilterSelection's key() is its canonical form, the same whatever order
+// the filters were picked in. It doubles as the page's query string, so a
+// link or a reload opens the page with the same filters.
+
+class FilterSelection {
+    // `fields`: names of single-valued filters besides the search text,
+    // e.g. the food page's radius
+    constructor(facets, fields = []) {
+        this.values = {};  // facet -> Set of selected option values
+        facets.forEach(facet => { this.values[facet] = new Set(); });
+        this.fields = {};  // field -> value, '' when unset
+        fields.forEach(field => { this.fields[field] = ''; });
+        this.text = '';
+    }
+
+    has(facet, value) {
+        return this.values[facet].has(value);
+    }
+
+    set(facet, value, selected) {
+        if (selected) {
+            this.values[facet].add(value);
+        } else {
+            this.values[facet].delete(value);
+        }
+    }
+
+    clear() {
+        Object.values(this.values).forEach(values => values.clear());
+        Object.keys(this.fields).forEach(field => { this.fields[field] = ''; });
+        this.text = '';
+    }
+
+    // { facet: [values] }, as FacetEngine.query takes it
+    toQuery() {
+        const selection = {};
+        Object.entries(this.values).forEach(([facet, values]) => { selection[facet] = Array.from(values); });
+        return selection;
+    }
+
+    // Canonical query string: facets in a fixed order, values sorted,
+    // unset fields left out. '' when nothing is selected.
+    key() {
+        const params = new URLSearchParams();
+        Object.entries(this.values).forEach(([facet, values]) => {
+            Array.from(values).sort().forEach(value => params.append(facet, value));
+        });
+        Object.entries(this.fields).forEach(([field, value]) => {
+            if (value !== '') params.append(field, value);
+        });
+        const text = this.text.trim();
+        if (text) params.append('q', text);
+        return params.toString();
+    }
+
+    // Selection saved in a query string by key(); facets and fields this
+    // selection doesn't have are ignored
+    readQueryString(search) {
+        new URLSearchParams(search).forEach((value, name) => {
+            if (this.values[name]) this.values[name].add(value);
+            else if (name in this.fields) this.fields[name] = value;
+            else if (name === 'q') this.text = value;
+        });
+    }
+
+    // Mirror the selection in the address bar, without a history entry per change
+    writeUrl() {
+        const key = this.key();
+        const url = `${location.pathname}${key ? `?${key}` : ''}${location.hash}`;
+        if (url !== `${location.pathname}${location.search}${location.hash}`) history.replaceState(history.state, '', url);
+    }
+}
+
+class FilterScheduler {
+    constructor(run, { idleMs = 0 } = {}) {
+        this.run = run;
+        this.idleMs = idleMs;
+        this.frame = 0;
+        this.timer = 0;
+        this.stats = { requests: 0, runs: 0, renders: 0 };
+        window.cityQuestFilterRuns = this;
+    }
+
+    // Run once the current burst of input is over
+    request() {
+        this.stats.requests++;
+        if (this.idleMs > 0) {
+            clearTimeout(this.timer);
+            this.timer = setTimeout(() => this.flush(), this.idleMs);
+        } else if (!this.frame) {
+            this.frame = requestAnimationFrame(() => this.flush());
+        }
+    }
+
+    // Run now, answering any request still waiting
+    flush() {
+        cancelAnimationFrame(this.frame);
+        clearTimeout(this.timer);
+        this.frame = 0;
+        this.timer = 0;
+        this.stats.runs++;
+        this.run();
+    }
+
+    // The page drew the results of a run
+    rendered() {
+        this.stats.renders++;
+    }
+}
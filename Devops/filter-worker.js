@@ -0,0 +1,113 @@
+// Filter worker - filtering, search and distance ranking off the main thread
+//
+// A page with more records than CityQuestConfig.filterWorkerThreshold hands
+// its filter data to this worker once everything has loaded (see
+// filter-client.js): the option bitsets it built, the coordinates and any
+// known distances as Float64Arrays, all transferred rather than copied. The
+// worker loads the search index itself, the first time a query has text to
+// search for. Queries are answered with the
+// matching record positions in display order plus the option counts, and
+// the page maps the positions back to its records. A query overtaken by a
+// newer one before the worker gets to it is dropped unanswered.
+
+importScripts('facet-engine.js', 'search-index.js', 'spatial-grid.js');
+
+let engine = null;
+let search = null;
+let grid = null;
+let distances = null;  // km from the user per record, NaN if unknown
+let pending = null;    // latest query not answered yet
+let searchUrl = null;
+let searchLoading = null;
+
+async function setup(message) {
+    const { latitude, longitude } = message;
+    distances = message.distances;
+
+    const facets = { ...message.facets };
+    if (message.distanceRanges) {
+        facets.distance = message.distanceRanges.map(range => ({
+            value: range.value,
+            test: i => distances[i] >= range.min && distances[i] <= range.max
+        }));
+    }
+    engine = new FacetEngine(Array.from({ length: message.count }, (_, i) => i), facets);
+
+    grid = new SpatialGrid([], { cellDegrees: message.cellDegrees });
+    for (let i = 0; i < message.count; i++) {
+        if (Number.isFinite(latitude[i]) && Number.isFinite(longitude[i])) {
+            grid.insert({ position: i, latitude: latitude[i], longitude: longitude[i] });
+        }
+    }
+
+    searchUrl = message.searchUrl;
+}
+
+// Resolves once `text` can be searched: straight away if it has no words or
+// the index is in, else when the index has been fetched (or failed to be)
+function searchReady(text) {
+    if (search || tokenize(text).length === 0) return Promise.resolve();
+    if (!searchLoading) {
+        searchLoading = fetch(searchUrl)
+            .then(response => response.json())
+            .then(section => { search = new SearchIndex(section); },
+                err => console.error('Filter worker could not load the search index:', err));
+    }
+    return searchLoading;
+}
+
+function answer({ id, selection, text, nearest }) {
+    const started = performance.now();
+    const ranked = search ? search.search(text) : null;
+    const { matches, bits, counts } = engine.query(selection, ranked ? engine.bitsOf(ranked) : undefined);
+    let positions = ranked ? engine.recordsAt(ranked, bits) : matches;
+    let km = null;
+    let examined = 0;
+    if (nearest) {
+        const found = grid.nearest(nearest.lat, nearest.lon, {
+            k: nearest.k,
+            maxKm: nearest.maxKm,
+            accept: item => (bits[item.position >>> 5] & (1 << (item.position & 31))) !== 0
+        });
+        positions = found.map(result => result.item.position);
+        km = Float64Array.from(found, result => result.km);
+        examined = grid.lastExamined;
+    }
+    const result = Uint32Array.from(positions);
+    postMessage({ type: 'result', id, positions: result, km, counts, examined, elapsedMs: performance.now() - started },
+        km ? [result.buffer, km.buffer] : [result.buffer]);
+}
+
+function distancesChanged() {
+    if (engine.facets.distance) engine.invalidate('distance');
+}
+
+// The `k` records nearest to (lat, lon) and their distances, from the grid
+function locate({ id, lat, lon, k }) {
+    const found = grid.nearest(lat, lon, { k });
+    const positions = Uint32Array.from(found, result => result.item.position);
+    const km = Float64Array.from(found, result => result.km);
+    postMessage({ type: 'located', id, positions, km, examined: grid.lastExamined }, [positions.buffer, km.buffer]);
+}
+
+onmessage = ({ data }) => {
+    if (data.type === 'init') {
+        setup(data).then(() => postMessage({ type: 'ready' }),
+            err => postMessage({ type: 'failed', error: String(err) }));
+    } else if (data.type === 'query') {
+        if (pending) postMessage({ type: 'result', id: pending.id, cancelled: true });
+        pending = data;
+        // Let queued messages in first (and the search index, the first
+        // time it is needed): a newer query replaces this one
+        searchReady(data.text).then(() => setTimeout(() => {
+            if (pending !== data) return;
+            pending = null;
+            answer(data);
+        }, 0));
+    } else if (data.type === 'locate') {
+        locate(data);
+    } else if (data.type === 'distances') {
+        data.positions.forEach((position, i) => { distances[position] = data.km[i]; });
+        distancesChanged();
+    }
+};
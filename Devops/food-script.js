@@ -4,33 +4,87 @@
 let allFoodPlaces = [];
 let userLat = null;
 let userLon = null;
+let foodGrid = null;      // SpatialGrid over allFoodPlaces, filled as they load
+let nearbyMode = false;   // "Show Nearby" ranks results nearest first
+let foodFacets = null;    // FacetEngine over allFoodPlaces (see facet-engine.js)
+let foodSearch = null;    // SearchIndex over allFoodPlaces, once loaded (see search-index.js)
+let foodCards = null;     // WindowedGrid for the food cards (see windowed-grid.js)
+let foodFilter = null;    // FilterClient for large datasets (see filter-client.js)
 
-// Load food places data
+// The filters as the user set them, one filter run per burst of input
+// (see filter-scheduler.js) and the results of recent runs
+// (see filter-result-cache.js)
+const foodSelection = new FilterSelection(['cuisine', 'budget'], ['radius']);
+const foodFilterRuns = new FilterScheduler(filterFoodPlaces, {
+    idleMs: window.CityQuestConfig.filterIdleMs
+});
+const foodResults = new FilterResultCache({
+    maxEntries: window.CityQuestConfig.filterCacheEntries
+});
+// The search index is fetched on the first search (see search-index.js)
+const foodSearches = new SearchIndexLoader('food', index => {
+    foodSearch = index;
+    foodFilterRuns.request();
+});
+
+// Budget filter ranges (inclusive)
+const FOOD_BUDGET_RANGES = [
+    { label: 'Budget Friendly (Under ₹200)', min: 0, max: 200 },
+    { label: 'Moderate (₹200 - ₹400)', min: 200, max: 400 },
+    { label: 'Premium (₹400 - ₹600)', min: 400, max: 600 },
+    { label: 'Fine Dining (Above ₹600)', min: 600, max: 999999 }
+];
+
+// Load food places data, streaming it: the first cards are drawn as soon as
+// the first records arrive and the rest are added as they come in
 async function loadFoodPlaces() {
     try {
-        const response = await fetch('food_places.json');
-        const foodPlaces = await response.json();
-        
-        allFoodPlaces = foodPlaces;
-        window.allFoodPlaces = foodPlaces; // Make globally accessible
-        
-        // Create filter options
-        createCuisineFilters(foodPlaces);
-        createBudgetFilters(foodPlaces);
+        const classification = loadClassification('food');
+        classification.catch(() => {});  // reported when the first batch awaits it
+        window.allFoodPlaces = allFoodPlaces; // Make globally accessible
+        foodGrid = new SpatialGrid([], { cellDegrees: window.CityQuestConfig.nearbyGridCellDegrees });
+        window.foodGrid = foodGrid;
         
         // Request user location
         requestUserLocation();
         
-        // Display all food places initially
-        displayFoodPlaces(foodPlaces);
+        // Filters, search and cards, set up once the first records are in
+        const prepare = async () => {
+            if (foodFacets) return;
+            const table = await classification;
+            createCuisineFilters(table);
+            createBudgetFilters();
+            foodFacets = createFoodFacets(allFoodPlaces, table);
+            foodCards = createFoodRenderer();
+            setupFilterListeners();
+        };
         
-        // Set up filter event listeners
-        setupFilterListeners();
+        let refresh = 0;
+        const count = await streamNdjson(`${window.CityQuestConfig.dataBaseUrl}/food-places.ndjson`, async places => {
+            await prepare();
+            const first = allFoodPlaces.length === 0;
+            foodFacets.append(places);
+            places.forEach(place => foodGrid.insert(place));
+            if (first) {
+                foodFilterRuns.flush();
+                publishAppEvent('first-cards', { count: places.length });
+            } else if (!refresh) {
+                // At most one re-filter per frame while records keep arriving
+                refresh = requestAnimationFrame(() => {
+                    refresh = 0;
+                    foodFilterRuns.flush();
+                });
+            }
+        });
+        await prepare();
         
-        // Update results count
-        updateResultsCount(foodPlaces.length, foodPlaces.length);
+        // Display all food places, with option counts
+        cancelAnimationFrame(refresh);
+        foodFilterRuns.flush();
+        publishAppEvent('data-loaded', { count });
+        startFoodWorker();
         
-        console.log(`Loaded ${foodPlaces.length} food places successfully!`);
+        console.log(`Loaded ${count} food places successfully!`);
         
     } catch (error) {
         console.error('Error loading food places:', error);
@@ -39,108 +93,40 @@ async function loadFoodPlaces() {
     }
 }
 
-// Request user location
-function requestUserLocation() {
-    if (navigator.geolocation) {
-        navigator.geolocation.getCurrentPosition(
-            (position) => {
-                userLat = position.coords.latitude;
-                userLon = position.coords.longitude;
-                console.log('Location obtained:', userLat, userLon);
-            },
-            (error) => {
-                console.log('Location permission denied or unavailable');
-            }
-        );
+// Large datasets filter and rank in a worker
+async function startFoodWorker() {
+    if (allFoodPlaces.length <= window.CityQuestConfig.filterWorkerThreshold) return;
+    const worker = await FilterClient.start({
+        records: allFoodPlaces,
+        engine: foodFacets,
+        facets: ['cuisine', 'budget'],
+        searchPage: 'food'
+    });
+    if (!worker) return;
+    foodFilter = worker;
+    publishAppEvent('filter-worker-ready', { count: allFoodPlaces.length });
+}
+
+// Request user location without holding anything up (see user-location.js).
+// A radius or "Show Nearby" picked before it arrived applies once it does.
+async function requestUserLocation() {
+    const located = await locateUser();
+    if (located.granted) {
+        userLat = located.latitude;
+        userLon = located.longitude;
+        if (foodFacets && (nearbyMode || foodSelection.fields.radius)) foodFilterRuns.request();
+    } else {
+        showLocationNotice(document.querySelector('.filter-count'), located.reason);
     }
+    publishAppEvent('location-resolved', located);
 }
 
-// Create cuisine type filters
-function createCuisineFilters(foodPlaces) {
-    const cuisineTypes = new Set();
-    
-    // Define more comprehensive cuisine groupings to reduce repetition
-    const cuisineGroupings = {
-        'Biryani & Hyderabadi': [
-            'Hyderabadi Biryani', 'Hyderabadi', 'Hyderabadi / Mughlai', 'Hyderabadi / Irani cafe', 
-            'Hyderabadi / Barbecue', 'Biryani / North Indian', 'Fine Dining - Hyderabadi',
-            'Fine Dining - Awadhi / Hyderabadi'
-        ],
-        'Street Food - Chaat': [
-            'Street Food / Chaat', 'Street Food / Hyderabadi'
-        ],
-        'Street Food - Quick Bites': [
-            'Street Food', 'Street Food / Non-veg', 'Street Food / Arabian'
-        ],
-        'Chai & Snacks': [
-            'Street Food / Tea Stall', 'Street Food / Cafe', 'Irani Cafe / Street Food',
-            'Juice Center / Snacks'
-        ],
-        'Bakery & Sweets': [
-            'Street Food / Bakery', 'Street Food / Middle Eastern', 'Casual dining / Sweets & Snacks',
-            'Casual Dining / Sweets & Snacks'
-        ],
-        'Food Streets': [
-            'Street Food / Food Street'
-        ],
-        'South Indian': [
-            'South Indian', 'Andhra / Spicy cuisine', 'Andhra / Traditional Thali', 
-            'Chettinad / South Indian', 'South Indian / Vegetarian'
-        ],
-        'North Indian & Mughlai': [
-            'North Indian', 'Mughlai / Barbecue', 'North West Frontier', 
-            'Fine Dining - North West Frontier', 'Vegetarian / North Indian'
-        ],
-        'Fine Dining': [
-            'Fine dining / Multi-cuisine', 'Fine Dining - Indian', 'Multi-cuisine / Lounge'
-        ],
-        'Cafes & Bakeries': [
-            'Cafe / Bakery', 'Bakery / Confectionery', 'Bakery / Hyderabadi sweets',
-            'Restaurant - Multi-cuisine / Bakery'
-        ],
-        'Vegetarian': [
-            'Vegetarian / Gujarati', 'Restaurant - Vegetarian / North Indian',
-            'Restaurant - South Indian / Vegetarian'
-        ],
-        'Buffet & BBQ': [
-            'Buffet / Barbecue', 'Restaurant - Mughlai / Barbecue'
-        ],
-        'Multi-Cuisine': [
-            'Multi-cuisine', 'Restaurant - Multi-cuisine'
-        ]
-    };
-    
-    // Extract and group cuisine types
-    foodPlaces.forEach(place => {
-        if (place.place_type) {
-            const cleanType = place.place_type.replace('Restaurant - ', '').trim();
-            
-            // Check if this type should be grouped
-            let grouped = false;
-            for (const [groupName, groupTypes] of Object.entries(cuisineGroupings)) {
-                if (groupTypes.some(groupType => 
-                    cleanType === groupType || 
-                    cleanType.includes(groupType) || 
-                    groupType.includes(cleanType)
-                )) {
-                    cuisineTypes.add(groupName);
-                    grouped = true;
-                    break;
-                }
-            }
-            
-            // If not grouped, add the original type (but clean it up)
-            if (!grouped) {
-                cuisineTypes.add(cleanType);
-            }
-        }
-    });
-    
-    // Create filter checkboxes
+// Create cuisine type filters from the classification table
+function createCuisineFilters(classification) {
     const container = document.getElementById('cuisine-filter-options');
     container.innerHTML = '';
     
-    Array.from(cuisineTypes).sort().forEach(type => {
+    classification.options.forEach(type => {
         const label = document.createElement('label');
         label.className = 'filter-label cuisine-filter';
         
@@ -159,18 +145,11 @@ function createCuisineFilters(foodPlaces) {
 }
 
 // Create budget range filters
-function createBudgetFilters(foodPlaces) {
-    const budgetRanges = [
-        { label: 'Budget Friendly (Under ₹200)', min: 0, max: 200 },
-        { label: 'Moderate (₹200 - ₹400)', min: 200, max: 400 },
-        { label: 'Premium (₹400 - ₹600)', min: 400, max: 600 },
-        { label: 'Fine Dining (Above ₹600)', min: 600, max: 999999 }
-    ];
-    
+function createBudgetFilters() {
     const container = document.getElementById('budget-filter-options');
     container.innerHTML = '';
     
-    budgetRanges.forEach(range => {
+    FOOD_BUDGET_RANGES.forEach(range => {
         const label = document.createElement('label');
         label.className = 'filter-label budget-filter';
         
@@ -189,21 +168,30 @@ function createBudgetFilters(foodPlaces) {
     });
 }
 
-// Display food places as cards
-function displayFoodPlaces(foodPlaces) {
-    const container = document.getElementById('food-places-container');
-    container.innerHTML = '';
+// Food place cards, built once per place and windowed for large result
+// sets (see keyed-renderer.js and windowed-grid.js)
+function createFoodRenderer() {
+    const renderer = new WindowedGrid(document.getElementById('food-places-container'), {
+        key: place => place.id,
+        create: createFoodCard,
+        update: updateDistanceBadge,
+        emptyMessage: 'No food places found matching your criteria. Try adjusting your filters!',
+        threshold: window.CityQuestConfig.windowedGridThreshold,
+        overscanPx: window.CityQuestConfig.windowedGridOverscanPx
+    });
     
-    if (foodPlaces.length === 0) {
-        container.innerHTML = '<p class="no-results">No food places found matching your criteria. Try adjusting your filters!</p>';
-        return;
-    }
+    // Expand/collapse details on click
+    renderer.onClick('.food-place-card', (place, event, card) => {
+        card.classList.toggle('expanded');
+    });
+    return renderer;
+}
+
+function createFoodCard(place) {
+    const card = document.createElement('div');
+    card.className = 'food-place-card';
     
-    foodPlaces.forEach(place => {
-        const card = document.createElement('div');
-        card.className = 'food-place-card';
-        
-        card.innerHTML = `
+    card.innerHTML = `
             <div class="card-header">
                 <h3 class="restaurant-name">${place.name}</h3>
                 <span class="budget-badge">₹${place.max_budget_for_one}</span>
@@ -228,28 +216,84 @@ function displayFoodPlaces(foodPlaces) {
                 </div>
             ` : ''}
         `;
-        
-        // Add click event to expand/collapse details
-        card.addEventListener('click', () => {
-            card.classList.toggle('expanded');
-        });
-        
-        container.appendChild(card);
-    });
+    return card;
+}
+
+// Distances (place -> km) the shown cards badge, null outside nearby mode
+let shownDistances = null;
+// Each card's distance badge, kept while detached so it is built only once
+const distanceBadges = new WeakMap();
+
+function updateDistanceBadge(card, place) {
+    let badge = distanceBadges.get(card);
+    if (!shownDistances || !shownDistances.has(place)) {
+        if (badge) badge.remove();
+        return;
+    }
+    if (!badge) {
+        badge = document.createElement('span');
+        badge.className = 'distance-badge';
+        distanceBadges.set(card, badge);
+    }
+    badge.textContent = `📍 ${shownDistances.get(place).toFixed(2)} km`;
+    if (!badge.isConnected) card.querySelector('.card-header').after(badge);
+}
+
+// Display food places as cards. `distances` (place -> km) adds distance badges.
+function displayFoodPlaces(foodPlaces, distances = null) {
+    shownDistances = distances;
+    foodCards.render(foodPlaces);
 }
 
-// Set up filter event listeners
+// Set up filter event listeners: inputs only update foodSelection and
+// request a filter run. They start out as the query string says, for the
+// options that exist.
 function setupFilterListeners() {
+    const saved = new FilterSelection(['cuisine', 'budget'], ['radius']);
+    saved.readQueryString(location.search);
+    
     // Cuisine filters
     const cuisineCheckboxes = document.querySelectorAll('.cuisine-checkbox');
     cuisineCheckboxes.forEach(checkbox => {
-        checkbox.addEventListener('change', filterFoodPlaces);
+        if (saved.has('cuisine', checkbox.dataset.cuisine)) {
+            checkbox.checked = true;
+            foodSelection.set('cuisine', checkbox.dataset.cuisine, true);
+        }
+        checkbox.addEventListener('change', () => {
+            foodSelection.set('cuisine', checkbox.dataset.cuisine, checkbox.checked);
+            foodFilterRuns.request();
+        });
     });
     
     // Budget filters
     const budgetCheckboxes = document.querySelectorAll('.budget-checkbox');
     budgetCheckboxes.forEach(checkbox => {
-        checkbox.addEventListener('change', filterFoodPlaces);
+        if (saved.has('budget', budgetCheckboxKey(checkbox))) {
+            checkbox.checked = true;
+            foodSelection.set('budget', budgetCheckboxKey(checkbox), true);
+        }
+        checkbox.addEventListener('change', () => {
+            foodSelection.set('budget', budgetCheckboxKey(checkbox), checkbox.checked);
+            foodFilterRuns.request();
+        });
+    });
+    
+    // Radius filter
+    const radiusFilter = document.getElementById('radius-filter');
+    if (Array.from(radiusFilter.options).some(option => option.value === saved.fields.radius)) {
+        radiusFilter.value = foodSelection.fields.radius = saved.fields.radius;
+    }
+    radiusFilter.addEventListener('change', () => {
+        foodSelection.fields.radius = radiusFilter.value;
+        foodFilterRuns.request();
+    });
+    
+    // Search box, as the user types
+    const searchInput = document.getElementById('search-input');
+    searchInput.value = foodSelection.text = saved.text;
+    searchInput.addEventListener('input', () => {
+        foodSelection.text = searchInput.value;
+        foodFilterRuns.request();
     });
     
     // Clear filters button
@@ -258,10 +302,13 @@ function setupFilterListeners() {
         // Uncheck all checkboxes
         cuisineCheckboxes.forEach(cb => cb.checked = false);
         budgetCheckboxes.forEach(cb => cb.checked = false);
+        radiusFilter.value = '';
+        searchInput.value = '';
+        foodSelection.clear();
+        nearbyMode = false;
         
         // Show all food places
-        displayFoodPlaces(allFoodPlaces);
-        updateResultsCount(allFoodPlaces.length, allFoodPlaces.length);
+        foodFilterRuns.request();
     });
     
     // Show nearby button
@@ -269,130 +316,140 @@ function setupFilterListeners() {
     nearbyButton.addEventListener('click', showNearbyPlaces);
 }
 
-// Filter food places based on selected criteria
-function filterFoodPlaces() {
-    const selectedCuisines = [];
-    const selectedBudgets = [];
-    
-    // Get selected cuisine types
-    document.querySelectorAll('.cuisine-checkbox:checked').forEach(checkbox => {
-        selectedCuisines.push(checkbox.dataset.cuisine);
+// One bitset per cuisine and budget option (see facet-engine.js)
+function createFoodFacets(foodPlaces, classification) {
+    return new FacetEngine(foodPlaces, {
+        cuisine: classification.options.map(cuisine => ({
+            value: cuisine,
+            test: place => classification.matches(place.place_type, cuisine)
+        })),
+        budget: FOOD_BUDGET_RANGES.map(range => ({
+            value: `${range.min}-${range.max}`,
+            test: place => place.budget >= range.min && place.budget <= range.max
+        }))
     });
+}
+
+function budgetCheckboxKey(checkbox) {
+    return `${checkbox.dataset.minBudget}-${checkbox.dataset.maxBudget}`;
+}
+
+// Filter food places based on selected criteria, in the filter worker once
+// there is one
+function filterFoodPlaces() {
+    foodSelection.writeUrl();
+    const selection = foodSelection.toQuery();
+    const text = foodSelection.text;
     
-    // Get selected budget ranges
-    document.querySelectorAll('.budget-checkbox:checked').forEach(checkbox => {
-        selectedBudgets.push({
-            min: parseInt(checkbox.dataset.minBudget),
-            max: parseInt(checkbox.dataset.maxBudget)
-        });
-    });
+    // Rank by distance when "Show Nearby" or a radius is active
+    const radiusKm = foodSelection.fields.radius ? parseFloat(foodSelection.fields.radius) : Infinity;
+    const nearest = userLat !== null && (nearbyMode || radiusKm !== Infinity) ? {
+        lat: userLat,
+        lon: userLon,
+        k: radiusKm === Infinity ? window.CityQuestConfig.nearbyCount : Infinity,
+        maxKm: radiusKm
+    } : null;
     
-    let filteredPlaces = allFoodPlaces;
+    // A combination shown before, with the same data, is shown again as is;
+    // nearby rankings depend on the user's position and aren't kept
+    foodResults.setVersion(`${foodFacets.version}:${foodSearch ? 1 : 0}`);
+    const key = foodSelection.key();
+    const cached = nearest ? undefined : foodResults.get(key);
+    if (cached) {
+        if (foodFilter) foodFilter.cancel();
+        updateFoodOptionCounts(cached.counts);
+        displayFoodPlaces(cached.places);
+        updateResultsCount(cached.places.length, allFoodPlaces.length);
+        return;
+    }
     
-    // Filter by cuisine
-    if (selectedCuisines.length > 0) {
-        const cuisineGroupings = {
-            'Biryani & Hyderabadi': [
-                'Hyderabadi Biryani', 'Hyderabadi', 'Hyderabadi / Mughlai', 'Hyderabadi / Irani cafe', 
-                'Hyderabadi / Barbecue', 'Biryani / North Indian', 'Fine Dining - Hyderabadi',
-                'Fine Dining - Awadhi / Hyderabadi'
-            ],
-            'Street Food - Chaat': [
-                'Street Food / Chaat', 'Street Food / Hyderabadi'
-            ],
-            'Street Food - Quick Bites': [
-                'Street Food', 'Street Food / Non-veg', 'Street Food / Arabian'
-            ],
-            'Chai & Snacks': [
-                'Street Food / Tea Stall', 'Street Food / Cafe', 'Irani Cafe / Street Food',
-                'Juice Center / Snacks'
-            ],
-            'Bakery & Sweets': [
-                'Street Food / Bakery', 'Street Food / Middle Eastern', 'Casual dining / Sweets & Snacks',
-                'Casual Dining / Sweets & Snacks'
-            ],
-            'Food Streets': [
-                'Street Food / Food Street'
-            ],
-            'South Indian': [
-                'South Indian', 'Andhra / Spicy cuisine', 'Andhra / Traditional Thali', 
-                'Chettinad / South Indian', 'South Indian / Vegetarian'
-            ],
-            'North Indian & Mughlai': [
-                'North Indian', 'Mughlai / Barbecue', 'North West Frontier', 
-                'Fine Dining - North West Frontier', 'Vegetarian / North Indian'
-            ],
-            'Fine Dining': [
-                'Fine dining / Multi-cuisine', 'Fine Dining - Indian', 'Multi-cuisine / Lounge'
-            ],
-            'Cafes & Bakeries': [
-                'Cafe / Bakery', 'Bakery / Confectionery', 'Bakery / Hyderabadi sweets',
-                'Restaurant - Multi-cuisine / Bakery'
-            ],
-            'Vegetarian': [
-                'Vegetarian / Gujarati', 'Restaurant - Vegetarian / North Indian',
-                'Restaurant - South Indian / Vegetarian'
-            ],
-            'Buffet & BBQ': [
-                'Buffet / Barbecue', 'Restaurant - Mughlai / Barbecue'
-            ],
-            'Multi-Cuisine': [
-                'Multi-cuisine', 'Restaurant - Multi-cuisine'
-            ]
-        };
-        
-        filteredPlaces = filteredPlaces.filter(place => {
-            const placeType = place.place_type.replace('Restaurant - ', '').trim();
-            
-            return selectedCuisines.some(selectedCuisine => {
-                if (cuisineGroupings[selectedCuisine]) {
-                    return cuisineGroupings[selectedCuisine].some(groupType => 
-                        placeType === groupType || 
-                        placeType.includes(groupType) || 
-                        groupType.includes(placeType)
-                    );
-                } else {
-                    return placeType.includes(selectedCuisine) || selectedCuisine.includes(placeType);
-                }
-            });
+    if (foodFilter && !foodFilter.failed) {
+        const started = performance.now();
+        const version = foodResults.version;
+        foodFilter.query({ selection, text, nearest }).then(result => {
+            if (!result) return;
+            updateFoodOptionCounts(result.counts);
+            const places = Array.from(result.positions, i => allFoodPlaces[i]);
+            if (!nearest) {
+                foodResults.set(key, { places, counts: result.counts }, version);
+                displayFoodPlaces(places);
+                updateResultsCount(places.length, allFoodPlaces.length);
+                return;
+            }
+            const km = new Map(places.map((place, i) => [place, result.km[i]]));
+            showNearbyResults(places, km, result.examined, started);
         });
+        return;
     }
     
-    // Filter by budget
-    if (selectedBudgets.length > 0) {
-        filteredPlaces = filteredPlaces.filter(place => {
-            return selectedBudgets.some(budget => 
-                place.max_budget_for_one >= budget.min && place.max_budget_for_one <= budget.max
-            );
-        });
+    // Search results, best first, narrow the checkbox filters and their
+    // counts. The first search waits for the index to arrive.
+    if (foodSearches.pending(text)) return;
+    const ranked = foodSearch ? foodSearch.search(text) : null;
+    const { matches, bits, counts } = foodFacets.query(selection, ranked ? foodFacets.bitsOf(ranked) : undefined);
+    const filteredPlaces = ranked ? foodFacets.recordsAt(ranked, bits) : matches;
+    updateFoodOptionCounts(counts);
+    
+    if (nearest) {
+        displayNearbyPlaces(filteredPlaces, nearest);
+        return;
     }
     
     // Display filtered results
+    foodResults.set(key, { places: filteredPlaces, counts });
     displayFoodPlaces(filteredPlaces);
     updateResultsCount(filteredPlaces.length, allFoodPlaces.length);
 }
 
-// Show nearby places (basic implementation)
+function updateFoodOptionCounts(counts) {
+    updateOptionCounts(document.querySelectorAll('.cuisine-checkbox'), counts.cuisine, cb => cb.dataset.cuisine);
+    updateOptionCounts(document.querySelectorAll('.budget-checkbox'), counts.budget, budgetCheckboxKey);
+}
+
+// Show the places from `candidates` nearest to the user, nearest first: all
+// of them within `radiusKm`, or the nearest CityQuestConfig.nearbyCount.
+// The spatial grid only looks at cells around the user.
+function displayNearbyPlaces(candidates, { lat, lon, k, maxKm }) {
+    const started = performance.now();
+    const allowed = candidates.length === allFoodPlaces.length ? null : new Set(candidates);
+    const nearby = foodGrid.nearest(lat, lon, {
+        k,
+        maxKm,
+        accept: place => allowed === null || allowed.has(place)
+    });
+    
+    const places = nearby.map(result => result.item);
+    showNearbyResults(places, new Map(nearby.map(result => [result.item, result.km])), foodGrid.lastExamined, started);
+}
+
+// Show places ranked nearest first, with their distances
+function showNearbyResults(places, km, examined, started) {
+    displayFoodPlaces(places, km);
+    publishAppEvent('nearby-ranked', {
+        count: places.length,
+        examined,
+        elapsedMs: performance.now() - started
+    });
+    updateResultsCount(places.length, allFoodPlaces.length);
+}
+
+// Show nearby places, nearest first, within the selected radius
 function showNearbyPlaces() {
-    if (!userLat || !userLon) {
-        alert('Please allow location access to find nearby places!');
+    if (userLat === null || userLon === null) {
+        showLocationNotice(document.querySelector('.filter-count'), 'missing');
         return;
     }
     
-    // For now, just show a message. In a real app, you'd calculate distances
-    alert('Finding nearby places... (This would calculate distances to food places based on your location)');
-    
-    // You could implement distance calculation here similar to the tourist places page
-    // For demonstration, let's just show the first 10 places
-    const nearbyPlaces = allFoodPlaces.slice(0, 10);
-    displayFoodPlaces(nearbyPlaces);
-    updateResultsCount(nearbyPlaces.length, allFoodPlaces.length);
+    nearbyMode = true;
+    foodFilterRuns.request();
 }
 
 // Update results count display
 function updateResultsCount(filtered, total) {
     const countElement = document.getElementById('results-count');
     countElement.textContent = `Showing ${filtered} of ${total} food places`;
+    foodFilterRuns.rendered();
+    publishAppEvent('filters-applied', { count: filtered, total });
 }
 
 // Load food places when page loads
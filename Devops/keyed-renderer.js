@@ -0,0 +1,103 @@
+// Keyed renderer - build each card once, then only show, hide and reorder
+//
+// A filter change used to clear the results container and rebuild every
+// card from a template string. KeyedRenderer keeps each item's node by key:
+// render(items) attaches the nodes for `items` in order, moving only the
+// ones that are out of place, and detaches the rest without destroying
+// them. Clicks are handled by one delegated listener per container.
+
+class KeyedRenderer {
+    // options:
+    //   key(item)           stable id of an item
+    //   create(item)        its node, called once per key
+    //   update(node, item)  optional, refreshes parts that change (distances)
+    //   emptyMessage        shown when render() gets no items
+    constructor(container, { key, create, update = null, emptyMessage = '' }) {
+        this.container = container;
+        this.key = key;
+        this.create = create;
+        this.update = update;
+        this.nodes = new Map();  // key -> node
+        this.items = new Map();  // key -> item
+        this.created = 0;        // nodes built so far, for benchmarks
+
+        this.empty = document.createElement('p');
+        this.empty.className = 'no-results';
+        this.empty.textContent = emptyMessage;
+        container.innerHTML = '';
+    }
+
+    // Node for an item, building it on first use
+    nodeFor(item) {
+        const key = this.key(item);
+        let node = this.nodes.get(key);
+        if (!node) {
+            node = this.create(item);
+            node.dataset.key = key;
+            this.nodes.set(key, node);
+            this.items.set(key, item);
+            this.created++;
+        }
+        return node;
+    }
+
+    // Already built node for `key`, shown or not (undefined if never built)
+    existingNode(key) {
+        return this.nodes.get(key);
+    }
+
+    // The item a node inside the container belongs to
+    itemFor(element) {
+        const node = element.closest('[data-key]');
+        return node && this.container.contains(node) ? this.items.get(node.dataset.key) : undefined;
+    }
+
+    render(items) {
+        const wanted = items.length ? items.map(item => {
+            const node = this.nodeFor(item);
+            if (this.update) this.update(node, item);
+            return node;
+        }) : [this.empty];
+
+        // Walk the attached nodes once: drop the unwanted ones, keep the ones
+        // already in place and insert the rest before the cursor
+        const keep = new Set(wanted);
+        let cursor = this.container.firstChild;
+        const skipUnwanted = () => {
+            while (cursor && !keep.has(cursor)) {
+                const next = cursor.nextSibling;
+                this.container.removeChild(cursor);
+                cursor = next;
+            }
+        };
+        wanted.forEach(node => {
+            skipUnwanted();
+            if (node === cursor) {
+                cursor = cursor.nextSibling;
+            } else {
+                this.container.insertBefore(node, cursor);
+            }
+        });
+        while (cursor) {
+            const next = cursor.nextSibling;
+            this.container.removeChild(cursor);
+            cursor = next;
+        }
+    }
+
+    // One listener for the whole container: handler(item, event, node) runs
+    // when a `type` event (one that bubbles) lands inside an element
+    // matching `selector`
+    on(type, selector, handler) {
+        this.container.addEventListener(type, event => {
+            const target = event.target.closest(selector);
+            if (!target || !this.container.contains(target)) return;
+            const item = this.itemFor(target);
+            if (item !== undefined) handler(item, event, target);
+        });
+    }
+
+    onClick(selector, handler) {
+        this.on('click', selector, handler);
+    }
+}
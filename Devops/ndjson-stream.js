@@ -0,0 +1,41 @@
+// Newline-delimited JSON streaming - use records before the whole file is in
+//
+// The build publishes the lists both pages load as .ndjson as well, one
+// JSON value per line (see cityquest/build). streamNdjson() reads the
+// response body as the network delivers it and hands over the complete
+// lines of each chunk, so the first screen of cards can be drawn while the
+// rest of the file is still downloading.
+
+// Calls `onBatch(values)` with the parsed values of each chunk's complete
+// lines, in file order, and waits for it before reading on. Resolves with
+// the number of values read.
+async function streamNdjson(url, onBatch) {
+    const response = await fetch(url);
+    if (!response.ok) throw new Error(`${url}: HTTP ${response.status}`);
+
+    let count = 0;
+    const deliver = async lines => {
+        const values = lines.filter(line => line.trim()).map(line => JSON.parse(line));
+        if (values.length === 0) return;
+        count += values.length;
+        await onBatch(values);
+    };
+
+    // No streaming body: hand everything over in one batch
+    if (!response.body || !response.body.getReader) {
+        await deliver((await response.text()).split('\n'));
+        return count;
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let pending = '';  // a line cut off at the end of the last chunk
+    for (;;) {
+        const { done, value } = await reader.read();
+        pending += decoder.decode(value, { stream: !done });
+        const lines = pending.split('\n');
+        pending = done ? '' : lines.pop();
+        await deliver(lines);
+        if (done) return count;
+    }
+}
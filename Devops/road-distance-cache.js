@@ -0,0 +1,80 @@
+// Road distance cache - shared by "Get Distance" and "Show Nearest"
+//
+// Entries are keyed on the user's position snapped to a grid cell, the
+// destination id and the travel mode, so small GPS jitter or a reload in the
+// same neighbourhood reuses earlier routing answers. The cache is a bounded
+// LRU in memory, mirrored to localStorage, and entries expire after a TTL.
+
+class RoadDistanceCache {
+    constructor({ gridDegrees, maxEntries, ttlMs, storageKey = 'cityQuestRoadDistances' }) {
+        this.gridDegrees = gridDegrees;
+        this.maxEntries = maxEntries;
+        this.ttlMs = ttlMs;
+        this.storageKey = storageKey;
+        this.entries = new Map(); // key -> { km, storedAt }, oldest first
+        this.stats = { hits: 0, misses: 0 };
+        this.load();
+    }
+
+    key(userLat, userLon, destinationId, mode = 'driving') {
+        const cellLat = Math.round(userLat / this.gridDegrees);
+        const cellLon = Math.round(userLon / this.gridDegrees);
+        return `${cellLat}:${cellLon}|${destinationId}|${mode}`;
+    }
+
+    get(userLat, userLon, destinationId, mode) {
+        const key = this.key(userLat, userLon, destinationId, mode);
+        const entry = this.entries.get(key);
+        if (!entry || Date.now() - entry.storedAt > this.ttlMs) {
+            if (entry) this.entries.delete(key);
+            this.stats.misses++;
+            return undefined;
+        }
+        // Move to the most recently used end
+        this.entries.delete(key);
+        this.entries.set(key, entry);
+        this.stats.hits++;
+        return entry.km;
+    }
+
+    set(userLat, userLon, destinationId, km, mode) {
+        if (typeof km !== 'number') return;
+        const key = this.key(userLat, userLon, destinationId, mode);
+        this.entries.delete(key);
+        this.entries.set(key, { km, storedAt: Date.now() });
+        while (this.entries.size > this.maxEntries) {
+            this.entries.delete(this.entries.keys().next().value);
+        }
+        this.schedulePersist();
+    }
+
+    load() {
+        try {
+            const saved = JSON.parse(localStorage.getItem(this.storageKey) || '[]');
+            const now = Date.now();
+            saved
+                .filter(([, entry]) => typeof entry.km === 'number' && now - entry.storedAt <= this.ttlMs)
+                .slice(-this.maxEntries)
+                .forEach(([key, entry]) => this.entries.set(key, entry));
+        } catch (err) {
+            console.error('Error loading road distance cache:', err);
+        }
+    }
+
+    // Coalesce bursts of set() calls into one localStorage write
+    schedulePersist() {
+        if (this.persistTimer) return;
+        this.persistTimer = setTimeout(() => {
+            this.persistTimer = null;
+            this.persist();
+        }, 0);
+    }
+
+    persist() {
+        try {
+            localStorage.setItem(this.storageKey, JSON.stringify(Array.from(this.entries)));
+        } catch (err) {
+            console.error('Error saving road distance cache:', err);
+        }
+    }
+}
@@ -1,11 +1,11 @@
 // Fetch road distance from OSRM
 async function getRoadDistance(userLat, userLon, destLat, destLon) {
-    const url = `https://router.project-osrm.org/route/v1/driving/${userLon},${userLat};${destLon},${destLat}?overview=false`;
+    const url = `${window.CityQuestConfig.routingBaseUrl}/route/v1/driving/${userLon},${userLat};${destLon},${destLat}?overview=false`;
     try {
         const response = await fetch(url);
         const data = await response.json();
         if (data.routes && data.routes.length > 0) {
-            return (data.routes[0].distance / 1000).toFixed(2); // km
+            return data.routes[0].distance / 1000; // km
         }
         return "N/A";
     } catch (err) {
@@ -14,111 +14,219 @@ async function getRoadDistance(userLat, userLon, destLat, destLon) {
     }
 }
 
-// Display destinations as cards
-function displayDestinations(destinations, userLat = null, userLon = null) {
-    const container = document.getElementById('destinations-container');
-    container.innerHTML = '';
+// Fetch road distances from the user to many destinations with a single
+// OSRM table request. Returns an array of km numbers (or "N/A") in the same
+// order as `destinations`, or null if the routing service can't do tables.
+async function getRoadDistanceTable(userLat, userLon, destinations) {
+    const coordinates = [`${userLon},${userLat}`]
+        .concat(destinations.map(dest => `${dest.longitude},${dest.latitude}`))
+        .join(';');
+    const url = `${window.CityQuestConfig.routingBaseUrl}/table/v1/driving/${coordinates}?sources=0&annotations=distance`;
+    try {
+        const response = await fetch(url);
+        if (!response.ok) return null;
+        const data = await response.json();
+        if (data.code !== 'Ok' || !data.distances) return null;
+        return data.distances[0].slice(1).map(meters => meters === null ? "N/A" : meters / 1000);
+    } catch (err) {
+        console.error('Error fetching road distance table:', err);
+        return null;
+    }
+}
+
+// Run `task` over `items` with at most `limit` tasks in flight
+async function mapWithConcurrency(items, limit, task) {
+    let next = 0;
+    const workers = Array.from({ length: Math.min(limit, items.length) }, async () => {
+        while (next < items.length) {
+            const index = next++;
+            await task(items[index], index);
+        }
+    });
+    await Promise.all(workers);
+}
 
-    if (destinations.length === 0) {
-        container.innerHTML = '<p class="no-results">No destinations found matching the selected filters.</p>';
+// Road distances already fetched, reused across clicks and visits
+window.roadDistanceCache = new RoadDistanceCache({
+    gridDegrees: window.CityQuestConfig.distanceCacheGridDegrees,
+    maxEntries: window.CityQuestConfig.distanceCacheMaxEntries,
+    ttlMs: window.CityQuestConfig.distanceCacheTtlMs
+});
+
+// Refine distances to `destinations` with road distances, calling
+// onDistance(destination, km) as each one arrives. Cached distances are
+// answered straight away; the rest use one table request, or bounded
+// concurrent route requests if the endpoint has no table support.
+async function refineRoadDistances(userLat, userLon, destinations, onDistance) {
+    const cache = window.roadDistanceCache;
+    const uncached = [];
+    destinations.forEach(dest => {
+        const km = cache.get(userLat, userLon, dest.id);
+        if (km !== undefined) {
+            onDistance(dest, km);
+        } else {
+            uncached.push(dest);
+        }
+    });
+    if (uncached.length === 0) return;
+
+    const remember = (dest, km) => {
+        cache.set(userLat, userLon, dest.id, km);
+        onDistance(dest, km);
+    };
+    const table = await getRoadDistanceTable(userLat, userLon, uncached);
+    if (table) {
+        uncached.forEach((dest, i) => remember(dest, table[i]));
         return;
     }
+    await mapWithConcurrency(uncached, window.CityQuestConfig.routingConcurrency, async dest => {
+        remember(dest, await getRoadDistance(userLat, userLon, dest.latitude, dest.longitude));
+    });
+}
 
-    destinations.forEach(destination => {
-        const destDiv = document.createElement('div');
-        destDiv.className = 'destination-card';
-        destDiv.id = `dest-${destination.name.replace(/\s+/g,'')}`;
+// Distances are kept as numbers (km) and only formatted for display
+function formatDistance(km) {
+    return typeof km === 'number' ? km.toFixed(2) + ' km' : 'N/A';
+}
 
-        const distanceText = destination.user_distance ? destination.user_distance + ' km' : 'N/A';
-        destDiv.innerHTML = `
-            <h3 class="destination-name">${destination.name}</h3>
-            <div class="destination-info">
-                <p class="place-type"><strong>Type:</strong> ${destination.place_type}</p>
-                <p class="distance"><strong>Distance from you:</strong> <span class="distance-value">${distanceText}</span></p>
-                <p class="ideal-for"><strong>Ideal for:</strong> ${destination.ideal_for}</p>
-                <p class="timings"><strong>Timings:</strong> ${destination.timings}</p>
-                <p class="entry-fee"><strong>Entry Fee:</strong> ${destination.entry_fee}</p>
-            </div>
-            <div class="description">
-                <p>${destination.description.substring(0, 200)}${destination.description.length > 200 ? '...' : ''}</p>
-            </div>
-            ${destination.food_places_near && destination.food_places_near.length > 0 ? `
+// Update the distance shown on an already built card, shown or not
+function updateCardDistance(destination) {
+    const card = window.destinationCards.existingNode(destination.id);
+    if (card) {
+        const text = formatDistance(destination.user_distance);
+        const value = card.querySelector('.distance-value');
+        if (value.textContent !== text) value.textContent = text;
+    }
+}
+
+// Food places near a destination, from the build-time spatial join (the
+// nearby_food rows of its details). Falls back to the hand-written
+// food_places_near names if the join found none.
+function renderNearbyFood(details) {
+    let items;
+    if (details.nearby_food && details.nearby_food.length > 0) {
+        items = details.nearby_food.map(([name, budget, group, km]) =>
+            `<li><span class="nearby-food-name">${name}</span>`
+            + `<span class="nearby-food-meta">${km.toFixed(2)} km · ₹${budget} · ${group}</span></li>`);
+    } else {
+        items = (details.food_places_near || []).map(place => `<li>${place}</li>`);
+    }
+    if (items.length === 0) return '';
+    return `
                 <div class="food-places">
                     <h4>🍽️ Food Places Nearby:</h4>
                     <ul>
-                        ${destination.food_places_near.map(place => `<li>${place}</li>`).join('')}
+                        ${items.join('')}
                     </ul>
-                </div>` : ''}
-            <button class="calc-distance-btn">Get Distance</button>
-        `;
+                </div>`;
+}
 
-        // Toggle expanded card on click
-        destDiv.addEventListener('click', (e) => {
-            if(!e.target.classList.contains('calc-distance-btn')) {
-                destDiv.classList.toggle('expanded');
-            }
-        });
+// What an expanded card shows below the list fields
+function renderDestinationDetails(details) {
+    return `
+            <div class="destination-info">
+                <p class="ideal-for"><strong>Ideal for:</strong> ${details.ideal_for}</p>
+                <p class="timings"><strong>Timings:</strong> ${details.timings}</p>
+            </div>
+            <div class="description">
+                <p>${details.description}</p>
+            </div>
+            ${renderNearbyFood(details)}`;
+}
 
-        // Button to calculate distance individually
-        const btn = destDiv.querySelector('.calc-distance-btn');
-        btn.addEventListener('click', async () => {
-            if(userLat && userLon && destination.latitude && destination.longitude) {
-                btn.disabled = true;
-                btn.textContent = 'Calculating...';
-                const dist = await getRoadDistance(userLat, userLon, destination.latitude, destination.longitude);
-                destination.user_distance = dist;
-                destDiv.querySelector('.distance-value').textContent = dist + ' km';
-                btn.textContent = 'Get Distance';
-                btn.disabled = false;
-            }
-        });
+// Fill in a card's details the first time it is expanded
+async function showDestinationDetails(destination, card) {
+    const section = card.querySelector('.destination-details');
+    if (section.dataset.loaded) return;
+    try {
+        const details = await window.destinationDetails.get(destination.position);
+        if (section.dataset.loaded) return;
+        section.innerHTML = renderDestinationDetails(details);
+        section.dataset.loaded = 'true';
+        publishAppEvent('details-loaded', { id: destination.id });
+    } catch (err) {
+        console.error('Error loading destination details:', err);
+        section.innerHTML = '<p class="details-status">Could not load the details. Expand the card again to retry.</p>';
+    }
+}
 
-        container.appendChild(destDiv);
+// Destination cards, built once per destination and windowed for large
+// result sets (see keyed-renderer.js and windowed-grid.js)
+function createDestinationRenderer() {
+    const renderer = new WindowedGrid(document.getElementById('destinations-container'), {
+        key: destination => destination.id,
+        create: createDestinationCard,
+        update: (card, destination) => {
+            const text = formatDistance(destination.user_distance);
+            const value = card.querySelector('.distance-value');
+            if (value.textContent !== text) value.textContent = text;
+        },
+        emptyMessage: 'No destinations found matching the selected filters.',
+        threshold: window.CityQuestConfig.windowedGridThreshold,
+        overscanPx: window.CityQuestConfig.windowedGridOverscanPx
     });
-}
 
-// Extract unique types and create filter checkboxes
-function createFilterOptions(destinations) {
-    const uniqueTypes = new Set();
-    
-    // Define type groupings to reduce clutter
-    const typeGroupings = {
-        'Parks': ['Amusement Park', 'Amusement & Water Park', 'Amusement & Theme Park', 'Winter Park', 'Zoological Park', 'Botanical Garden', 'Park', 'Lake Front & Park'],
-        'Heritage': ['Heritage', 'Monument', 'Fort', 'Palace', 'Tomb'],
-        'Museums': ['Museum', 'Art', 'Antiques'],
-        'Religious': ['Hindu Temple'],
-        'Entertainment': ['Film Studio', 'Planetarium', 'Space Shows'],
-        'Nature': ['Lake Front', 'Scenic Drive'],
-        'Shopping': ['Shopping'],
-        'Hotels': ['Hotel']
-    };
-    
-    destinations.forEach(dest => {
-        if(dest.place_type) {
-            const types = dest.place_type.split(',').map(t => t.trim());
-            types.forEach(type => {
-                // Check if this type should be grouped
-                let grouped = false;
-                for (const [groupName, groupTypes] of Object.entries(typeGroupings)) {
-                    if (groupTypes.includes(type)) {
-                        uniqueTypes.add(groupName);
-                        grouped = true;
-                        break;
-                    }
-                }
-                // If not grouped, add the original type
-                if (!grouped) {
-                    uniqueTypes.add(type);
-                }
+    // Toggle expanded card on click, loading its details the first time
+    renderer.onClick('.destination-card', (destination, event, card) => {
+        if (!event.target.closest('.calc-distance-btn')) {
+            if (card.classList.toggle('expanded')) showDestinationDetails(destination, card);
+        }
+    });
+
+    // Hovering a card is a good hint it is about to be expanded
+    renderer.on('mouseover', '.destination-card', destination => {
+        window.destinationDetails.get(destination.position).catch(() => {});
+    });
+
+    // Button to calculate distance individually
+    renderer.onClick('.calc-distance-btn', async (destination, event, btn) => {
+        const userLat = window.userLat, userLon = window.userLon;
+        if (userLat && userLon && destination.latitude && destination.longitude) {
+            btn.disabled = true;
+            btn.textContent = 'Calculating...';
+            await refineRoadDistances(userLat, userLon, [destination], (dest, dist) => {
+                destination.user_distance = dist;
+                destinationDistancesChanged([destination]);
+                updateCardDistance(destination);
             });
+            btn.textContent = 'Get Distance';
+            btn.disabled = false;
         }
     });
+    return renderer;
+}
+
+function createDestinationCard(destination) {
+    const destDiv = document.createElement('div');
+    destDiv.className = 'destination-card';
+    destDiv.id = `dest-${destination.id}`;
+
+    destDiv.innerHTML = `
+            <h3 class="destination-name">${destination.name}</h3>
+            <div class="destination-info">
+                <p class="place-type"><strong>Type:</strong> ${destination.place_type}</p>
+                <p class="distance"><strong>Distance from you:</strong> <span class="distance-value">${formatDistance(destination.user_distance)}</span></p>
+                <p class="entry-fee"><strong>Entry Fee:</strong> ${destination.entry_fee}</p>
+            </div>
+            <div class="destination-details">
+                <p class="details-status">Loading details...</p>
+            </div>
+            <button class="calc-distance-btn">Get Distance</button>
+        `;
+    return destDiv;
+}
+
+// Display destinations as cards, in the given order
+function displayDestinations(destinations) {
+    window.destinationCards.render(destinations);
+}
 
-    const sortedTypes = Array.from(uniqueTypes).sort();
+// Create type filter checkboxes from the classification table
+function createFilterOptions(classification) {
     const filterContainer = document.getElementById('filter-options');
     filterContainer.innerHTML = '';
 
-    sortedTypes.forEach(type => {
+    classification.options.forEach(type => {
         const label = document.createElement('label');
         label.className = 'filter-label';
         const checkbox = document.createElement('input');
@@ -133,21 +241,55 @@ function createFilterOptions(destinations) {
     });
 }
 
-// Create budget filter options
-function createBudgetFilterOptions(destinations) {
-    const budgetRanges = [
-        { label: 'Free', min: 0, max: 0 },
-        { label: 'Under ₹50', min: 1, max: 50 },
-        { label: '₹50 - ₹200', min: 50, max: 200 },
-        { label: '₹200 - ₹500', min: 200, max: 500 },
-        { label: '₹500 - ₹1000', min: 500, max: 1000 },
-        { label: 'Above ₹1000', min: 1000, max: Infinity }
-    ];
+// Budget and distance filter ranges (inclusive)
+const BUDGET_RANGES = [
+    { label: 'Free', min: 0, max: 0 },
+    { label: 'Under ₹50', min: 1, max: 50 },
+    { label: '₹50 - ₹200', min: 50, max: 200 },
+    { label: '₹200 - ₹500', min: 200, max: 500 },
+    { label: '₹500 - ₹1000', min: 500, max: 1000 },
+    { label: 'Above ₹1000', min: 1000, max: Infinity }
+];
+
+const DISTANCE_RANGES = [
+    { label: 'Within 5 km', min: 0, max: 5 },
+    { label: '5 - 10 km', min: 5, max: 10 },
+    { label: '10 - 20 km', min: 10, max: 20 },
+    { label: '20 - 50 km', min: 20, max: 50 },
+    { label: 'Above 50 km', min: 50, max: Infinity }
+];
+
+// The filters as the user set them, one filter run per burst of input
+// (see filter-scheduler.js) and the results of recent runs
+// (see filter-result-cache.js)
+window.destinationSelection = new FilterSelection(['type', 'budget', 'distance']);
+window.destinationFilterRuns = new FilterScheduler(filterDestinations, {
+    idleMs: window.CityQuestConfig.filterIdleMs
+});
+window.destinationResults = new FilterResultCache({
+    maxEntries: window.CityQuestConfig.filterCacheEntries
+});
+// The search index is fetched on the first search (see search-index.js)
+window.destinationSearches = new SearchIndexLoader('destinations', index => {
+    window.destinationSearch = index;
+    window.destinationFilterRuns.request();
+});
+
+// Facet option value of a range, and of the checkbox created for it
+function rangeKey(range) {
+    return `${range.min}-${range.max}`;
+}
 
+function checkboxRangeKey(checkbox) {
+    return `${checkbox.dataset.min}-${checkbox.dataset.max}`;
+}
+
+// Create budget filter options
+function createBudgetFilterOptions() {
     const filterContainer = document.getElementById('budget-filter-options');
     filterContainer.innerHTML = '';
 
-    budgetRanges.forEach(range => {
+    BUDGET_RANGES.forEach(range => {
         const label = document.createElement('label');
         label.className = 'filter-label';
         const checkbox = document.createElement('input');
@@ -163,32 +305,12 @@ function createBudgetFilterOptions(destinations) {
     });
 }
 
-// Extract numeric value from entry fee string
-function extractEntryFee(entryFeeString) {
-    if (!entryFeeString) return null;
-    
-    // Handle "Free" entries
-    if (entryFeeString.toLowerCase().includes('free')) return 0;
-    
-    // Extract first numeric value (usually for Indians/Adults)
-    const match = entryFeeString.match(/₹(\d+)/);
-    return match ? parseInt(match[1]) : null;
-}
-
 // Create distance filter options
 function createDistanceFilterOptions() {
-    const distanceRanges = [
-        { label: 'Within 5 km', min: 0, max: 5 },
-        { label: '5 - 10 km', min: 5, max: 10 },
-        { label: '10 - 20 km', min: 10, max: 20 },
-        { label: '20 - 50 km', min: 20, max: 50 },
-        { label: 'Above 50 km', min: 50, max: Infinity }
-    ];
-
     const filterContainer = document.getElementById('distance-filter-options');
     filterContainer.innerHTML = '';
 
-    distanceRanges.forEach(range => {
+    DISTANCE_RANGES.forEach(range => {
         const label = document.createElement('label');
         label.className = 'filter-label';
         const checkbox = document.createElement('input');
@@ -204,89 +326,83 @@ function createDistanceFilterOptions() {
     });
 }
 
-// Filter destinations
+// One bitset per type, budget and distance option (see facet-engine.js)
+function createDestinationFacets(destinations, classification) {
+    return new FacetEngine(destinations, {
+        type: classification.options.map(type => ({
+            value: type,
+            test: dest => classification.matches(dest.place_type, type)
+        })),
+        budget: BUDGET_RANGES.map(range => ({
+            value: rangeKey(range),
+            test: dest => dest.fee >= range.min && dest.fee <= range.max
+        })),
+        distance: DISTANCE_RANGES.map(range => ({
+            value: rangeKey(range),
+            test: dest => typeof dest.user_distance === 'number' &&
+                dest.user_distance >= range.min && dest.user_distance <= range.max
+        }))
+    });
+}
+
+// Filter destinations, in the filter worker once there is one
 function filterDestinations() {
-    const selectedTypes = Array.from(document.querySelectorAll('.filter-checkbox:checked')).map(cb => cb.dataset.type);
-    const selectedBudgetRanges = Array.from(document.querySelectorAll('.budget-filter-checkbox:checked')).map(cb => ({
-        min: parseInt(cb.dataset.min),
-        max: parseInt(cb.dataset.max)
-    }));
-    const selectedDistanceRanges = Array.from(document.querySelectorAll('.distance-filter-checkbox:checked')).map(cb => ({
-        min: parseInt(cb.dataset.min),
-        max: parseInt(cb.dataset.max)
-    }));
-
-    let filtered;
-    if(selectedTypes.length === 0 && selectedBudgetRanges.length === 0 && selectedDistanceRanges.length === 0) {
-        filtered = window.allDestinations;
-    } else {
-        // Define type groupings (same as in createFilterOptions)
-        const typeGroupings = {
-            'Parks': ['Amusement Park', 'Amusement & Water Park', 'Amusement & Theme Park', 'Winter Park', 'Zoological Park', 'Botanical Garden', 'Park', 'Lake Front & Park'],
-            'Heritage': ['Heritage', 'Monument', 'Fort', 'Palace', 'Tomb'],
-            'Museums': ['Museum', 'Art', 'Antiques'],
-            'Religious': ['Hindu Temple'],
-            'Entertainment': ['Film Studio', 'Planetarium', 'Space Shows'],
-            'Nature': ['Lake Front', 'Scenic Drive'],
-            'Shopping': ['Shopping'],
-            'Hotels': ['Hotel']
-        };
-        
-        filtered = window.allDestinations.filter(dest => {
-            // Type filter
-            let typeMatch = selectedTypes.length === 0; // If no types selected, pass type filter
-            if (selectedTypes.length > 0 && dest.place_type) {
-                const types = dest.place_type.split(',').map(t => t.trim());
-                
-                typeMatch = selectedTypes.some(selectedType => {
-                    // If the selected type is a group, check if any destination type belongs to that group
-                    if (typeGroupings[selectedType]) {
-                        return types.some(destType => 
-                            typeGroupings[selectedType].includes(destType)
-                        );
-                    } else {
-                        // If it's not a group, check direct match
-                        return types.includes(selectedType);
-                    }
-                });
-            }
-            
-            // Budget filter
-            let budgetMatch = selectedBudgetRanges.length === 0; // If no budget selected, pass budget filter
-            if (selectedBudgetRanges.length > 0) {
-                const entryFee = extractEntryFee(dest.entry_fee);
-                if (entryFee !== null) {
-                    budgetMatch = selectedBudgetRanges.some(range => {
-                        if (range.max === Infinity) {
-                            return entryFee >= range.min;
-                        } else {
-                            return entryFee >= range.min && entryFee <= range.max;
-                        }
-                    });
-                }
-            }
-            
-            // Distance filter
-            let distanceMatch = selectedDistanceRanges.length === 0; // If no distance selected, pass distance filter
-            if (selectedDistanceRanges.length > 0 && dest.user_distance && dest.user_distance !== "N/A") {
-                const distance = parseFloat(dest.user_distance);
-                if (!isNaN(distance)) {
-                    distanceMatch = selectedDistanceRanges.some(range => {
-                        if (range.max === Infinity) {
-                            return distance >= range.min;
-                        } else {
-                            return distance >= range.min && distance <= range.max;
-                        }
-                    });
-                }
-            }
-            
-            return typeMatch && budgetMatch && distanceMatch;
+    window.destinationSelection.writeUrl();
+    const selection = window.destinationSelection.toQuery();
+    const text = window.destinationSelection.text;
+
+    // A combination shown before, with the same data, is shown again as is
+    const facets = window.destinationFacets;
+    const search = window.destinationSearch;
+    const results = window.destinationResults;
+    results.setVersion(`${facets.version}:${search ? 1 : 0}`);
+    const key = window.destinationSelection.key();
+    const cached = results.get(key);
+    if (cached) {
+        if (window.destinationFilter) window.destinationFilter.cancel();
+        showFilteredDestinations(cached.shown, cached.counts);
+        return;
+    }
+
+    const worker = window.destinationFilter;
+    if (worker && !worker.failed) {
+        const version = results.version;
+        worker.query({ selection, text }).then(result => {
+            if (!result) return;
+            const shown = Array.from(result.positions, i => window.allDestinations[i]);
+            results.set(key, { shown, counts: result.counts }, version);
+            showFilteredDestinations(shown, result.counts);
         });
+        return;
     }
 
-    displayDestinations(filtered, window.userLat, window.userLon);
-    updateFilterCount(filtered.length, window.allDestinations.length);
+    // Search results, best first, narrow the checkbox filters and their
+    // counts. The first search waits for the index to arrive.
+    if (window.destinationSearches.pending(text)) return;
+    const ranked = search ? search.search(text) : null;
+    const { matches, bits, counts } = facets.query(selection, ranked ? facets.bitsOf(ranked) : undefined);
+    const shown = ranked ? facets.recordsAt(ranked, bits) : matches;
+    results.set(key, { shown, counts });
+    showFilteredDestinations(shown, counts);
+}
+
+// Show filtered destinations and the option counts that go with them
+function showFilteredDestinations(shown, counts) {
+    displayDestinations(shown);
+    updateOptionCounts(document.querySelectorAll('.filter-checkbox'), counts.type, cb => cb.dataset.type);
+    updateOptionCounts(document.querySelectorAll('.budget-filter-checkbox'), counts.budget, checkboxRangeKey);
+    updateOptionCounts(document.querySelectorAll('.distance-filter-checkbox'), counts.distance, checkboxRangeKey);
+    updateFilterCount(shown.length, window.allDestinations.length);
+}
+
+// Some destinations' distances changed: rebuild the distance facet, here
+// and in the filter worker
+function destinationDistancesChanged(destinations) {
+    window.destinationFacets.invalidate('distance');
+    if (window.destinationFilter) {
+        window.destinationFilter.setDistances(destinations.map(dest => dest.position),
+            destinations.map(dest => typeof dest.user_distance === 'number' ? dest.user_distance : NaN));
+    }
 }
 
 // Filter count display
@@ -299,18 +415,44 @@ function updateFilterCount(filtered, total) {
         filterContainer.appendChild(countDisplay);
     }
     countDisplay.textContent = `Showing ${filtered} of ${total} destinations`;
+    window.destinationFilterRuns.rendered();
+    publishAppEvent('filters-applied', { count: filtered, total });
 }
 
 // Setup filter listeners
+// Inputs only update window.destinationSelection and request a filter run.
+// They start out as the query string says, for the options that exist.
 function setupFilterListeners() {
+    const selection = window.destinationSelection;
+    const runs = window.destinationFilterRuns;
+    const saved = new FilterSelection(Object.keys(selection.values));
+    saved.readQueryString(location.search);
+    const listen = (checkboxes, facet, valueOf) => checkboxes.forEach(cb => {
+        if (saved.has(facet, valueOf(cb))) {
+            cb.checked = true;
+            selection.set(facet, valueOf(cb), true);
+        }
+        cb.addEventListener('change', () => {
+            selection.set(facet, valueOf(cb), cb.checked);
+            runs.request();
+        });
+    });
+
     const filterCheckboxes = document.querySelectorAll('.filter-checkbox');
-    filterCheckboxes.forEach(cb => cb.addEventListener('change', filterDestinations));
+    listen(filterCheckboxes, 'type', cb => cb.dataset.type);
     
     const budgetFilterCheckboxes = document.querySelectorAll('.budget-filter-checkbox');
-    budgetFilterCheckboxes.forEach(cb => cb.addEventListener('change', filterDestinations));
+    listen(budgetFilterCheckboxes, 'budget', checkboxRangeKey);
     
     const distanceFilterCheckboxes = document.querySelectorAll('.distance-filter-checkbox');
-    distanceFilterCheckboxes.forEach(cb => cb.addEventListener('change', filterDestinations));
+    listen(distanceFilterCheckboxes, 'distance', checkboxRangeKey);
+
+    const searchInput = document.getElementById('search-input');
+    searchInput.value = selection.text = saved.text;
+    searchInput.addEventListener('input', () => {
+        selection.text = searchInput.value;
+        runs.request();
+    });
 
     const clearButton = document.getElementById('clear-filters');
     if(clearButton) {
@@ -318,87 +460,246 @@ function setupFilterListeners() {
             filterCheckboxes.forEach(cb => cb.checked = false);
             budgetFilterCheckboxes.forEach(cb => cb.checked = false);
             distanceFilterCheckboxes.forEach(cb => cb.checked = false);
-            displayDestinations(window.allDestinations, window.userLat, window.userLon);
+            searchInput.value = '';
+            selection.clear();
+            runs.request();
         });
     }
 }
 
-// Sort by nearest (top 5)
-// Optimized: Fetch top 5 nearest places faster using parallel requests
+// Sort by nearest (top N, see CityQuestConfig.nearestCount)
 function getHaversine(lat1, lon1, lat2, lon2) {
   const R = 6371;
   const dLat = (lat2 - lat1) * Math.PI / 180;
   const dLon = (lon2 - lon1) * Math.PI / 180;
   const a = Math.sin(dLat/2)**2 + Math.cos(lat1*Math.PI/180) * Math.cos(lat2*Math.PI/180) * Math.sin(dLon/2)**2;
-  return (R * 2 * Math.atan2(Math.sqrt(a), Math.sqrt(1 - a))).toFixed(2);
+  return R * 2 * Math.atan2(Math.sqrt(a), Math.sqrt(1 - a));
+}
+
+// Steps 1 and 2 of "Show Nearest": the top N destinations by straight-line
+// distance from (lat, lon), from the spatial grid (in the worker once there
+// is one), so only the places around the user are looked at. Only their
+// distances change; callers pass them on with destinationDistancesChanged().
+// Returns { nearest, examined }: the destinations, nearest first, and how
+// many distances the grid computed to find them. The page's own grid answers
+// when there is no worker or it gave no answer (it failed or was cancelled).
+async function rankNearest(lat, lon) {
+  const k = window.CityQuestConfig.nearestCount;
+  const worker = window.destinationFilter;
+  const located = worker && !worker.failed ? await worker.locate(lat, lon, k) : null;
+  let positions, km, examined;
+  if (located) {
+    ({ positions, km, examined } = located);
+  } else {
+    const found = window.destinationGrid.nearest(lat, lon, { k });
+    positions = found.map(result => result.item.position);
+    km = found.map(result => result.km);
+    examined = window.destinationGrid.lastExamined;
+  }
+  const nearest = Array.from(positions, (position, i) => {
+    const dest = window.allDestinations[position];
+    dest.user_distance = km[i];
+    return dest;
+  });
+  return { nearest, examined };
 }
 
 async function showNearestPlaces() {
   if(!window.userLat || !window.userLon) {
-    alert("Please allow location access first.");
+    showLocationNotice(document.getElementById('filter-container'), 'missing');
     return;
   }
 
+  const started = performance.now();
   const spinner = document.getElementById('loading-spinner');
   spinner.style.display = 'block';
 
-  // Step 1: local distance estimation
-  window.allDestinations.forEach(dest => {
-    if(dest.latitude && dest.longitude) {
-      dest.user_distance = getHaversine(window.userLat, window.userLon, dest.latitude, dest.longitude);
-    }
-  });
+  try {
+    const { nearest, examined } = await rankNearest(window.userLat, window.userLon);
+    displayDestinations(nearest);
+    publishAppEvent('nearest-ranked', { count: nearest.length, examined, elapsedMs: performance.now() - started });
+
+    // Step 3: refine them with road distances, updating the cards in place
+    await refineRoadDistances(window.userLat, window.userLon, nearest, (dest, distance) => {
+      dest.user_distance = distance;
+      updateCardDistance(dest);
+    });
+    destinationDistancesChanged(nearest);
+    publishAppEvent('nearest-refined', { count: nearest.length, elapsedMs: performance.now() - started });
+  } finally {
+    spinner.style.display = 'none';
+  }
+}
+
+// "Follow Me": the nearest places, re-ranked as the user walks. The
+// PositionWatcher only calls this after a move of
+// CityQuestConfig.liveMoveThresholdMeters and never twice at once. Only the
+// cards whose rank changed are moved (none if the ranking is the same) and
+// only distances that changed are redrawn. Road distances come from the
+// cache where the user's grid cell has been routed before.
+async function updateLiveNearest(lat, lon) {
+  const started = performance.now();
+  const previous = window.liveNearestRanking || [];
+  window.userLat = lat;
+  window.userLon = lon;
+
+  const { nearest, examined } = await rankNearest(lat, lon);
+  const changed = nearest.filter((dest, i) => previous[i] !== dest).length;
+  if (changed > 0 || nearest.length !== previous.length) {
+    displayDestinations(nearest);
+  } else {
+    nearest.forEach(updateCardDistance);
+  }
+  window.liveNearestRanking = nearest;
 
-  // Step 2: sort by approximate distance and pick top 5
-  const top5 = window.allDestinations
-    .filter(d => d.user_distance !== "N/A")
-    .sort((a,b) => parseFloat(a.user_distance) - parseFloat(b.user_distance))
-    .slice(0,5);
+  const cache = window.roadDistanceCache;
+  const misses = cache.stats.misses;
+  await refineRoadDistances(lat, lon, nearest, (dest, distance) => {
+    dest.user_distance = distance;
+    updateCardDistance(dest);
+  });
+  destinationDistancesChanged(nearest);
+
+  publishAppEvent('nearest-updated', {
+    count: nearest.length,
+    changed,
+    examined,
+    routed: cache.stats.misses - misses,
+    elapsedMs: performance.now() - started
+  });
+}
 
-  // Step 3: refine these 5 with OSRM
-  for (const dest of top5) {
-    dest.user_distance = await getRoadDistance(window.userLat, window.userLon, dest.latitude, dest.longitude);
-    await new Promise(r => setTimeout(r, 500)); // light delay
+// Start or stop following the user (see PositionWatcher in user-location.js)
+function toggleLiveNearest(button) {
+  const notices = document.getElementById('filter-container');
+  if (!navigator.geolocation) {
+    showLocationNotice(notices, 'unsupported');
+    return;
   }
+  if (!window.liveNearest) {
+    window.liveNearest = new PositionWatcher(updateLiveNearest, {
+      thresholdMeters: window.CityQuestConfig.liveMoveThresholdMeters,
+      onError: () => showLocationNotice(notices, 'missing')
+    });
+  }
+  const following = !window.liveNearest.active;
+  if (following) {
+    window.liveNearestRanking = [];
+    window.liveNearest.start();
+  } else {
+    window.liveNearest.stop();
+    // Re-ranking only touched the nearest places; bring the rest up to
+    // date with where the user stopped, once, for the distance filters
+    if (window.userLat && window.userLon) {
+      setStraightLineDistances(window.userLat, window.userLon, new Set(window.liveNearestRanking));
+    }
+  }
+  button.textContent = following ? 'Stop Following' : 'Follow Me';
+  button.setAttribute('aria-pressed', String(following));
+}
 
-  displayDestinations(top5, window.userLat, window.userLon);
-  spinner.style.display = 'none';
+// Large datasets filter and rank in a worker (see filter-client.js)
+async function startDestinationWorker() {
+    const destinations = window.allDestinations;
+    if (destinations.length <= window.CityQuestConfig.filterWorkerThreshold) return;
+    const version = window.destinationFacets.version;
+    const worker = await FilterClient.start({
+        records: destinations,
+        engine: window.destinationFacets,
+        facets: ['type', 'budget'],
+        distanceRanges: DISTANCE_RANGES.map(range => ({ value: rangeKey(range), min: range.min, max: range.max })),
+        searchPage: 'destinations'
+    });
+    if (!worker) return;
+    window.destinationFilter = worker;
+    // Distances filled in while the worker was starting
+    if (window.destinationFacets.version !== version) destinationDistancesChanged(destinations);
+    publishAppEvent('filter-worker-ready', { count: destinations.length });
 }
 
-// Load destinations
+// Straight-line distance from (lat, lon) to every destination not in `skip`
+function setStraightLineDistances(lat, lon, skip = new Set()) {
+    const changed = window.allDestinations.filter(dest => {
+        if (skip.has(dest) || !dest.latitude || !dest.longitude) return false;
+        dest.user_distance = getHaversine(lat, lon, dest.latitude, dest.longitude);
+        return true;
+    });
+    destinationDistancesChanged(changed);
+}
+
+// Once the location is known, fill in every destination's straight-line
+// distance: the distance filters get their counts and the cards their
+// distances, in place. Without one, say so next to the filters.
+function applyUserLocation(located) {
+    if (located.granted) {
+        window.userLat = located.latitude;
+        window.userLon = located.longitude;
+        setStraightLineDistances(window.userLat, window.userLon);
+        window.destinationFilterRuns.request();
+    } else {
+        showLocationNotice(document.getElementById('filter-container'), located.reason);
+    }
+    publishAppEvent('location-resolved', located);
+}
+
+// Load destinations, streaming the list: the first cards are drawn as soon
+// as the first rows arrive and the rest are added as they come in
 async function loadDestinations() {
     try {
-        const response = await fetch('data.json');
-        const destinations = await response.json();
-        window.allDestinations = destinations;
-
-        createFilterOptions(destinations);
-        createBudgetFilterOptions(destinations);
-        createDistanceFilterOptions();
-
-        if(navigator.geolocation) {
-            navigator.geolocation.getCurrentPosition(pos => {
-                window.userLat = pos.coords.latitude;
-                window.userLon = pos.coords.longitude;
-                displayDestinations(destinations, window.userLat, window.userLon);
-                setupFilterListeners();
-            }, err => {
-                alert("Location permission denied. Distances will not be available.");
-                displayDestinations(destinations);
+        const baseUrl = window.CityQuestConfig.dataBaseUrl;
+        // Asked for now, used once every destination is in (see user-location.js)
+        const userLocation = locateUser();
+        const classification = loadClassification('destinations');
+        classification.catch(() => {});  // reported when the first batch awaits it
+        window.allDestinations = [];
+        window.destinationGrid = new SpatialGrid([], { cellDegrees: window.CityQuestConfig.nearbyGridCellDegrees });
+
+        let fields = null;
+        let refresh = 0;
+        const count = await streamNdjson(`${baseUrl}/destinations-list.ndjson`, async values => {
+            if (!fields) {
+                const header = values.shift();
+                fields = header.fields;
+                window.destinationDetails = new DetailChunks(`${baseUrl}/destination-details`, header.chunkSize);
+                const table = await classification;
+                createFilterOptions(table);
+                createBudgetFilterOptions();
+                createDistanceFilterOptions();
+                window.destinationFacets = createDestinationFacets(window.allDestinations, table);
+                window.destinationCards = createDestinationRenderer();
                 setupFilterListeners();
-            });
-        } else {
-            alert("Geolocation not supported.");
-            displayDestinations(destinations);
-            setupFilterListeners();
-        }
+            }
+            if (values.length === 0) return;
+
+            const start = window.allDestinations.length;
+            const records = values.map((row, i) => listRecord(fields, row, start + i));
+            window.destinationFacets.append(records);
+            records.forEach(record => window.destinationGrid.insert(record));
+            if (start === 0) {
+                window.destinationFilterRuns.flush();
+                publishAppEvent('first-cards', { count: values.length });
+            } else if (!refresh) {
+                // At most one re-filter per frame while rows keep arriving
+                refresh = requestAnimationFrame(() => {
+                    refresh = 0;
+                    window.destinationFilterRuns.flush();
+                });
+            }
+        });
+        if (!fields) throw new Error('Empty destination list');
+        cancelAnimationFrame(refresh);
+        window.destinationFilterRuns.flush();
+        publishAppEvent('data-loaded', { count: count - 1 });
+        startDestinationWorker();
+
+        userLocation.then(applyUserLocation);
 
         // Optional: Add nearest filter button dynamically
         const filterContainer = document.getElementById('filter-container');
 
         const nearestBtn = document.createElement('button');
         nearestBtn.id='find-nearby-btn'
-        nearestBtn.textContent = 'Show Nearest 5 Places';
+        nearestBtn.textContent = `Show Nearest ${window.CityQuestConfig.nearestCount} Places`;
         nearestBtn.style.background = '#007bff';
         nearestBtn.style.color = 'white';
         nearestBtn.style.border = 'none';
@@ -409,6 +710,14 @@ async function loadDestinations() {
         nearestBtn.addEventListener('click', showNearestPlaces);
         filterContainer.appendChild(nearestBtn);
 
+        const liveBtn = document.createElement('button');
+        liveBtn.id = 'live-nearest-btn';
+        liveBtn.className = 'live-nearest-btn';
+        liveBtn.textContent = 'Follow Me';
+        liveBtn.setAttribute('aria-pressed', 'false');
+        liveBtn.addEventListener('click', () => toggleLiveNearest(liveBtn));
+        filterContainer.appendChild(liveBtn);
+
     } catch(err) {
         console.error('Error loading destinations:', err);
         document.getElementById('destinations-container').innerHTML =
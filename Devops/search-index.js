@@ -0,0 +1,147 @@
+// Search index - ranked full-text and prefix search as the user types
+//
+// generated/search-index-<page>.json is built by `python -m cityquest.build`
+// (cityquest/search.py holds the same algorithm in Python). Terms are
+// sorted, so the terms starting with what the user has typed so far are one
+// contiguous run found by binary search, and their postings sit next to
+// each other in one typed array.
+//
+// A page fetches its index only once there is something to search for (see
+// SearchIndexLoader), so visitors who never search never download it.
+
+function tokenize(text) {
+    return text.normalize('NFKD').toLowerCase().replace(/[\u0300-\u036f]/g, '')
+        .split(/[^a-z0-9]+/).filter(Boolean);
+}
+
+class SearchIndex {
+    // section: { terms: [...], counts: [...], postings: [record, weight, ...] }
+    constructor(section) {
+        this.terms = section.terms;
+        this.postings = Int32Array.from(section.postings);
+        this.offsets = new Int32Array(this.terms.length + 1);
+        section.counts.forEach((count, i) => { this.offsets[i + 1] = this.offsets[i] + count; });
+
+        // Scratch space reused by every query, one slot per indexed record
+        let recordCount = 0;
+        for (let i = 0; i < this.postings.length; i += 2) recordCount = Math.max(recordCount, this.postings[i] + 1);
+        this.recordCount = recordCount;
+        this.scores = new Int32Array(recordCount);
+        this.best = new Int32Array(recordCount);
+        this.matched = new Uint16Array(recordCount); // query words matched so far
+        this.touched = new Int32Array(recordCount);
+        this.lastText = null;
+        this.lastResult = null;
+    }
+
+    // First term index whose term is >= `text`
+    lowerBound(text) {
+        let low = 0, high = this.terms.length;
+        while (low < high) {
+            const mid = (low + high) >>> 1;
+            if (this.terms[mid] < text) low = mid + 1; else high = mid;
+        }
+        return low;
+    }
+
+    // Record positions matching every word of `text`, best first, or null
+    // when `text` has no words. Each word matches the terms it is a prefix
+    // of (exact terms count double); ties keep dataset order.
+    search(text) {
+        if (text === this.lastText) return this.lastResult;
+        const tokens = tokenize(text);
+        let touchedCount = 0;  // records the first word matched
+        tokens.forEach((token, round) => {
+            const start = this.lowerBound(token);
+            const end = this.lowerBound(token + '\uffff');
+            for (let t = start; t < end; t++) {
+                const boost = this.terms[t] === token ? 2 : 1;
+                for (let i = this.offsets[t] * 2; i < this.offsets[t + 1] * 2; i += 2) {
+                    const record = this.postings[i];
+                    if (this.matched[record] !== round) continue;
+                    if (round === 0 && this.best[record] === 0) this.touched[touchedCount++] = record;
+                    this.best[record] = Math.max(this.best[record], this.postings[i + 1] * boost);
+                }
+            }
+            for (let i = 0; i < touchedCount; i++) {
+                const record = this.touched[i];
+                if (this.best[record] > 0) {
+                    this.scores[record] += this.best[record];
+                    this.best[record] = 0;
+                    this.matched[record] = round + 1;
+                }
+            }
+        });
+
+        let result = null;
+        if (tokens.length > 0) {
+            // Counting sort on the (small, integer) scores, walking records
+            // in dataset order so ties keep it. Much cheaper than a
+            // comparison sort when the first keystroke matches most records.
+            let maxScore = 0;
+            for (let i = 0; i < touchedCount; i++) {
+                const record = this.touched[i];
+                if (this.matched[record] === tokens.length) maxScore = Math.max(maxScore, this.scores[record]);
+            }
+            const starts = new Int32Array(maxScore + 2);
+            for (let record = 0; record < this.recordCount; record++) {
+                if (this.matched[record] === tokens.length) starts[maxScore - this.scores[record] + 1]++;
+            }
+            for (let i = 1; i < starts.length; i++) starts[i] += starts[i - 1];
+            result = new Int32Array(starts[starts.length - 1]);
+            for (let record = 0; record < this.recordCount; record++) {
+                if (this.matched[record] === tokens.length) result[starts[maxScore - this.scores[record]]++] = record;
+            }
+        }
+
+        // Reset the scratch space for the next query
+        for (let i = 0; i < touchedCount; i++) {
+            this.scores[this.touched[i]] = 0;
+            this.matched[this.touched[i]] = 0;
+        }
+        this.lastText = text;
+        this.lastResult = result;
+        return result;
+    }
+}
+
+// URL of one page's index ('destinations' or 'food')
+function searchIndexUrl(page) {
+    return new URL(`${window.CityQuestConfig.dataBaseUrl}/search-index-${page}.json`, location.href).href;
+}
+
+// Fetch one page's index
+async function loadSearchIndex(page) {
+    const response = await fetch(searchIndexUrl(page));
+    return new SearchIndex(await response.json());
+}
+
+// Fetches a page's index the first time there is text to search for and
+// calls onLoad(index) once it is in
+class SearchIndexLoader {
+    constructor(page, onLoad) {
+        this.page = page;
+        this.onLoad = onLoad;
+        this.index = null;
+        this.loading = null;
+        this.failed = false;
+    }
+
+    // Must a search for `text` wait for the index? True while it is on its
+    // way (the first call starts fetching it); false once it is in, if it
+    // failed to load, or if `text` has nothing to search for.
+    pending(text) {
+        if (this.index || this.failed || tokenize(text).length === 0) return false;
+        if (!this.loading) {
+            this.loading = loadSearchIndex(this.page).then(index => {
+                this.index = index;
+                this.onLoad(index);
+            }, err => {
+                console.error('Error loading the search index:', err);
+                this.failed = true;
+                this.onLoad(null);
+            });
+        }
+        return true;
+    }
+}
@@ -0,0 +1,147 @@
+// Spatial grid index - nearest-first lookups without scanning every place
+//
+// Places are bucketed once into square lat/lon cells. A query walks outward
+// from the user's cell ring by ring and stops as soon as no unvisited cell
+// can hold anything closer than what it already found, so it only ever
+// looks at the places around the user.
+
+const EARTH_RADIUS_KM = 6371;
+const KM_PER_DEGREE = Math.PI * EARTH_RADIUS_KM / 180;
+
+function haversineKm(lat1, lon1, lat2, lon2) {
+    const dLat = (lat2 - lat1) * Math.PI / 180;
+    const dLon = (lon2 - lon1) * Math.PI / 180;
+    const a = Math.sin(dLat/2)**2 + Math.cos(lat1*Math.PI/180) * Math.cos(lat2*Math.PI/180) * Math.sin(dLon/2)**2;
+    return EARTH_RADIUS_KM * 2 * Math.atan2(Math.sqrt(a), Math.sqrt(1 - a));
+}
+
+class SpatialGrid {
+    constructor(items, { cellDegrees = 0.01 } = {}) {
+        this.cellDegrees = cellDegrees;
+        this.cells = new Map(); // "row:col" -> { row, col, items } for the occupied cells
+        this.size = 0;
+        this.lastExamined = 0;  // places whose distance the last query computed
+        this.lastCells = 0;     // cells the last query looked in, empty ones included
+        this.minRow = this.maxRow = this.minCol = this.maxCol = 0;
+        items.forEach(item => this.insert(item));
+    }
+
+    insert(item) {
+        if (typeof item.latitude !== 'number' || typeof item.longitude !== 'number') return;
+        const row = Math.floor(item.latitude / this.cellDegrees);
+        const col = Math.floor(item.longitude / this.cellDegrees);
+        const key = `${row}:${col}`;
+        if (!this.cells.has(key)) this.cells.set(key, { row, col, items: [] });
+        this.cells.get(key).items.push(item);
+
+        if (this.size === 0) {
+            this.minRow = this.maxRow = row;
+            this.minCol = this.maxCol = col;
+        } else {
+            this.minRow = Math.min(this.minRow, row);
+            this.maxRow = Math.max(this.maxRow, row);
+            this.minCol = Math.min(this.minCol, col);
+            this.maxCol = Math.max(this.maxCol, col);
+        }
+        this.size++;
+    }
+
+    // Up to `k` places nearest to (lat, lon), nearest first, as
+    // [{ item, km }]. `maxKm` limits the search radius and `accept(item)`
+    // skips places that don't match the current filters.
+    //
+    // Rings are only walked while the user is inside the box around the
+    // occupied cells, and only where they overlap it. From outside the box,
+    // or once walking the next ring would look in more cells than are
+    // occupied, the occupied cells left are visited nearest-first instead,
+    // so a user far from every place costs about one pass over the
+    // occupied cells rather than one per empty cell in between.
+    nearest(lat, lon, { k = Infinity, maxKm = Infinity, accept = () => true } = {}) {
+        const found = [];
+        this.lastExamined = 0;
+        this.lastCells = 0;
+        if (this.size === 0) return found;
+
+        const row = Math.floor(lat / this.cellDegrees);
+        const col = Math.floor(lon / this.cellDegrees);
+        // Longitude degrees shrink away from the equator; use the narrowest
+        // latitude the search could reach (the user's or the places') so
+        // the distance bound stays safe
+        const widestLat = Math.max(Math.abs(lat), Math.abs(this.minRow * this.cellDegrees),
+            Math.abs((this.maxRow + 1) * this.cellDegrees));
+        const cosLat = Math.cos(Math.min(89, widestLat + 1) * Math.PI / 180);
+        const cellKm = this.cellDegrees * KM_PER_DEGREE * cosLat;
+        const insideBox = row >= this.minRow && row <= this.maxRow && col >= this.minCol && col <= this.maxCol;
+        const lastRing = Math.max(
+            Math.abs(row - this.minRow), Math.abs(row - this.maxRow),
+            Math.abs(col - this.minCol), Math.abs(col - this.maxCol)
+        );
+
+        // Can nothing at least `boundKm` away beat what was found?
+        const settled = boundKm => boundKm > maxKm || (found.length >= k && found[k - 1].km <= boundKm);
+        const visit = cell => cell.items.forEach(item => {
+            this.lastExamined++;
+            const km = haversineKm(lat, lon, item.latitude, item.longitude);
+            if (km <= maxKm && accept(item)) found.push({ item, km });
+        });
+
+        let ring = 0;
+        for (; insideBox && ring <= lastRing && this.lastCells + this.ringCells(row, col, ring) <= this.cells.size; ring++) {
+            // Everything outside rings 0..ring-1 is at least this far away
+            if (settled(Math.max(0, ring - 1) * cellKm)) return found.slice(0, k);
+            this.forEachInRing(row, col, ring, visit);
+            found.sort((a, b) => a.km - b.km);
+        }
+        if (ring > lastRing) return found.slice(0, k);
+
+        // No place in a cell is more than a cell side from its centre, so
+        // the centre's distance less that side bounds the whole cell
+        const sideKm = this.cellDegrees * KM_PER_DEGREE;
+        const remaining = [];
+        this.cells.forEach(cell => {
+            if (Math.max(Math.abs(cell.row - row), Math.abs(cell.col - col)) < ring) return;
+            const centreKm = haversineKm(lat, lon,
+                (cell.row + 0.5) * this.cellDegrees, (cell.col + 0.5) * this.cellDegrees);
+            remaining.push({ boundKm: Math.max(0, centreKm - sideKm), cell });
+        });
+        this.lastCells += this.cells.size;
+        remaining.sort((a, b) => a.boundKm - b.boundKm);
+        for (const { boundKm, cell } of remaining) {
+            if (settled(boundKm)) break;
+            visit(cell);
+            found.sort((a, b) => a.km - b.km);
+        }
+        return found.slice(0, k);
+    }
+
+    // Cells of `ring` around (row, col) inside the occupied box, which is
+    // how many a walk of it looks in
+    ringCells(row, col, ring) {
+        const inBox = (value, min, max) => (value >= min && value <= max ? 1 : 0);
+        const span = Math.max(0, Math.min(col + ring, this.maxCol) - Math.max(col - ring, this.minCol) + 1);
+        if (ring === 0) return inBox(row, this.minRow, this.maxRow) * span;
+        const sides = inBox(col - ring, this.minCol, this.maxCol) + inBox(col + ring, this.minCol, this.maxCol);
+        const middleRows = Math.max(0, Math.min(row + ring - 1, this.maxRow) - Math.max(row - ring + 1, this.minRow) + 1);
+        return (inBox(row - ring, this.minRow, this.maxRow) + inBox(row + ring, this.minRow, this.maxRow)) * span
+            + middleRows * sides;
+    }
+
+    forEachInRing(row, col, ring, visit) {
+        const look = (r, c) => {
+            this.lastCells++;
+            const cell = this.cells.get(`${r}:${c}`);
+            if (cell) visit(cell);
+        };
+        const firstCol = Math.max(col - ring, this.minCol);
+        const lastCol = Math.min(col + ring, this.maxCol);
+        if (firstCol > lastCol) return;
+        for (let r = Math.max(row - ring, this.minRow); r <= Math.min(row + ring, this.maxRow); r++) {
+            if (r === row - ring || r === row + ring) {
+                for (let c = firstCol; c <= lastCol; c++) look(r, c);
+            } else {
+                if (firstCol === col - ring) look(r, firstCol);
+                if (lastCol === col + ring) look(r, lastCol);
+            }
+        }
+    }
+}
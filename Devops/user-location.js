@@ -0,0 +1,115 @@
+// User location - shared by the tourist places and food places pages
+//
+// The location is asked for as the page starts loading but nothing waits
+// for it: cards are drawn and filters work without one, and distances are
+// filled in whenever it arrives. locateUser() never rejects. A denial, an
+// error or no answer within CityQuestConfig.locationTimeoutMs (an
+// unanswered permission prompt included) all resolve to { granted: false }
+// and are reported with a note next to the filters, never an alert().
+//
+// For a live view, a PositionWatcher follows the user and reports only moves
+// that matter.
+
+function locateUser(timeoutMs = window.CityQuestConfig.locationTimeoutMs) {
+    return new Promise(resolve => {
+        if (!navigator.geolocation) {
+            resolve({ granted: false, reason: 'unsupported' });
+            return;
+        }
+        const timer = setTimeout(() => resolve({ granted: false, reason: 'timeout' }), timeoutMs);
+        navigator.geolocation.getCurrentPosition(position => {
+            clearTimeout(timer);
+            resolve({ granted: true, latitude: position.coords.latitude, longitude: position.coords.longitude });
+        }, error => {
+            clearTimeout(timer);
+            resolve({ granted: false, reason: error.code === error.PERMISSION_DENIED ? 'denied' : 'unavailable' });
+        }, { timeout: timeoutMs });
+    });
+}
+
+const LOCATION_NOTICES = {
+    denied: 'Location access is off, so distances are not shown.',
+    unavailable: 'Your location could not be found, so distances are not shown.',
+    timeout: 'Your location is taking too long, so distances are not shown.',
+    unsupported: 'This browser cannot share your location, so distances are not shown.',
+    missing: 'Allow location access to see the places nearest to you.'
+};
+
+// Show (or replace) a short note about the location at the end of `container`
+function showLocationNotice(container, reason) {
+    let notice = container.querySelector('.location-notice');
+    if (!notice) {
+        notice = document.createElement('p');
+        notice.className = 'location-notice';
+        notice.setAttribute('role', 'status');
+        container.appendChild(notice);
+    }
+    notice.textContent = LOCATION_NOTICES[reason];
+}
+
+// Metres between two nearby points (equirectangular, plenty for the few
+// hundred metres a movement threshold deals in)
+function metersBetween(lat1, lon1, lat2, lon2) {
+    const toRad = Math.PI / 180;
+    const x = (lon2 - lon1) * toRad * Math.cos((lat1 + lat2) / 2 * toRad);
+    const y = (lat2 - lat1) * toRad;
+    return Math.hypot(x, y) * 6371000;
+}
+
+// Follows the user with watchPosition and calls onMove(lat, lon) for the
+// first position and then only once they are `thresholdMeters` from where
+// it last fired. It never runs onMove twice at once: positions arriving
+// meanwhile are collapsed into the latest, looked at when the call ends.
+// So however often the browser reports, the work per update is bounded.
+// stats counts the positions received and the moves reported.
+class PositionWatcher {
+    constructor(onMove, { thresholdMeters, onError = () => {} }) {
+        this.onMove = onMove;
+        this.onError = onError;
+        this.thresholdMeters = thresholdMeters;
+        this.watchId = null;
+        this.anchor = null;   // where onMove last fired
+        this.latest = null;   // position waiting for a running onMove
+        this.running = false;
+        this.stats = { positions: 0, moves: 0 };
+    }
+
+    get active() {
+        return this.watchId !== null;
+    }
+
+    start() {
+        if (this.active) return;
+        this.watchId = navigator.geolocation.watchPosition(position => {
+            this.stats.positions++;
+            this.latest = { lat: position.coords.latitude, lon: position.coords.longitude };
+            this.consider();
+        }, error => this.onError(error), { enableHighAccuracy: true });
+    }
+
+    stop() {
+        if (!this.active) return;
+        navigator.geolocation.clearWatch(this.watchId);
+        this.watchId = null;
+        this.anchor = null;
+        this.latest = null;
+    }
+
+    async consider() {
+        if (this.running || !this.latest) return;
+        const { lat, lon } = this.latest;
+        this.latest = null;
+        if (this.anchor && metersBetween(this.anchor.lat, this.anchor.lon, lat, lon) < this.thresholdMeters) return;
+        this.anchor = { lat, lon };
+        this.stats.moves++;
+        this.running = true;
+        try {
+            await this.onMove(lat, lon);
+        } catch (err) {
+            console.error('Error updating for a new position:', err);
+        } finally {
+            this.running = false;
+        }
+        if (this.active) this.consider();
+    }
+}
@@ -0,0 +1,194 @@
+// Windowed card grid - only the cards near the viewport are in the page
+//
+// A KeyedRenderer that, once it is given more than `threshold` items, only
+// attaches the grid rows overlapping the viewport (plus `overscanPx` above
+// and below). The container's padding stands in for the rows above and
+// below the window, so the page keeps its full scroll height. Row heights
+// are measured as rows are shown (a ResizeObserver catches cards expanding
+// or collapsing) and estimated from the rows seen so far until then.
+// Smaller result sets are rendered in full, exactly like KeyedRenderer.
+// Detached cards are kept for reuse up to `maxCachedCards`, oldest dropped
+// first, so scrolling through a huge result set doesn't keep every card.
+
+class WindowedGrid extends KeyedRenderer {
+    // Extra options: threshold, overscanPx, estimatedRowHeight, maxCachedCards
+    constructor(container, options) {
+        super(container, options);
+        this.threshold = options.threshold ?? Infinity;
+        this.overscanPx = options.overscanPx ?? 800;
+        this.estimatedRowHeight = options.estimatedRowHeight ?? 400;
+        this.maxCachedCards = options.maxCachedCards ?? 2000;
+
+        this.shown = [];            // every item of the last render() call
+        this.windowed = false;
+        this.heights = new Map();   // key -> measured height of its row, gap included
+        this.measuredTotal = 0;     // sum of this.heights, for the estimate
+        this.columns = 1;
+        this.rowTops = new Float64Array(1);  // rows + 1 entries
+        this.firstRow = 0;          // rows attached: [firstRow, lastRow)
+        this.lastRow = 0;
+        this.layoutStale = true;
+        this.frame = 0;
+
+        this.resizeObserver = new ResizeObserver(() => this.measure());
+        window.addEventListener('scroll', () => this.schedule(), { passive: true });
+        window.addEventListener('resize', () => {
+            this.layoutStale = true;
+            this.schedule();
+        });
+        WindowedGrid.grids.set(container, this);
+    }
+
+    // The grid rendering into `container`, if any (used by the test helpers)
+    static of(container) {
+        return WindowedGrid.grids.get(container);
+    }
+
+    nodeFor(item) {
+        const isNew = !this.nodes.has(this.key(item));
+        const node = super.nodeFor(item);
+        if (isNew) this.resizeObserver.observe(node);
+        return node;
+    }
+
+    render(items) {
+        this.shown = items;
+        if (items.length <= this.threshold) {
+            this.windowed = false;
+            this.container.style.paddingTop = this.container.style.paddingBottom = '';
+            this.container.style.overflowAnchor = '';
+            super.render(items);
+            return;
+        }
+        if (!this.windowed) {
+            this.windowed = true;
+            this.container.style.paddingTop = this.container.style.paddingBottom = '';
+            // The padding already keeps the content in place; letting the
+            // browser anchor the scroll position too makes it jump
+            this.container.style.overflowAnchor = 'none';
+            const style = getComputedStyle(this.container);
+            this.basePadding = [parseFloat(style.paddingTop), parseFloat(style.paddingBottom)];
+        }
+        this.layoutStale = true;
+        this.updateWindow(true);
+    }
+
+    // Recompute columns and row offsets for this.shown
+    layout() {
+        const style = getComputedStyle(this.container);
+        this.columns = Math.max(1, style.gridTemplateColumns.split(' ').length);
+        this.rowGap = parseFloat(style.rowGap) || 0;
+
+        const estimate = this.heights.size ? this.measuredTotal / this.heights.size : this.estimatedRowHeight;
+        const rows = Math.ceil(this.shown.length / this.columns);
+        this.rowTops = new Float64Array(rows + 1);
+        for (let row = 0; row < rows; row++) {
+            let height = 0;
+            const end = Math.min(this.shown.length, (row + 1) * this.columns);
+            for (let i = row * this.columns; i < end; i++) {
+                height = Math.max(height, this.heights.get(this.key(this.shown[i])) || 0);
+            }
+            this.rowTops[row + 1] = this.rowTops[row] + (height || estimate);
+        }
+        this.layoutStale = false;
+    }
+
+    // Last row starting at or above `y` (container content coordinates)
+    rowAt(y) {
+        let low = 0, high = this.rowTops.length - 2;
+        while (low < high) {
+            const mid = (low + high + 1) >>> 1;
+            if (this.rowTops[mid] <= y) low = mid; else high = mid - 1;
+        }
+        return low;
+    }
+
+    // Attach the rows around the viewport; `force` re-renders even if the
+    // window is unchanged (the items or their order changed)
+    updateWindow(force = false) {
+        if (!this.windowed) return;
+        if (this.layoutStale) {
+            this.layout();
+            force = true;
+        }
+        const top = -this.container.getBoundingClientRect().top - this.basePadding[0];
+        const firstRow = this.rowAt(top - this.overscanPx);
+        const lastRow = this.rowAt(top + window.innerHeight + this.overscanPx) + 1;
+        if (!force && firstRow === this.firstRow && lastRow === this.lastRow) return;
+
+        this.firstRow = firstRow;
+        this.lastRow = lastRow;
+        const rows = this.rowTops.length - 1;
+        this.container.style.paddingTop = `${this.basePadding[0] + this.rowTops[firstRow]}px`;
+        this.container.style.paddingBottom = `${this.basePadding[1] + this.rowTops[rows] - this.rowTops[lastRow]}px`;
+        super.render(this.shown.slice(firstRow * this.columns, lastRow * this.columns));
+        this.prune();
+    }
+
+    // Forget the oldest detached cards beyond maxCachedCards
+    prune() {
+        for (const [key, node] of this.nodes) {
+            if (this.nodes.size <= this.maxCachedCards) break;
+            if (node.isConnected) continue;
+            this.resizeObserver.unobserve(node);
+            this.nodes.delete(key);
+            this.items.delete(key);
+        }
+    }
+
+    schedule() {
+        if (this.frame || !this.windowed) return;
+        this.frame = requestAnimationFrame(() => {
+            this.frame = 0;
+            this.updateWindow();
+        });
+    }
+
+    // Record the heights of the attached rows and move the rows below them
+    // by however much they grew or shrank. The padding above and below the
+    // window stays valid, so only the window itself may need updating.
+    measure() {
+        if (!this.windowed || this.layoutStale) return;
+        let changed = false;
+        let oldTop = this.rowTops[this.firstRow];
+        for (let row = this.firstRow; row < this.lastRow; row++) {
+            const start = row * this.columns;
+            const end = Math.min(this.shown.length, start + this.columns);
+            const oldNext = this.rowTops[row + 1];
+            const node = this.nodes.get(this.key(this.shown[start]));
+            let height = oldNext - oldTop;
+            if (node && node.isConnected) {
+                height = node.getBoundingClientRect().height + this.rowGap;
+                for (let i = start; i < end; i++) {
+                    const key = this.key(this.shown[i]);
+                    const previous = this.heights.get(key) || 0;
+                    if (previous === height) continue;
+                    this.measuredTotal += height - previous;
+                    this.heights.set(key, height);
+                    changed = true;
+                }
+            }
+            this.rowTops[row + 1] = this.rowTops[row] + height;
+            oldTop = oldNext;
+        }
+        const shift = this.rowTops[this.lastRow] - oldTop;
+        for (let row = this.lastRow + 1; row < this.rowTops.length; row++) this.rowTops[row] += shift;
+        if (changed) this.schedule();
+    }
+
+    // Scroll the first item matching `predicate` into the window and return
+    // its card (null if no shown item matches)
+    reveal(predicate) {
+        const index = this.shown.findIndex(predicate);
+        if (index < 0) return null;
+        if (this.windowed) {
+            if (this.layoutStale) this.layout();
+            const top = this.container.getBoundingClientRect().top + window.scrollY + this.basePadding[0];
+            window.scrollTo(0, top + this.rowTops[Math.floor(index / this.columns)]);
+            this.updateWindow(true);
+        }
+        return this.nodeFor(this.shown[index]);
+    }
+}
+
+WindowedGrid.grids = new WeakMap();  // container -> grid
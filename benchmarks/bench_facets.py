@@ -0,0 +1,102 @@
+"""
+Facet engine benchmark
+Bitset facet queries (cityquest.facets) against a plain per-record scan on
+synthetic records with the pages' four kinds of facet: type group, budget
+range, cuisine group and distance bucket.
+
+Run with:
+    python benchmarks/bench_facets.py [--records 100000] [--repeat 200]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from cityquest.classification import CUISINE_GROUPS, TYPE_GROUPS
+from cityquest.facets import Facet, FacetIndex
+
+BUDGET_RANGES = [(0, 0), (1, 50), (50, 200), (200, 500), (500, 1000), (1000, float("inf"))]
+DISTANCE_RANGES = [(0, 5), (5, 10), (10, 20), (20, 50), (50, float("inf"))]
+SELECTION = {
+    "type": ["Heritage", "Parks"],
+    "budget": ["50-200", "200-500"],
+    "cuisine": ["South Indian"],
+    "distance": ["0-5", "5-10", "10-20"],
+}
+
+
+def synthetic_records(rng, count):
+    types, cuisines = list(TYPE_GROUPS), list(CUISINE_GROUPS)
+    return [
+        {
+            "groups": rng.sample(types, rng.randint(1, 2)),
+            "fee": rng.choice([0, 20, 50, 100, 250, 600, 1500]),
+            "cuisines": rng.sample(cuisines, rng.randint(1, 3)),
+            "distance": rng.uniform(0, 60),
+        }
+        for _ in range(count)
+    ]
+
+
+def build_facets():
+    def in_range(field, low, high):
+        return lambda record: low <= record[field] <= high
+
+    def key(low, high):
+        return f"{low:g}-{high:g}".replace("inf", "Infinity")
+
+    return [
+        Facet("type", {group: (lambda g: lambda r: g in r["groups"])(group) for group in TYPE_GROUPS}),
+        Facet("budget", {key(*bounds): in_range("fee", *bounds) for bounds in BUDGET_RANGES}),
+        Facet("cuisine", {group: (lambda g: lambda r: g in r["cuisines"])(group) for group in CUISINE_GROUPS}),
+        Facet("distance", {key(*bounds): in_range("distance", *bounds) for bounds in DISTANCE_RANGES}),
+    ]
+
+
+def scan(records, facets, selection):
+    """The old approach: test every selected option on every record."""
+    options = {facet.name: facet.options for facet in facets}
+    return [
+        i for i, record in enumerate(records)
+        if all(any(options[name][value](record) for value in values) for name, values in selection.items())
+    ]
+
+
+def average_ms(func, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return result, (time.perf_counter() - started) * 1000 / repeat
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    records = synthetic_records(random.Random(args.seed), args.records)
+    facets = build_facets()
+    started = time.perf_counter()
+    index = FacetIndex(records, facets)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    match_bits, match_ms = average_ms(lambda: index.match_bits(SELECTION), args.repeat)
+    _, query_ms = average_ms(lambda: index.query(SELECTION), max(1, args.repeat // 10))
+    expected, scan_ms = average_ms(lambda: scan(records, facets, SELECTION), 1)
+    assert index.query(SELECTION)[0] == expected, "Bitsets and scan disagree"
+
+    options = sum(len(facet.options) for facet in facets)
+    print(f"{args.records} records, {options} options, {len(expected)} matches")
+    print(f"build bitsets          {build_ms:10.1f} ms (once)")
+    print(f"match (AND of ORs)     {match_ms:10.3f} ms")
+    print(f"query + all counts     {query_ms:10.3f} ms (includes listing the matches)")
+    print(f"per-record scan        {scan_ms:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
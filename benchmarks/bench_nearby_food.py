@@ -0,0 +1,64 @@
+"""
+Nearby-food join benchmark
+Full and incremental cityquest.build.nearby_food builds over synthetic
+destination and food datasets of growing size.
+
+Run with:
+    python benchmarks/bench_nearby_food.py [--max-rows 50000] [--changed 10]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from cityquest.build import nearby_food
+
+# Rough bounding box of Hyderabad
+LAT_RANGE = (17.20, 17.60)
+LON_RANGE = (78.25, 78.65)
+PLACE_TYPES = ["Hyderabadi Biryani", "Street Food / Chaat", "South Indian", "Cafe / Bakery", "Multi-cuisine"]
+
+
+def synthetic_rows(rng, count, prefix, food=False):
+    rows = []
+    for i in range(count):
+        row = {"id": f"{prefix.lower()}-{i}", "name": f"{prefix} {i}", "latitude": rng.uniform(*LAT_RANGE), "longitude": rng.uniform(*LON_RANGE)}
+        if food:
+            row["max_budget_for_one"] = rng.choice([150, 200, 300, 400, 800])
+            row["place_type"] = rng.choice(PLACE_TYPES)
+        rows.append(row)
+    return rows
+
+
+def timed(func, *args, **kwargs):
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, (time.perf_counter() - started) * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--max-rows", type=int, default=50_000)
+    parser.add_argument("--changed", type=int, default=10, help="Food rows moved before the incremental build")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    print(f"{'rows each':>10} {'full ms':>9} {'incremental ms':>15} {'recomputed':>11}")
+    for size in (n for n in (1_000, 10_000, 50_000) if n <= args.max_rows):
+        destinations = synthetic_rows(rng, size, "Destination")
+        food = synthetic_rows(rng, size, "Food", food=True)
+        (_, state, _), full_ms = timed(nearby_food.build, destinations, food)
+
+        for row in rng.sample(food, args.changed):
+            row["latitude"] += rng.uniform(-0.01, 0.01)
+        (_, _, recomputed), incremental_ms = timed(nearby_food.build, destinations, food,
+                                                   previous_state=state)
+        print(f"{size:>10} {full_ms:>9.1f} {incremental_ms:>15.1f} {recomputed:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Nearest-place benchmark
+How the KD-tree engine in cityquest.nearest scales from the site's own
+points to a million synthetic ones, against a brute-force NumPy haversine
+scan over the same arrays (the per-item approach the page takes today).
+
+Run with:
+    python benchmarks/bench_nearest.py [--max-points 1000000] [--queries 1000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from cityquest.datasets import EARTH_RADIUS_KM
+from cityquest.nearest import GeoIndex
+
+# Rough bounding box of Hyderabad, for synthetic points and query locations
+LAT_RANGE = (17.20, 17.60)
+LON_RANGE = (78.25, 78.65)
+# Brute force gets slow past this many point x query pairs
+BRUTE_FORCE_LIMIT = 2e8
+
+
+def random_points(rng, count):
+    return rng.uniform(*LAT_RANGE, count), rng.uniform(*LON_RANGE, count)
+
+
+def brute_force_nearest(lats, lons, query_lats, query_lons, k):
+    """Distances (km) to the k nearest points by a full haversine scan per query."""
+    lat, lon = np.radians(lats), np.radians(lons)
+    cos_lat = np.cos(lat)
+    nearest = []
+    for q_lat, q_lon in zip(np.radians(query_lats), np.radians(query_lons)):
+        a = (np.sin((lat - q_lat) / 2) ** 2
+             + np.cos(q_lat) * cos_lat * np.sin((lon - q_lon) / 2) ** 2)
+        km = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+        nearest.append(np.sort(np.partition(km, k - 1)[:k]))
+    return np.array(nearest)
+
+
+def timed(func, *args, **kwargs):
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, (time.perf_counter() - started) * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--max-points", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--radius-km", type=float, default=2.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    query_lats, query_lons = random_points(rng, args.queries)
+    site = GeoIndex.from_site_data()
+    sizes = [len(site)] + [n for n in (10_000, 100_000, 1_000_000) if n <= args.max_points]
+
+    print(f"{args.queries} query locations, k={args.k}, radius={args.radius_km} km")
+    print(f"{'points':>9} {'build ms':>9} {'knn ms':>9} {'radius ms':>10} {'brute ms':>9} {'speedup':>8}")
+    for size in sizes:
+        if size == len(site):
+            lats, lons = site.lats, site.lons
+        else:
+            lats, lons = random_points(rng, size)
+        index, build_ms = timed(GeoIndex, lats, lons)
+        (km, _), knn_ms = timed(index.nearest, query_lats, query_lons, k=args.k)
+        _, radius_ms = timed(index.within_radius, query_lats, query_lons, args.radius_km)
+
+        brute = speedup = "-"
+        if size * args.queries <= BRUTE_FORCE_LIMIT:
+            expected, brute_ms = timed(brute_force_nearest, lats, lons, query_lats, query_lons, args.k)
+            # Compare distances, not indexes: equidistant points may tie
+            assert np.allclose(expected, km), "KD-tree and brute force disagree"
+            brute, speedup = f"{brute_ms:.1f}", f"{brute_ms / knn_ms:.0f}x"
+        print(f"{size:>9} {build_ms:>9.1f} {knn_ms:>9.1f} {radius_ms:>10.1f} {brute:>9} {speedup:>8}")
+
+
+if __name__ == "__main__":
+    main()
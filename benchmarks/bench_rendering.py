@@ -0,0 +1,75 @@
+"""
+Card rendering benchmark
+Toggles every filter checkbox on both pages in headless Chrome and reports
+the elements each toggle builds and its main-thread time, layout included
+(see measure_filter_toggles in selenium_tests/helpers.py). Pass --rev to
+measure the pages as they were at an earlier commit, e.g. before cards were
+kept by id.
+
+Run with:
+    python benchmarks/bench_rendering.py [--rev HEAD~1] [--repeat 3]
+"""
+
+import argparse
+import io
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from selenium_tests.driver_pool import DriverPool
+from selenium_tests.helpers import measure_filter_toggles, wait_for_cards_to_load, wait_for_food_cards_to_load
+from selenium_tests.static_server import StaticServer
+
+REPO_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# (page, wait for its cards, filter checkboxes)
+PAGES = [
+    ("index.html", wait_for_cards_to_load,
+     ".filter-checkbox, .budget-filter-checkbox, .distance-filter-checkbox"),
+    ("food-places.html", wait_for_food_cards_to_load, ".cuisine-checkbox, .budget-checkbox"),
+]
+
+
+def export_site(rev, directory):
+    """Write Devops/ as of commit `rev` into `directory` and return its path."""
+    archive = subprocess.run(["git", "archive", "--format=tar", rev, "Devops"],
+                             cwd=REPO_DIR, check=True, capture_output=True).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(directory, filter="data")
+    return os.path.join(directory, "Devops")
+
+
+def measure(site, repeat):
+    server = StaticServer(site)
+    pool = DriverPool(server.start()).start()
+    try:
+        for path, wait_for_cards, selector in PAGES:
+            browser = pool.open_context(path)
+            wait_for_cards(browser)
+            yield path, measure_filter_toggles(browser, selector, repeat)
+            pool.close_context()
+    finally:
+        pool.stop()
+        server.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rev", help="measure Devops/ as of this commit instead of the working tree")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        site = export_site(args.rev, directory) if args.rev else os.path.join(REPO_DIR, "Devops")
+        print(f"Site: {args.rev or 'working tree'}")
+        print(f"{'page':<20} {'toggles':>8} {'elements/toggle':>16} {'ms/toggle':>10}")
+        for path, result in measure(site, args.repeat):
+            print(f"{path:<20} {result['toggles']:>8} {result['createdPerToggle']:>16.1f} "
+                  f"{result['msPerToggle']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Routing stand-in benchmark
+Time per request for the local OSRM stand-in in cityquest.routing: /route
+and /table answered straight from the precomputed matrix, and the same
+lookups through a RouteCache, cold and warm.
+
+Run with:
+    python benchmarks/bench_routing.py [--runs 1000] [--targets 10]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from cityquest.datasets import load_destinations
+from cityquest.routing import OsrmStandIn, RoadDistanceMatrix, RouteCache
+
+HITEC_CITY = (17.4435, 78.3772)
+
+
+def coords(*points):
+    return ";".join(f"{lon},{lat}" for lat, lon in points)
+
+
+def per_request_us(stand_in, path, query, runs):
+    started = time.perf_counter()
+    for _ in range(runs):
+        status, _ = stand_in.handle(path, query)
+        assert status == 200, path
+    return (time.perf_counter() - started) / runs * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=1000)
+    parser.add_argument("--targets", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    matrix = RoadDistanceMatrix.from_site_data()
+    targets = [(d["latitude"], d["longitude"]) for d in load_destinations()[:args.targets]]
+    requests = [
+        ("route", f"/route/v1/driving/{coords(HITEC_CITY, targets[0])}", "overview=false"),
+        ("table", f"/table/v1/driving/{coords(HITEC_CITY, *targets)}", "sources=0&annotations=distance"),
+    ]
+
+    print(f"{args.runs} runs, table of 1 x {len(targets) + 1}")
+    print(f"{'request':<8} {'matrix µs':>10} {'cold cache µs':>14} {'warm cache µs':>14}")
+    for name, path, query in requests:
+        direct = per_request_us(OsrmStandIn(matrix), path, query, args.runs)
+        cached = OsrmStandIn(RouteCache(matrix))
+        cold = per_request_us(cached, path, query, 1)
+        warm = per_request_us(cached, path, query, args.runs)
+        print(f"{name:<8} {direct:>10.1f} {cold:>14.1f} {warm:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
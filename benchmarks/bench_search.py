@@ -0,0 +1,67 @@
+"""
+Search index benchmark
+Builds the cityquest.search index over synthetic records and times the
+reference implementation's answer to every keystroke of a query. The page
+runs the same algorithm over typed arrays (Devops/search-index.js); its
+per-keystroke timing is checked by the places page search tests.
+
+Run with:
+    python benchmarks/bench_search.py [--records 100000]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from cityquest.search import SearchIndex, build_search_index
+
+SYLLABLES = ["ka", "ri", "ma", "bi", "ya", "ni", "do", "ub", "le", "me", "et", "ha",
+             "sha", "hi", "pa", "ra", "di", "se", "qu", "ta", "la", "na", "ch", "ai"]
+
+
+def synthetic_records(rng, count, vocabulary=20_000):
+    words = sorted({"".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))) for _ in range(vocabulary)})
+    phrase = lambda length: " ".join(rng.choice(words) for _ in range(length))
+    return [
+        {
+            "name": phrase(3),
+            "special_dishes": [phrase(2) for _ in range(3)],
+            "area": phrase(1),
+            "nearest_metro_station": phrase(2),
+            "description": phrase(10),
+        }
+        for _ in range(count)
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    records = synthetic_records(rng, args.records)
+    started = time.perf_counter()
+    section = build_search_index(records)
+    build_ms = (time.perf_counter() - started) * 1000
+    size_kib = len(json.dumps(section, separators=(",", ":"))) / 1024
+    print(f"{args.records} records: {len(section['terms'])} terms, {len(section['postings']) // 2} postings, "
+          f"{size_kib:.0f} KiB, built in {build_ms:.0f} ms")
+
+    index = SearchIndex(section)
+    query = records[rng.randrange(len(records))]["name"]
+    print(f"{'typed':<30} {'results':>8} {'ms':>8}")
+    for end in range(1, len(query) + 1):
+        started = time.perf_counter()
+        results = index.search(query[:end])
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"{query[:end]!r:<30} {len(results or []):>8} {elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+"""
+City Quest Python tools
+Services and build steps that sit next to the static site in Devops/.
+"""
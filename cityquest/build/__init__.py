@@ -0,0 +1,68 @@
+"""
+City Quest build steps
+Derived artifacts the static pages read from Devops/generated/, so the
+browser never has to recompute them. Run every step with:
+
+    python -m cityquest.build [--full]
+
+Steps keep a small state file under build-cache/ (not committed) so a rerun
+after editing a few rows only redoes the work those rows affect.
+"""
+
+import json
+import os
+
+from cityquest.datasets import DEVOPS_DIR
+
+
+GENERATED_DIR = os.path.join(DEVOPS_DIR, "generated")
+BUILD_CACHE_DIR = os.path.abspath(os.path.join(DEVOPS_DIR, "..", "build-cache"))
+
+
+class BuildError(ValueError):
+    """A source row the build can't use. Raised before anything is written."""
+
+
+def read_json(path, default=None):
+    """Parsed JSON at `path`, or `default` if the file doesn't exist."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+
+
+def read_ndjson(path, default=None):
+    """Values of the newline-delimited JSON at `path`, or `default` if it doesn't exist."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return default
+
+
+def ndjson_text(values):
+    """`values` as newline-delimited JSON: one compact value per line."""
+    return "".join(json.dumps(value, ensure_ascii=False, separators=(",", ":")) + "\n" for value in values)
+
+
+def _write_text(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def write_json(path, data, compact=True):
+    """Write `data` atomically; compact output for artifacts the pages fetch."""
+    if compact:
+        text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    else:
+        text = json.dumps(data, ensure_ascii=False, indent=1)
+    _write_text(path, text + "\n")
+
+
+def write_ndjson(path, values):
+    """Write `values` atomically as newline-delimited JSON, for pages that stream them."""
+    _write_text(path, ndjson_text(values))
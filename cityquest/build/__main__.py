@@ -0,0 +1,24 @@
+"""Run every build step: python -m cityquest.build [--full]"""
+
+import argparse
+import time
+
+from cityquest.build import compile_datasets, destination_payloads, nearby_food, search_index
+
+
+STEPS = [compile_datasets, nearby_food, destination_payloads, search_index]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the derived artifacts in Devops/generated/")
+    parser.add_argument("--full", action="store_true", help="Ignore build-cache/ and rebuild everything")
+    args = parser.parse_args(argv)
+
+    for step in STEPS:
+        started = time.perf_counter()
+        summary = step.run(full=args.full)
+        print(f"{summary} ({(time.perf_counter() - started) * 1000:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
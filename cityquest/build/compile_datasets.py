@@ -0,0 +1,146 @@
+"""
+Compiled datasets
+Normalizes data.json and food_places.json into records that need no string
+parsing in the browser. Compiled destinations get every data.json field,
+plus
+
+    id      stable slug of the name (e.g. "golconda-fort")
+    fees    {visitor category: int rupees}, e.g. {"Indians": 25, "Foreigners": 300}
+    fee     headline fee the budget filter uses (first listed, 0 if free)
+    types   place_type split into a list
+
+and compiled food places every food_places.json field, plus
+
+    id      stable slug of the name
+    budget  max_budget_for_one as an int
+
+The places page streams its destinations from the list and detail payloads
+the destination_payloads step builds from these records. This step writes:
+
+    Devops/generated/food-places.ndjson
+        the compiled food places, one per line, for the food page to stream
+
+    Devops/generated/classification-destinations.json
+    Devops/generated/classification-food.json
+        one page's filter options and the options every raw place_type
+        matches (see cityquest.classification.classification_table)
+
+Rows the step can't normalize raise BuildError naming the row, and nothing
+is written.
+"""
+
+import os
+import re
+
+from cityquest.build import GENERATED_DIR, BuildError, write_json, write_ndjson
+from cityquest.classification import classification_table, split_place_types
+from cityquest.datasets import load_destinations, load_food_places
+
+
+FOOD_PLACES_STREAM_OUTPUT = os.path.join(GENERATED_DIR, "food-places.ndjson")
+CLASSIFICATION_OUTPUTS = {
+    "destinations": os.path.join(GENERATED_DIR, "classification-destinations.json"),
+    "food": os.path.join(GENERATED_DIR, "classification-food.json"),
+}
+
+# Visitor category for fees that don't name one, e.g. "₹20"
+GENERAL_VISITORS = "General"
+
+_FEE_PATTERN = re.compile(r"₹\s*(\d+)(?:\s*\(([^)]+)\)|\s+per\s+(\w+))?")
+
+
+def slugify(name):
+    """Stable id for a row: lower-case words joined by hyphens."""
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+def parse_entry_fee(text):
+    """
+    Entry fees per visitor category from an entry_fee string.
+
+    >>> parse_entry_fee("₹25 (Indians), ₹300 (Foreigners)")
+    {'Indians': 25, 'Foreigners': 300}
+    >>> parse_entry_fee("Free")
+    {'General': 0}
+
+    Raises:
+        ValueError: If the string is neither free nor has any ₹ amount
+    """
+    if "free" in text.lower():
+        return {GENERAL_VISITORS: 0}
+    fees = {}
+    for match in _FEE_PATTERN.finditer(text):
+        amount, category, per = match.groups()
+        category = (category or (per.capitalize() if per else GENERAL_VISITORS)).strip()
+        fees.setdefault(category, int(amount))
+    if not fees:
+        raise ValueError(f"no fee in {text!r}")
+    return fees
+
+
+def _with_ids(rows, source):
+    ids = {}
+    for number, row in enumerate(rows, start=1):
+        if not isinstance(row.get("name"), str) or not row["name"].strip():
+            raise BuildError(f"{source} row {number}: missing name")
+        row_id = slugify(row["name"])
+        if row_id in ids:
+            raise BuildError(f"{source} row {number} ({row['name']}): id {row_id!r} "
+                             f"already used by {ids[row_id]!r}")
+        ids[row_id] = row["name"]
+        yield number, row_id, row
+
+
+def compile_destinations(rows):
+    """Normalized destination records, in data.json order."""
+    compiled = []
+    for number, row_id, row in _with_ids(rows, "data.json"):
+        where = f"data.json row {number} ({row['name']})"
+        if not isinstance(row.get("place_type"), str) or not row["place_type"].strip():
+            raise BuildError(f"{where}: missing place_type")
+        try:
+            fees = parse_entry_fee(row.get("entry_fee") or "")
+        except ValueError as err:
+            raise BuildError(f"{where}: can't parse entry_fee: {err}") from None
+        compiled.append({
+            **row,
+            "id": row_id,
+            "fees": fees,
+            "fee": next(iter(fees.values())),
+            "types": split_place_types(row["place_type"]),
+        })
+    return compiled
+
+
+def compile_food_places(rows):
+    """Normalized food place records, in food_places.json order."""
+    compiled = []
+    for number, row_id, row in _with_ids(rows, "food_places.json"):
+        where = f"food_places.json row {number} ({row['name']})"
+        if not isinstance(row.get("place_type"), str) or not row["place_type"].strip():
+            raise BuildError(f"{where}: missing place_type")
+        budget = row.get("max_budget_for_one")
+        if isinstance(budget, str) and budget.strip().isdigit():
+            budget = int(budget)
+        if not isinstance(budget, int) or isinstance(budget, bool) or budget < 0:
+            raise BuildError(f"{where}: max_budget_for_one must be a whole number of rupees")
+        compiled.append({**row, "id": row_id, "budget": budget})
+    return compiled
+
+
+def compile_classification(destinations, food_places):
+    """Classification table for compiled destination and food place records."""
+    return classification_table(
+        [row["place_type"] for row in destinations],
+        [row["place_type"] for row in food_places],
+    )
+
+
+def run(full=False):
+    """Write the compiled food places and classification tables. Always a full build: it takes milliseconds."""
+    destinations = compile_destinations(load_destinations())
+    food_places = compile_food_places(load_food_places())
+    write_ndjson(FOOD_PLACES_STREAM_OUTPUT, food_places)
+    for page, table in compile_classification(destinations, food_places).items():
+        write_json(CLASSIFICATION_OUTPUTS[page], table)
+    return f"compile-datasets: {len(destinations)} destinations, {len(food_places)} food places"
@@ -0,0 +1,90 @@
+"""
+Destination list and detail payloads
+Splits the compiled destinations into what the places page needs to draw
+the list and filter it, and what it only needs once a card is expanded:
+
+    Devops/generated/destinations-list.ndjson
+        a {"fields": ["id", "name", ...], "chunkSize": 8} header line, then
+        one [...] row per destination, in data.json order (so positions
+        match the search index)
+
+    Devops/generated/destination-details/<chunk>.json
+        [{"ideal_for": ..., "description": ..., "nearby_food":
+          [[name, budget, group, km], ...], ...}, ...]
+        the details of destinations chunk * chunkSize onwards, with their
+        nearest food places from nearby-food.json resolved
+
+The page streams the list, then fetches a detail chunk the first time one
+of its cards is hovered or expanded. Runs after the nearby_food step, whose
+artifact it reads.
+"""
+
+import os
+
+from cityquest.build import GENERATED_DIR, read_json, write_json, write_ndjson
+from cityquest.build import nearby_food
+from cityquest.build.compile_datasets import compile_destinations
+from cityquest.datasets import load_destinations
+
+
+LIST_STREAM_OUTPUT = os.path.join(GENERATED_DIR, "destinations-list.ndjson")
+DETAILS_DIR = os.path.join(GENERATED_DIR, "destination-details")
+
+# What the cards show collapsed, the filters and "Show Nearest" use
+LIST_FIELDS = ["id", "name", "place_type", "entry_fee", "fee", "latitude", "longitude"]
+# What an expanded card adds
+DETAIL_FIELDS = ["ideal_for", "timings", "description", "link", "food_places_near"]
+# Destinations per detail file: one small request covers a screenful of cards
+CHUNK_SIZE = 8
+
+
+def build(destinations, nearby=None, chunk_size=CHUNK_SIZE):
+    """
+    List payload and detail chunks for compiled destination records.
+
+    Args:
+        destinations: Compiled destination records
+        nearby: nearby-food.json artifact, or None to leave nearby_food empty
+        chunk_size: Destinations per detail chunk
+
+    Returns:
+        tuple: (list payload dict, list of detail chunks)
+    """
+    listing = {
+        "fields": LIST_FIELDS,
+        "rows": [[record.get(field) for field in LIST_FIELDS] for record in destinations],
+        "chunkSize": chunk_size,
+    }
+    details = []
+    for record in destinations:
+        detail = {field: record[field] for field in DETAIL_FIELDS if field in record}
+        pairs = (nearby or {}).get("nearby", {}).get(record["id"], [])
+        detail["nearby_food"] = [nearby["food"][row] + [km] for row, km in pairs]
+        details.append(detail)
+    chunks = [details[start:start + chunk_size] for start in range(0, len(details), chunk_size)]
+    return listing, chunks
+
+
+def stream_lines(listing):
+    """The list payload as the values of destinations-list.ndjson: header, then rows."""
+    return [{"fields": listing["fields"], "chunkSize": listing["chunkSize"]}] + listing["rows"]
+
+
+def chunk_path(chunk):
+    """Path of detail chunk number `chunk`."""
+    return os.path.join(DETAILS_DIR, f"{chunk}.json")
+
+
+def run(full=False):
+    """Write the list payload and detail chunks. Always a full build: it takes milliseconds."""
+    listing, chunks = build(compile_destinations(load_destinations()), read_json(nearby_food.OUTPUT_PATH))
+    write_ndjson(LIST_STREAM_OUTPUT, stream_lines(listing))
+    for chunk, details in enumerate(chunks):
+        write_json(chunk_path(chunk), details)
+    # Drop chunks left over from a larger dataset
+    for name in os.listdir(DETAILS_DIR):
+        stem, extension = os.path.splitext(name)
+        if extension == ".json" and stem.isdigit() and int(stem) >= len(chunks):
+            os.remove(os.path.join(DETAILS_DIR, name))
+    return (f"destination-payloads: list {os.path.getsize(LIST_STREAM_OUTPUT) / 1024:.1f} KiB, "
+            f"{len(chunks)} detail chunks")
@@ -0,0 +1,171 @@
+"""
+Destination -> food place spatial join
+For every compiled destination, the k nearest compiled food places with
+their distance, budget and cuisine group, written to
+Devops/generated/nearby-food.json for the places page. Rows are keyed on
+their compiled id, so two places can share a display name.
+
+The join runs one batched KD-tree query (cityquest.nearest.GeoIndex), so it
+stays O((destinations + food places) log food places). With the previous
+build's state it only recomputes destinations whose neighbour list can have
+changed: moved or new destinations, ones that listed a changed or removed
+food place, and ones a new or moved food place now falls inside of.
+
+Artifact layout (compact, food rows shared between destinations):
+    {"k": 5,
+     "fields": ["name", "budget", "group"],
+     "food": [["Paradise", 400, "Biryani & Hyderabadi"], ...],
+     "nearby": {"golconda-fort": [[food row, km], ...], ...}}
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from cityquest.build import BUILD_CACHE_DIR, GENERATED_DIR, BuildError, read_json, write_json
+from cityquest.build.compile_datasets import compile_destinations, compile_food_places
+from cityquest.classification import cuisine_group
+from cityquest.datasets import load_destinations, load_food_places
+from cityquest.nearest import GeoIndex
+
+
+DEFAULT_K = 5
+OUTPUT_PATH = os.path.join(GENERATED_DIR, "nearby-food.json")
+STATE_PATH = os.path.join(BUILD_CACHE_DIR, "nearby-food.json")
+
+# Fields whose change can alter a row's part of the join
+DESTINATION_FIELDS = ("latitude", "longitude")
+FOOD_FIELDS = ("latitude", "longitude", "max_budget_for_one", "place_type")
+
+
+def fingerprint(row, fields):
+    """Short hash of the fields of `row` the join depends on."""
+    data = json.dumps([row.get(field) for field in fields], ensure_ascii=False)
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()[:16]
+
+
+def keyed_rows(rows, fields, source):
+    """{id: row} after checking every row has a unique id and coordinates."""
+    keyed = {}
+    for number, row in enumerate(rows, start=1):
+        key = row.get("id")
+        if not key:
+            raise BuildError(f"{source} row {number}: missing id")
+        if key in keyed:
+            raise BuildError(f"{source} row {number}: duplicate id {key!r}")
+        for field in fields:
+            if field in ("latitude", "longitude") and not isinstance(row.get(field), (int, float)):
+                raise BuildError(f"{source} row {number} ({key}): {field} must be a number")
+        if "max_budget_for_one" in fields and not isinstance(row.get("max_budget_for_one"), int):
+            raise BuildError(f"{source} row {number} ({key}): max_budget_for_one must be an integer")
+        keyed[key] = row
+    return keyed
+
+
+def build(destinations, food_places, k=DEFAULT_K, previous_state=None):
+    """
+    Join destinations to their k nearest food places.
+
+    Args:
+        destinations: Compiled destination records
+        food_places: Compiled food place records
+        k: Food places per destination
+        previous_state: State returned by an earlier build, for an
+            incremental rebuild (None for a full one)
+
+    Returns:
+        tuple: (artifact dict, state dict, number of destinations recomputed)
+    """
+    destinations = keyed_rows(destinations, DESTINATION_FIELDS, "data.json")
+    food = keyed_rows(food_places, FOOD_FIELDS, "food_places.json")
+    destination_prints = {key: fingerprint(row, DESTINATION_FIELDS) for key, row in destinations.items()}
+    food_prints = {key: fingerprint(row, FOOD_FIELDS) for key, row in food.items()}
+
+    food_ids = list(food)
+    index = GeoIndex([food[key]["latitude"] for key in food_ids],
+                     [food[key]["longitude"] for key in food_ids])
+
+    nearby = {}
+    stale = _stale_destinations(destinations, destination_prints, food, food_prints, k, previous_state)
+    for key in destinations:
+        if key not in stale:
+            nearby[key] = previous_state["nearby"][key]
+
+    stale = [key for key in destinations if key in stale]
+    if stale and food_ids:
+        km, indexes = index.nearest([destinations[key]["latitude"] for key in stale],
+                                    [destinations[key]["longitude"] for key in stale], k=k)
+        for key, row_km, row_indexes in zip(stale, km, indexes):
+            pairs = [(food_ids[i], round(float(d), 2)) for d, i in zip(row_km, row_indexes)]
+            nearby[key] = [list(pair) for pair in sorted(pairs, key=lambda pair: (pair[1], pair[0]))]
+    else:
+        for key in stale:
+            nearby[key] = []
+
+    state = {"k": k, "destinations": destination_prints, "food": food_prints, "nearby": nearby}
+    return _artifact(food, food_ids, nearby, k), state, len(stale)
+
+
+def _stale_destinations(destinations, destination_prints, food, food_prints, k, previous_state):
+    """Ids of destinations whose neighbour list has to be recomputed."""
+    if not previous_state or previous_state.get("k") != k:
+        return set(destinations)
+
+    old_food = previous_state["food"]
+    old_destinations = previous_state["destinations"]
+    # Food rows that disappeared or changed invalidate lists they were in...
+    gone = {key for key, old in old_food.items() if food_prints.get(key) != old}
+    # ...and new or changed rows invalidate lists they might now belong to
+    arrived = [key for key, new in food_prints.items() if old_food.get(key) != new]
+
+    stale = set()
+    for key, print_ in destination_prints.items():
+        previous = previous_state["nearby"].get(key)
+        if old_destinations.get(key) != print_ or previous is None:
+            stale.add(key)
+        elif any(food_id in gone for food_id, _ in previous):
+            stale.add(key)
+
+    candidates = [key for key in destinations if key not in stale]
+    if arrived and candidates:
+        arrivals = GeoIndex([food[key]["latitude"] for key in arrived],
+                            [food[key]["longitude"] for key in arrived])
+        km, _ = arrivals.nearest([destinations[key]["latitude"] for key in candidates],
+                                 [destinations[key]["longitude"] for key in candidates], k=1)
+        for key, closest_arrival in zip(candidates, km[:, 0]):
+            previous = previous_state["nearby"][key]
+            # Stored distances are rounded to 10 m, so compare with that slack
+            if len(previous) < k or closest_arrival <= previous[-1][1] + 0.005:
+                stale.add(key)
+    return stale
+
+
+def _artifact(food, food_ids, nearby, k):
+    position = {key: i for i, key in enumerate(food_ids)}
+    used = sorted({food_id for pairs in nearby.values() for food_id, _ in pairs}, key=position.get)
+    row_of = {key: row for row, key in enumerate(used)}
+    return {
+        "k": k,
+        "fields": ["name", "budget", "group"],
+        "food": [
+            [food[key]["name"], food[key]["max_budget_for_one"], cuisine_group(food[key]["place_type"])]
+            for key in used
+        ],
+        "nearby": {
+            key: [[row_of[food_id], km] for food_id, km in pairs]
+            for key, pairs in nearby.items()
+        },
+    }
+
+
+def run(full=False, k=DEFAULT_K):
+    """Build Devops/generated/nearby-food.json. Returns a one-line summary."""
+    previous_state = None if full else read_json(STATE_PATH)
+    destinations = compile_destinations(load_destinations())
+    artifact, state, recomputed = build(destinations, compile_food_places(load_food_places()), k=k,
+                                        previous_state=previous_state)
+    write_json(OUTPUT_PATH, artifact)
+    write_json(STATE_PATH, state)
+    return f"nearby-food: recomputed {recomputed}/{len(destinations)} destinations"
@@ -0,0 +1,43 @@
+"""
+Search index
+Writes the full-text and prefix index each page's search box queries, one
+file per page so neither downloads the other's:
+
+    Devops/generated/search-index-destinations.json
+    Devops/generated/search-index-food.json
+        {"fields": {field: weight}, "terms": [...], "counts": [...], "postings": [...]}
+
+Record positions in the postings are positions in the compiled datasets,
+which keep the order of data.json and food_places.json. See cityquest.search for the layout.
+"""
+
+import os
+
+from cityquest.build import GENERATED_DIR, write_json
+from cityquest.build.compile_datasets import compile_destinations, compile_food_places
+from cityquest.datasets import load_destinations, load_food_places
+from cityquest.search import SEARCH_FIELDS, build_search_index
+
+
+OUTPUT_PATHS = {
+    "destinations": os.path.join(GENERATED_DIR, "search-index-destinations.json"),
+    "food": os.path.join(GENERATED_DIR, "search-index-food.json"),
+}
+
+
+def build(destinations, food_places):
+    """{page: search index artifact} for compiled destination and food place records."""
+    return {
+        "destinations": {"fields": SEARCH_FIELDS, **build_search_index(destinations)},
+        "food": {"fields": SEARCH_FIELDS, **build_search_index(food_places)},
+    }
+
+
+def run(full=False):
+    """Write the search index. Always a full build: it takes milliseconds."""
+    artifacts = build(compile_destinations(load_destinations()), compile_food_places(load_food_places()))
+    for page, artifact in artifacts.items():
+        write_json(OUTPUT_PATHS[page], artifact)
+    terms = sum(len(artifact["terms"]) for artifact in artifacts.values())
+    kib = sum(os.path.getsize(path) for path in OUTPUT_PATHS.values()) / 1024
+    return f"search-index: {terms} terms, {kib:.1f} KiB"
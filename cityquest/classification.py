@@ -0,0 +1,169 @@
+"""
+Filter group classification for the City Quest pages.
+
+TYPE_GROUPS: a destination's comma-separated place_type is split into types,
+and each type is shown under the group that lists it, or on its own.
+
+CUISINE_GROUPS: a raw food place_type is shown under the first group with a
+member that equals it, contains it or is contained in it, and otherwise on
+its own. Filtering is looser than display: a place matches every cuisine
+option related to it that way, so "Street Food / Chaat" also turns up under
+"Street Food - Quick Bites".
+
+classification_table() resolves both once per raw place_type; the build
+emits each page's half as Devops/generated/classification-<page>.json, the
+only copy of these rules the pages see.
+"""
+
+from functools import lru_cache
+
+
+TYPE_GROUPS = {
+    "Parks": ["Amusement Park", "Amusement & Water Park", "Amusement & Theme Park", "Winter Park",
+              "Zoological Park", "Botanical Garden", "Park", "Lake Front & Park"],
+    "Heritage": ["Heritage", "Monument", "Fort", "Palace", "Tomb"],
+    "Museums": ["Museum", "Art", "Antiques"],
+    "Religious": ["Hindu Temple"],
+    "Entertainment": ["Film Studio", "Planetarium", "Space Shows"],
+    "Nature": ["Lake Front", "Scenic Drive"],
+    "Shopping": ["Shopping"],
+    "Hotels": ["Hotel"],
+}
+
+CUISINE_GROUPS = {
+    "Biryani & Hyderabadi": [
+        "Hyderabadi Biryani", "Hyderabadi", "Hyderabadi / Mughlai", "Hyderabadi / Irani cafe",
+        "Hyderabadi / Barbecue", "Biryani / North Indian", "Fine Dining - Hyderabadi",
+        "Fine Dining - Awadhi / Hyderabadi",
+    ],
+    "Street Food - Chaat": [
+        "Street Food / Chaat", "Street Food / Hyderabadi",
+    ],
+    "Street Food - Quick Bites": [
+        "Street Food", "Street Food / Non-veg", "Street Food / Arabian",
+    ],
+    "Chai & Snacks": [
+        "Street Food / Tea Stall", "Street Food / Cafe", "Irani Cafe / Street Food",
+        "Juice Center / Snacks",
+    ],
+    "Bakery & Sweets": [
+        "Street Food / Bakery", "Street Food / Middle Eastern", "Casual dining / Sweets & Snacks",
+        "Casual Dining / Sweets & Snacks",
+    ],
+    "Food Streets": [
+        "Street Food / Food Street",
+    ],
+    "South Indian": [
+        "South Indian", "Andhra / Spicy cuisine", "Andhra / Traditional Thali",
+        "Chettinad / South Indian", "South Indian / Vegetarian",
+    ],
+    "North Indian & Mughlai": [
+        "North Indian", "Mughlai / Barbecue", "North West Frontier",
+        "Fine Dining - North West Frontier", "Vegetarian / North Indian",
+    ],
+    "Fine Dining": [
+        "Fine dining / Multi-cuisine", "Fine Dining - Indian", "Multi-cuisine / Lounge",
+    ],
+    "Cafes & Bakeries": [
+        "Cafe / Bakery", "Bakery / Confectionery", "Bakery / Hyderabadi sweets",
+        "Restaurant - Multi-cuisine / Bakery",
+    ],
+    "Vegetarian": [
+        "Vegetarian / Gujarati", "Restaurant - Vegetarian / North Indian",
+        "Restaurant - South Indian / Vegetarian",
+    ],
+    "Buffet & BBQ": [
+        "Buffet / Barbecue", "Restaurant - Mughlai / Barbecue",
+    ],
+    "Multi-Cuisine": [
+        "Multi-cuisine", "Restaurant - Multi-cuisine",
+    ],
+}
+
+
+def clean_place_type(place_type):
+    """place_type without its 'Restaurant - ' prefix, as the food page shows it."""
+    return place_type.replace("Restaurant - ", "", 1).strip()
+
+
+@lru_cache(maxsize=None)
+def cuisine_group(place_type):
+    """The cuisine filter group a raw food place_type falls under."""
+    clean = clean_place_type(place_type)
+    for group, members in CUISINE_GROUPS.items():
+        if any(clean == member or member in clean or clean in member for member in members):
+            return group
+    return clean
+
+
+def split_place_types(place_type):
+    """A destination's place_type as a list of types."""
+    return [part.strip() for part in place_type.split(",")]
+
+
+def type_group(place_type):
+    """The type filter option a single destination type is shown under."""
+    for group, members in TYPE_GROUPS.items():
+        if place_type in members:
+            return group
+    return place_type
+
+
+def _cuisine_related(clean, label):
+    members = CUISINE_GROUPS.get(label)
+    if members is not None:
+        return any(clean == member or member in clean or clean in member for member in members)
+    return label in clean or clean in label
+
+
+def cuisine_filter_groups(place_types):
+    """
+    Every cuisine filter option each raw food place_type matches.
+
+    Args:
+        place_types: All raw place_type values on the page; together they
+            decide which options exist
+
+    Returns:
+        dict: {raw place_type: [option labels, in option order]}
+    """
+    options = sorted({cuisine_group(place_type) for place_type in place_types})
+    return {
+        place_type: [label for label in options if _cuisine_related(clean_place_type(place_type), label)]
+        for place_type in place_types
+    }
+
+
+def destination_filter_groups(place_types):
+    """
+    Every type filter option each raw destination place_type matches.
+
+    Returns:
+        dict: {raw place_type: [option labels, sorted]}
+    """
+    return {
+        place_type: sorted({type_group(part) for part in split_place_types(place_type)})
+        for place_type in place_types
+    }
+
+
+def classification_table(destination_place_types, food_place_types):
+    """
+    Filter options and the options each raw place_type matches, per page.
+
+    Returns:
+        dict: {"destinations": {"options": [...], "groups": {raw: [...]}},
+               "food": {"options": [...], "groups": {raw: [...]}}}
+    """
+    destination_groups = destination_filter_groups(sorted(set(destination_place_types)))
+    food_place_types = sorted(set(food_place_types))
+    return {
+        "destinations": {
+            "options": sorted({group for groups in destination_groups.values() for group in groups}),
+            "groups": destination_groups,
+        },
+        "food": {
+            "options": sorted({cuisine_group(place_type) for place_type in food_place_types}),
+            "groups": cuisine_filter_groups(food_place_types),
+        },
+    }
@@ -0,0 +1,39 @@
+"""
+Dataset access for the City Quest site data (Devops/data.json and
+Devops/food_places.json) plus the distance formula the pages use.
+"""
+
+import json
+import math
+import os
+
+
+DEVOPS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "Devops"))
+DESTINATIONS_PATH = os.path.join(DEVOPS_DIR, "data.json")
+FOOD_PLACES_PATH = os.path.join(DEVOPS_DIR, "food_places.json")
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def load_json(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_destinations(path=DESTINATIONS_PATH):
+    """Tourist destinations shown on index.html."""
+    return load_json(path)
+
+
+def load_food_places(path=FOOD_PLACES_PATH):
+    """Food places shown on food-places.html."""
+    return load_json(path)
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Great-circle distance in km (same formula as getHaversine in script.js)."""
+    d_lat = math.radians(lat2 - lat1)
+    d_lon = math.radians(lon2 - lon1)
+    a = (math.sin(d_lat / 2) ** 2
+         + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(d_lon / 2) ** 2)
+    return EARTH_RADIUS_KM * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
@@ -0,0 +1,120 @@
+"""
+Bitset facet engine (reference implementation)
+The same algorithm as Devops/facet-engine.js, used to check the pages and
+to benchmark the approach at sizes the real datasets don't reach.
+
+Every filter option gets one bitset over the records, built once: bit i is
+set when record i matches the option. A query ORs the selected options
+within each facet and ANDs the facets together, so its cost depends on the
+number of records / word size rather than on records x options. Python ints
+serve as arbitrary-length bitsets here; the page uses Uint32Arrays.
+
+Counts follow the usual faceted-search convention: next to each option, the
+number of results the option would have with every *other* facet's
+selection applied, i.e. what ticking it (alone in its facet) would show.
+"""
+
+
+class Facet:
+    """
+    One filter facet.
+
+    Args:
+        name: Facet name, e.g. 'budget'
+        options: {option value: predicate(record) -> bool}, in display order
+    """
+
+    def __init__(self, name, options):
+        self.name = name
+        self.options = dict(options)
+
+
+class FacetIndex:
+    """Option bitsets over a list of records, which can grow at the end."""
+
+    def __init__(self, records, facets):
+        self.records = list(records)
+        self.facets = {facet.name: facet for facet in facets}
+        self.all_bits = (1 << len(self.records)) - 1
+        self.bits = {}
+        for facet in facets:
+            self.rebuild_facet(facet.name)
+
+    def rebuild_facet(self, name):
+        """Recompute a facet's bitsets, e.g. after user distances change."""
+        facet = self.facets[name]
+        self.bits[name] = {value: option_bits(predicate, self.records)
+                           for value, predicate in facet.options.items()}
+
+    def append(self, records):
+        """
+        Add `records` after the existing ones, e.g. as a streamed payload
+        arrives. Only the new records are tested against each option.
+        """
+        start = len(self.records)
+        self.records.extend(records)
+        self.all_bits = (1 << len(self.records)) - 1
+        for name, facet in self.facets.items():
+            for value, predicate in facet.options.items():
+                self.bits[name][value] |= option_bits(predicate, self.records[start:]) << start
+
+    def bits_of(self, indexes):
+        """Bitset of the record positions in `indexes`, e.g. search results."""
+        buffer = bytearray((len(self.records) + 7) // 8)
+        for i in indexes:
+            buffer[i >> 3] |= 1 << (i & 7)
+        return int.from_bytes(buffer, "little")
+
+    def match_bits(self, selection, exclude=None, within=None):
+        """
+        Bitset of records matching `selection` ({facet: [values]}) among
+        `within` (a bitset, default all records). OR within a facet, AND
+        across facets; `exclude` skips one facet.
+        """
+        result = self.all_bits if within is None else within
+        for name, values in selection.items():
+            if name == exclude or not values:
+                continue
+            union = 0
+            for value in values:
+                union |= self.bits[name][value]
+            result &= union
+        return result
+
+    def query(self, selection, within=None):
+        """
+        Matching records and per-option counts, both limited to `within`
+        (a bitset, default all records).
+
+        Returns:
+            tuple: (list of matching record indexes in order,
+                    {facet: {option value: count}})
+        """
+        result = self.match_bits(selection, within=within)
+        counts = {}
+        for name, options in self.bits.items():
+            others = self.match_bits(selection, exclude=name, within=within)
+            counts[name] = {value: (bits & others).bit_count() for value, bits in options.items()}
+        return bits_to_indexes(result), counts
+
+
+def option_bits(predicate, records):
+    """Bitset of the `records` matching `predicate`."""
+    # Fill a byte buffer and convert once; OR-ing into a growing int would
+    # copy it for every record
+    buffer = bytearray((len(records) + 7) // 8)
+    for i, record in enumerate(records):
+        if predicate(record):
+            buffer[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def bits_to_indexes(bits):
+    """Indexes of the set bits, lowest first."""
+    indexes = []
+    for byte_index, byte in enumerate(bits.to_bytes((bits.bit_length() + 7) // 8, "little")):
+        while byte:
+            low = byte & -byte
+            indexes.append(byte_index * 8 + low.bit_length() - 1)
+            byte ^= low
+    return indexes
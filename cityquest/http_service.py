@@ -0,0 +1,71 @@
+"""
+JSON services over HTTP
+What the standalone services (cityquest.routing, cityquest.nearest) share:
+each answers requests from a handle(path, query) -> (status, payload)
+method, and this module parses their queries and serves them over HTTP
+with a JSON body and permissive CORS for the pages.
+"""
+
+import json
+import traceback
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+def query_params(query):
+    """{name: value} for a raw query string; the last value wins on repeats."""
+    return {key: values[-1] for key, values in parse_qs(query).items()}
+
+
+def make_handler(service, prefix=""):
+    """
+    HTTP handler class answering GETs below `prefix` from service.handle().
+
+    The path passed on has `prefix` stripped. A request outside `prefix` gets
+    a 404, and an exception in the service a 500 with its traceback on
+    stderr. Request lines themselves are not logged.
+    """
+
+    class JsonRequestHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            if not url.path.startswith(prefix + "/"):
+                self.send_json(404, {"code": "NotFound", "message": f"Unknown endpoint: {url.path}"})
+                return
+            try:
+                status, payload = service.handle(url.path[len(prefix):], url.query)
+            except Exception:
+                self.log_error("%s failed:\n%s", url.path, traceback.format_exc())
+                status, payload = 500, {"code": "InternalError", "message": "Internal server error"}
+            self.send_json(status, payload)
+
+        def send_json(self, status, payload):
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+        def log_error(self, format, *args):
+            # log_message is silenced above; errors still go to stderr
+            BaseHTTPRequestHandler.log_message(self, format, *args)
+
+    return JsonRequestHandler
+
+
+def serve(service, host, port, prefix=""):
+    """Serve `service` on host:port until interrupted."""
+    server = ThreadingHTTPServer((host, port), make_handler(service, prefix))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,250 @@
+"""
+Nearest-place engine
+Batched k-nearest and within-radius queries over every destination
+(data.json) and food place (food_places.json).
+
+Coordinates live in contiguous NumPy arrays and are indexed once with a
+scipy cKDTree built on unit-sphere (x, y, z) vectors. Straight-line (chord)
+distance on the sphere grows monotonically with great-circle distance, so
+the tree's Euclidean neighbours are exactly the haversine neighbours, and
+chord lengths convert back to kilometres in closed form. Queries accept
+many user locations at once and return NumPy arrays.
+
+Also serves GET /api/nearest for the pages and other clients:
+    python -m cityquest.nearest --port 5001
+"""
+
+import argparse
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from cityquest.datasets import EARTH_RADIUS_KM, load_destinations, load_food_places
+from cityquest.http_service import query_params, serve
+
+
+KINDS = ("destination", "food")
+DEFAULT_K = 5
+# Upper bounds so a single request can't ask for the whole world
+MAX_K = 100
+MAX_POINTS_PER_REQUEST = 1000
+
+
+def to_unit_vectors(lats, lons):
+    """(n, 3) float64 array of unit-sphere vectors for degree coordinates."""
+    lat = np.radians(np.asarray(lats, dtype=np.float64))
+    lon = np.radians(np.asarray(lons, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)))
+
+
+def chord_to_km(chord):
+    """Great-circle km for a chord length on the unit sphere."""
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.clip(np.asarray(chord) / 2, 0.0, 1.0))
+
+
+def km_to_chord(km):
+    """Unit-sphere chord length for a great-circle distance in km."""
+    return 2 * np.sin(np.minimum(np.asarray(km, dtype=np.float64), np.pi * EARTH_RADIUS_KM)
+                      / (2 * EARTH_RADIUS_KM))
+
+
+class GeoIndex:
+    """
+    KD-tree over a fixed set of (lat, lon) points.
+
+    `records` holds one dict per point (name, kind, ...) in the same order as
+    `lats`/`lons`; query results are indexes into it.
+    """
+
+    def __init__(self, lats, lons, records=None):
+        self.lats = np.ascontiguousarray(lats, dtype=np.float64)
+        self.lons = np.ascontiguousarray(lons, dtype=np.float64)
+        if self.lats.shape != self.lons.shape or self.lats.ndim != 1:
+            raise ValueError("lats and lons must be 1-D arrays of the same length")
+        self.records = records if records is not None else [{} for _ in range(len(self.lats))]
+        self.kinds = np.array([record.get("kind", "") for record in self.records])
+        self.tree = cKDTree(to_unit_vectors(self.lats, self.lons))
+
+    @classmethod
+    def from_site_data(cls):
+        """Index over every destination and food place that has coordinates."""
+        records, lats, lons = [], [], []
+        for kind, rows in (("destination", load_destinations()), ("food", load_food_places())):
+            for row in rows:
+                if row.get("latitude") is None or row.get("longitude") is None:
+                    continue
+                records.append({"name": row["name"], "kind": kind})
+                lats.append(row["latitude"])
+                lons.append(row["longitude"])
+        return cls(lats, lons, records)
+
+    def __len__(self):
+        return len(self.lats)
+
+    def nearest(self, lats, lons, k=DEFAULT_K, kind=None):
+        """
+        The k nearest points to each query location.
+
+        Args:
+            lats, lons: Query coordinates in degrees (scalars or 1-D arrays)
+            k: Neighbours per query
+            kind: Only consider points of this kind ('destination' or 'food')
+
+        Returns:
+            tuple: (km, indexes), both shaped (queries, k) and sorted nearest
+                first. Missing neighbours (fewer than k points) have km=inf
+                and index=len(self).
+        """
+        queries = to_unit_vectors(np.atleast_1d(lats), np.atleast_1d(lons))
+        k = max(1, min(int(k), len(self)))
+        if kind is None:
+            chords, indexes = self.tree.query(queries, k=k, workers=-1)
+            chords, indexes = chords.reshape(len(queries), k), indexes.reshape(len(queries), k)
+        else:
+            chords, indexes = self._nearest_of_kind(queries, k, kind)
+        return chord_to_km(chords), indexes
+
+    def within_radius(self, lats, lons, radius_km, kind=None):
+        """
+        Every point within `radius_km` of each query location.
+
+        Returns:
+            list: One (km, indexes) pair of 1-D arrays per query, nearest first
+        """
+        lat_array, lon_array = np.atleast_1d(lats), np.atleast_1d(lons)
+        queries = to_unit_vectors(lat_array, lon_array)
+        candidates = self.tree.query_ball_point(queries, r=float(km_to_chord(radius_km)), workers=-1)
+        results = []
+        for query, found in zip(queries, candidates):
+            found = np.asarray(found, dtype=np.intp)
+            if kind is not None:
+                found = found[self.kinds[found] == kind]
+            chords = np.linalg.norm(self.tree.data[found] - query, axis=1)
+            order = np.argsort(chords, kind="stable")
+            results.append((chord_to_km(chords[order]), found[order]))
+        return results
+
+    def _nearest_of_kind(self, queries, k, kind):
+        # Ask for more neighbours until every query has k of the right kind
+        # (or the whole index has been searched), then keep the first k.
+        wanted = int(np.count_nonzero(self.kinds == kind))
+        if wanted == 0:
+            return np.full((len(queries), 0), np.inf), np.full((len(queries), 0), len(self), dtype=np.intp)
+        k = min(k, wanted)
+        fetch = min(len(self), k * 2)
+        while True:
+            chords, indexes = self.tree.query(queries, k=fetch, workers=-1)
+            chords, indexes = chords.reshape(len(queries), fetch), indexes.reshape(len(queries), fetch)
+            valid = indexes < len(self)
+            matches = np.zeros_like(valid)
+            matches[valid] = self.kinds[indexes[valid]] == kind
+            if fetch == len(self) or matches.sum(axis=1).min() >= k:
+                break
+            fetch = min(len(self), fetch * 2)
+        out_chords = np.full((len(queries), k), np.inf)
+        out_indexes = np.full((len(queries), k), len(self), dtype=np.intp)
+        for row in range(len(queries)):
+            columns = np.flatnonzero(matches[row])[:k]
+            out_chords[row, :len(columns)] = chords[row, columns]
+            out_indexes[row, :len(columns)] = indexes[row, columns]
+        return out_chords, out_indexes
+
+
+class NearestService:
+    """Turns /api/nearest requests into JSON responses from a GeoIndex."""
+
+    def __init__(self, index=None):
+        self.index = index if index is not None else GeoIndex.from_site_data()
+
+    def handle(self, path, query=""):
+        """
+        Answer one request.
+
+        Args:
+            path: Request path below the service root, i.e. '/nearest'
+            query: Raw query string, e.g.
+                'points=17.44,78.38;17.36,78.47&k=5&kind=food' or
+                'points=17.44,78.38&radius_km=2' (k still caps each result)
+
+        Returns:
+            tuple: (HTTP status, JSON-serialisable response dict)
+        """
+        if path.rstrip("/") != "/nearest":
+            return 404, {"code": "NotFound", "message": f"Unknown endpoint: {path}"}
+        try:
+            return 200, self.nearest(**self._parse_params(query_params(query)))
+        except ValueError as err:
+            return 400, {"code": "InvalidQuery", "message": str(err)}
+
+    def nearest(self, lats, lons, k=DEFAULT_K, radius_km=None, kind=None):
+        """Response body for a batch of query locations."""
+        if radius_km is None:
+            km, indexes = self.index.nearest(lats, lons, k=k, kind=kind)
+            matches = [(row_km[row_km != np.inf], row_indexes[row_km != np.inf])
+                       for row_km, row_indexes in zip(km, indexes)]
+        else:
+            matches = [(row_km[:k], row_indexes[:k]) for row_km, row_indexes
+                       in self.index.within_radius(lats, lons, radius_km, kind=kind)]
+        return {
+            "code": "Ok",
+            "results": [
+                {
+                    "location": [float(lat), float(lon)],
+                    "places": [
+                        {**self.index.records[i], "distance_km": round(float(d), 3)}
+                        for d, i in zip(row_km, row_indexes)
+                    ],
+                }
+                for lat, lon, (row_km, row_indexes) in zip(lats, lons, matches)
+            ],
+        }
+
+    @staticmethod
+    def _parse_params(params):
+        if not params.get("points"):
+            raise ValueError("points is required, e.g. points=17.44,78.38;17.36,78.47")
+        lats, lons = [], []
+        for pair in params["points"].split(";"):
+            try:
+                lat, lon = (float(value) for value in pair.split(","))
+            except ValueError:
+                raise ValueError(f"Invalid point: {pair}") from None
+            if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+                raise ValueError(f"Point out of range: {pair}")
+            lats.append(lat)
+            lons.append(lon)
+        if len(lats) > MAX_POINTS_PER_REQUEST:
+            raise ValueError(f"At most {MAX_POINTS_PER_REQUEST} points per request")
+
+        parsed = {"lats": lats, "lons": lons}
+        try:
+            parsed["k"] = int(params.get("k", DEFAULT_K))
+            if "radius_km" in params:
+                parsed["radius_km"] = float(params["radius_km"])
+        except ValueError:
+            raise ValueError("k must be an integer and radius_km a number") from None
+        if not 1 <= parsed["k"] <= MAX_K:
+            raise ValueError(f"k must be between 1 and {MAX_K}")
+        if parsed.get("radius_km", 0) < 0:
+            raise ValueError("radius_km must not be negative")
+        if "kind" in params:
+            if params["kind"] not in KINDS:
+                raise ValueError(f"kind must be one of: {', '.join(KINDS)}")
+            parsed["kind"] = params["kind"]
+        return parsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Nearest places API (GET /api/nearest)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5001)
+    args = parser.parse_args(argv)
+
+    service = NearestService()
+    print(f"Nearest places API ({len(service.index)} points) on http://{args.host}:{args.port}/api/nearest")
+    serve(service, args.host, args.port, prefix="/api")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,330 @@
+"""
+Local OSRM stand-in
+Answers the two OSRM endpoints the site uses,
+
+    /route/v1/driving/{lon},{lat};{lon},{lat}
+    /table/v1/driving/{lon},{lat};...?sources=..&destinations=..&annotations=..
+
+from a road-distance matrix precomputed over every coordinate in data.json
+and food_places.json, so CI and on-prem deployments never depend on the
+public router.project-osrm.org.
+
+There is no road network offline, so "road" distance is the great-circle
+distance scaled by a circuity factor. Coordinates outside the datasets (the
+user's location, for instance) fall back to computing the same estimate on
+the fly. Alternatively the service can forward to a real OSRM upstream, with
+a RouteCache in front so repeat requests from the same neighbourhood never
+reach it; GET /stats reports the cache hit and miss counters.
+
+Run standalone with:
+    python -m cityquest.routing --port 5000 [--upstream https://router.project-osrm.org]
+and point the page at it via routingBaseUrl in Devops/config.js.
+"""
+
+import argparse
+import json
+import threading
+import time
+import urllib.request
+from collections import OrderedDict
+
+from cityquest.datasets import haversine_km, load_destinations, load_food_places
+from cityquest.http_service import query_params, serve
+
+
+# Typical ratio of driving distance to straight-line distance in a city
+CIRCUITY_FACTOR = 1.3
+# Average urban driving speed used to derive durations
+AVERAGE_SPEED_MPS = 25 / 3.6
+# Coordinates are matched against the matrix at this many decimals
+COORDINATE_PRECISION = 6
+
+SUPPORTED_PROFILES = ("driving", "car")
+
+
+class OsrmError(Exception):
+    """An error reported to the client the way OSRM does ({code, message})."""
+
+    def __init__(self, code, message, status=400):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.status = status
+
+
+def estimate_road_meters(lat1, lon1, lat2, lon2):
+    """Road distance estimate in metres between two points."""
+    return haversine_km(lat1, lon1, lat2, lon2) * 1000 * CIRCUITY_FACTOR
+
+
+class RoadDistanceMatrix:
+    """
+    All-pairs road distances (metres) between a fixed set of points.
+
+    Lookups between two known points are a dict hit plus a list index;
+    anything else is computed on the fly with the same estimate.
+    """
+
+    def __init__(self, points):
+        self.points = []
+        self._index = {}
+        for lat, lon in points:
+            key = self._key(lat, lon)
+            if key not in self._index:
+                self._index[key] = len(self.points)
+                self.points.append((lat, lon))
+        self.meters = [
+            [estimate_road_meters(lat1, lon1, lat2, lon2) for lat2, lon2 in self.points]
+            for lat1, lon1 in self.points
+        ]
+
+    @classmethod
+    def from_site_data(cls):
+        """Matrix over every destination and food place coordinate."""
+        rows = load_destinations() + load_food_places()
+        return cls((row["latitude"], row["longitude"]) for row in rows
+                   if row.get("latitude") is not None and row.get("longitude") is not None)
+
+    def distance_m(self, origin, destination):
+        """Road distance between two (lat, lon) points in metres."""
+        i = self._index.get(self._key(*origin))
+        j = self._index.get(self._key(*destination))
+        if i is not None and j is not None:
+            return self.meters[i][j]
+        return estimate_road_meters(origin[0], origin[1], destination[0], destination[1])
+
+    def __len__(self):
+        return len(self.points)
+
+    @staticmethod
+    def _key(lat, lon):
+        return (round(lat, COORDINATE_PRECISION), round(lon, COORDINATE_PRECISION))
+
+
+class UpstreamRouter:
+    """Backend that asks a real OSRM server for each road distance."""
+
+    def __init__(self, base_url, profile="driving", timeout=10):
+        self.base_url = base_url.rstrip("/")
+        self.profile = profile
+        self.timeout = timeout
+
+    def distance_m(self, origin, destination):
+        url = (f"{self.base_url}/route/v1/{self.profile}/"
+               f"{origin[1]},{origin[0]};{destination[1]},{destination[0]}?overview=false")
+        try:
+            with urllib.request.urlopen(url, timeout=self.timeout) as response:
+                data = json.load(response)
+        except OSError as err:
+            raise OsrmError("NoRoute", f"Upstream routing failed: {err}", status=502) from None
+        if data.get("code") != "Ok" or not data.get("routes"):
+            raise OsrmError("NoRoute", "Impossible route between points")
+        return data["routes"][0]["distance"]
+
+
+class RouteCache:
+    """
+    LRU + TTL cache of road distances in front of another backend.
+
+    Keys are (origin snapped to a grid of `grid_degrees`, exact destination,
+    mode), so requests from anywhere in the same cell share one answer.
+    """
+
+    def __init__(self, backend, grid_degrees=0.005, max_entries=10000, ttl_seconds=86400,
+                 mode="driving", clock=time.monotonic):
+        self.backend = backend
+        self.grid_degrees = grid_degrees
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.mode = mode
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (meters, stored_at), oldest first
+        self._lock = threading.Lock()
+
+    def key(self, origin, destination):
+        cell = (round(origin[0] / self.grid_degrees), round(origin[1] / self.grid_degrees))
+        return cell, RoadDistanceMatrix._key(*destination), self.mode
+
+    def distance_m(self, origin, destination):
+        key = self.key(origin, destination)
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[1] <= self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        meters = self.backend.distance_m(origin, destination)
+        with self._lock:
+            self._entries[key] = (meters, now)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return meters
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class OsrmStandIn:
+    """Turns OSRM-style request paths into OSRM-style JSON responses."""
+
+    def __init__(self, backend=None):
+        # Anything with distance_m(origin, destination): a RoadDistanceMatrix,
+        # an UpstreamRouter, or a RouteCache wrapping either
+        self.backend = backend if backend is not None else RoadDistanceMatrix.from_site_data()
+
+    def handle(self, path, query=""):
+        """
+        Answer one request.
+
+        Args:
+            path: Request path below the service root, e.g.
+                '/route/v1/driving/78.37,17.44;78.40,17.38'
+            query: Raw query string, e.g. 'overview=false'
+
+        Returns:
+            tuple: (HTTP status, JSON-serialisable response dict)
+        """
+        if path.rstrip("/") == "/stats":
+            stats = getattr(self.backend, "stats", None)
+            return 200, {"code": "Ok", "cache": stats() if stats else None}
+        try:
+            service, coordinates = self._parse_path(path)
+            params = query_params(query)
+            if service == "route":
+                return 200, self.route(coordinates)
+            return 200, self.table(coordinates, params)
+        except OsrmError as err:
+            return err.status, {"code": err.code, "message": err.message}
+
+    def route(self, coordinates):
+        """Response for /route: a single route through all waypoints."""
+        legs = []
+        for origin, destination in zip(coordinates, coordinates[1:]):
+            distance = self.backend.distance_m(origin, destination)
+            duration = distance / AVERAGE_SPEED_MPS
+            legs.append({
+                "distance": round(distance, 1),
+                "duration": round(duration, 1),
+                "weight": round(duration, 1),
+                "summary": "",
+                "steps": [],
+            })
+        distance = sum(leg["distance"] for leg in legs)
+        duration = sum(leg["duration"] for leg in legs)
+        return {
+            "code": "Ok",
+            "routes": [{
+                "distance": round(distance, 1),
+                "duration": round(duration, 1),
+                "weight": round(duration, 1),
+                "weight_name": "routability",
+                "legs": legs,
+            }],
+            "waypoints": [self._waypoint(point) for point in coordinates],
+        }
+
+    def table(self, coordinates, params):
+        """Response for /table: distances/durations between sources and destinations."""
+        sources = self._parse_indexes(params.get("sources", "all"), len(coordinates), "sources")
+        destinations = self._parse_indexes(
+            params.get("destinations", "all"), len(coordinates), "destinations"
+        )
+        annotations = params.get("annotations", "duration").split(",")
+        if not set(annotations) <= {"distance", "duration"}:
+            raise OsrmError("InvalidOptions", "annotations must be distance and/or duration")
+
+        distances = [
+            [round(self.backend.distance_m(coordinates[i], coordinates[j]), 1) for j in destinations]
+            for i in sources
+        ]
+        response = {
+            "code": "Ok",
+            "sources": [self._waypoint(coordinates[i]) for i in sources],
+            "destinations": [self._waypoint(coordinates[j]) for j in destinations],
+        }
+        if "distance" in annotations:
+            response["distances"] = distances
+        if "duration" in annotations:
+            response["durations"] = [
+                [round(distance / AVERAGE_SPEED_MPS, 1) for distance in row] for row in distances
+            ]
+        return response
+
+    @staticmethod
+    def _parse_path(path):
+        parts = path.strip("/").split("/")
+        if len(parts) != 4 or parts[1] != "v1":
+            raise OsrmError("InvalidUrl", f"URL string malformed: {path}")
+        service, _, profile, coordinate_text = parts
+        if service not in ("route", "table"):
+            raise OsrmError("InvalidService", f"Service {service} not found!")
+        if profile not in SUPPORTED_PROFILES:
+            raise OsrmError("InvalidUrl", f"Profile {profile} not supported")
+
+        coordinates = []
+        for pair in coordinate_text.split(";"):
+            try:
+                lon, lat = (float(value) for value in pair.split(","))
+            except ValueError:
+                raise OsrmError("InvalidUrl", f"Invalid coordinate: {pair}") from None
+            if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+                raise OsrmError("InvalidValue", f"Coordinate out of range: {pair}")
+            coordinates.append((lat, lon))
+        if len(coordinates) < 2 and service == "route":
+            raise OsrmError("InvalidValue", "At least two coordinates are required")
+        return service, coordinates
+
+    @staticmethod
+    def _parse_indexes(text, count, name):
+        if text == "all":
+            return list(range(count))
+        try:
+            indexes = [int(value) for value in text.split(";")]
+        except ValueError:
+            raise OsrmError("InvalidQuery", f"Invalid {name}: {text}") from None
+        if any(index < 0 or index >= count for index in indexes):
+            raise OsrmError("InvalidOptions", f"{name} index out of range")
+        return indexes
+
+    @staticmethod
+    def _waypoint(point):
+        lat, lon = point
+        return {"location": [lon, lat], "name": "", "distance": 0, "hint": ""}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local OSRM-compatible routing stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--upstream", help="Forward to this OSRM server instead of the local matrix")
+    parser.add_argument("--cache-grid", type=float, default=0.005,
+                        help="Origin grid cell size in degrees for the route cache")
+    parser.add_argument("--cache-size", type=int, default=10000)
+    parser.add_argument("--cache-ttl", type=float, default=86400, help="Seconds")
+    args = parser.parse_args(argv)
+
+    backend = UpstreamRouter(args.upstream) if args.upstream else RoadDistanceMatrix.from_site_data()
+    cache = RouteCache(backend, grid_degrees=args.cache_grid, max_entries=args.cache_size,
+                       ttl_seconds=args.cache_ttl)
+    source = args.upstream or f"{len(backend)} precomputed points"
+    print(f"Routing stand-in ({source}) on http://{args.host}:{args.port}")
+    serve(OsrmStandIn(cache), args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
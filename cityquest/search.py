@@ -0,0 +1,117 @@
+"""
+Search index (reference implementation)
+Full-text and prefix search over the text fields both pages show. The build
+emits one index per page as Devops/generated/search-index-<page>.json
+and Devops/search-index.js queries it as the user types; this module builds it
+and answers queries the same way for tests and benchmarks.
+
+Index layout, per page:
+
+    terms     every indexed term, sorted. The terms starting with a prefix
+              form one contiguous run, found by two binary searches - the
+              lookups of a prefix trie without a node per character.
+    counts    postings per term, in term order
+    postings  flat [record, weight, record, weight, ...] for all terms in
+              term order; record is the position in the page's dataset
+
+A term's weight in a record is the sum of SEARCH_FIELDS weights of the
+fields it appears in, so a dish or name match outranks a description match.
+"""
+
+import re
+import unicodedata
+from bisect import bisect_left
+
+
+# Indexed fields and their weights; fields a dataset lacks are skipped
+SEARCH_FIELDS = {
+    "name": 8,
+    "special_dishes": 4,
+    "area": 2,
+    "nearest_metro_station": 2,
+    "description": 1,
+}
+
+# Shorter terms aren't indexed; a one-letter query still prefix-matches
+MIN_TERM_LENGTH = 2
+
+_SPLIT = re.compile(r"[^a-z0-9]+")
+
+
+def tokenize(text):
+    """
+    Lower-case ASCII words of `text`, accents removed.
+
+    >>> tokenize("Double Ka Meetha, Qubani-ka-Meetha")
+    ['double', 'ka', 'meetha', 'qubani', 'ka', 'meetha']
+    """
+    text = text.lower()
+    if not text.isascii():
+        text = "".join(ch for ch in unicodedata.normalize("NFKD", text) if not unicodedata.combining(ch))
+    return [token for token in _SPLIT.split(text) if token]
+
+
+def _field_text(value):
+    if isinstance(value, list):
+        return " ".join(str(item) for item in value)
+    return value if isinstance(value, str) else ""
+
+
+def build_search_index(records):
+    """Search index section (terms, counts, postings) for one page's records."""
+    weights = {}
+    for position, record in enumerate(records):
+        for field, field_weight in SEARCH_FIELDS.items():
+            for term in set(tokenize(_field_text(record.get(field)))):
+                if len(term) >= MIN_TERM_LENGTH:
+                    per_term = weights.setdefault(term, {})
+                    per_term[position] = per_term.get(position, 0) + field_weight
+
+    terms = sorted(weights)
+    postings = []
+    for term in terms:
+        for position, weight in sorted(weights[term].items()):
+            postings += (position, weight)
+    return {"terms": terms, "counts": [len(weights[term]) for term in terms], "postings": postings}
+
+
+class SearchIndex:
+    """Queries a section built by build_search_index()."""
+
+    def __init__(self, section):
+        self.terms = section["terms"]
+        self.postings = section["postings"]
+        self.offsets = [0]
+        for count in section["counts"]:
+            self.offsets.append(self.offsets[-1] + count)
+
+    def prefix_range(self, prefix):
+        """Indexes [start, end) of the terms starting with `prefix`."""
+        return bisect_left(self.terms, prefix), bisect_left(self.terms, prefix + "\uffff")
+
+    def search(self, text):
+        """
+        Records matching every word of `text`, best first.
+
+        Each word matches the terms it is a prefix of; an exact term match
+        counts double. A record scores, per word, its best matching term's
+        weight. Ties keep dataset order.
+
+        Returns:
+            list: Record positions, or None if `text` has no words
+        """
+        tokens = tokenize(text)
+        if not tokens:
+            return None
+        scores = None
+        for token in tokens:
+            best = {}
+            start, end = self.prefix_range(token)
+            for term_index in range(start, end):
+                boost = 2 if self.terms[term_index] == token else 1
+                for i in range(self.offsets[term_index] * 2, self.offsets[term_index + 1] * 2, 2):
+                    position, weight = self.postings[i], self.postings[i + 1] * boost
+                    if (scores is None or position in scores) and weight > best.get(position, 0):
+                        best[position] = weight
+            scores = {position: (scores[position] if scores else 0) + weight for position, weight in best.items()}
+        return sorted(scores, key=lambda position: (-scores[position], position))
@@ -0,0 +1,4 @@
+"""
+Backend Test Suites
+Tests for the Python services and build steps in the cityquest package
+"""
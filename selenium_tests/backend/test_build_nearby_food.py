@@ -0,0 +1,104 @@
+"""
+Nearby Food Build Tests 🍽️
+Tests for the destination -> food place spatial join build step.
+"""
+
+import copy
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+from cityquest.build import BuildError, read_json
+from cityquest.build import nearby_food
+from cityquest.build.compile_datasets import compile_destinations, compile_food_places
+from cityquest.classification import cuisine_group
+from cityquest.datasets import haversine_km, load_destinations, load_food_places
+
+
+def _compiled():
+    return compile_destinations(load_destinations()), compile_food_places(load_food_places())
+
+
+def _names(artifact, destination):
+    return [artifact["food"][row][0] for row, _ in artifact["nearby"][destination["id"]]]
+
+
+def test_join_matches_brute_force():
+    """
+    Join Test 1: every destination lists its k nearest food places with
+    distance, budget and cuisine group.
+    """
+    destinations, food = _compiled()
+    artifact, _, recomputed = nearby_food.build(destinations, food, k=5)
+
+    assert recomputed == len(destinations)
+    for destination in destinations:
+        ranked = sorted(food, key=lambda p: haversine_km(
+            destination["latitude"], destination["longitude"], p["latitude"], p["longitude"]))[:5]
+        pairs = artifact["nearby"][destination["id"]]
+        assert sorted(_names(artifact, destination)) == sorted(p["name"] for p in ranked)
+        for row, km in pairs:
+            name, budget, group = artifact["food"][row]
+            place = next(p for p in food if p["name"] == name)
+            assert budget == place["max_budget_for_one"]
+            assert group == cuisine_group(place["place_type"])
+            assert km == round(haversine_km(destination["latitude"], destination["longitude"],
+                                            place["latitude"], place["longitude"]), 2)
+
+    print(f"✅ Spatial join test passed - {len(destinations)} destinations")
+
+
+def test_incremental_rebuild_matches_full_build():
+    """
+    Join Test 2: after moving, adding and removing food places, an
+    incremental build recomputes only some destinations and matches a full one.
+    """
+    destinations, food = _compiled()
+    _, state, _ = nearby_food.build(destinations, food)
+
+    changed = copy.deepcopy(food)
+    changed[3]["latitude"] += 0.02
+    changed.append(dict(changed[0], id="new-biryani-point", name="New Biryani Point", latitude=17.39, longitude=78.47))
+    del changed[10]
+    incremental, _, recomputed = nearby_food.build(destinations, changed, previous_state=state)
+    full, _, _ = nearby_food.build(destinations, changed)
+
+    assert incremental == full
+    assert 0 < recomputed < len(destinations)
+
+    _, _, untouched = nearby_food.build(destinations, food, previous_state=state)
+    assert untouched == 0
+
+    print(f"✅ Incremental build test passed - {recomputed} destinations recomputed")
+
+
+def test_unusable_rows_fail_loudly():
+    """
+    Join Test 3: duplicate ids and missing coordinates stop the build.
+    """
+    destinations, food = _compiled()
+
+    with pytest.raises(BuildError, match="duplicate id"):
+        nearby_food.build(destinations + destinations[:1], food)
+    broken = copy.deepcopy(food)
+    broken[0]["latitude"] = None
+    with pytest.raises(BuildError, match="latitude"):
+        nearby_food.build(destinations, broken)
+
+    print("✅ Build validation test passed")
+
+
+def test_committed_artifact_is_current():
+    """
+    Join Test 4: Devops/generated/nearby-food.json matches the datasets.
+    Run `python -m cityquest.build` after editing data.json or food_places.json.
+    """
+    artifact, _, _ = nearby_food.build(*_compiled())
+
+    assert read_json(nearby_food.OUTPUT_PATH) == artifact
+
+    print("✅ Generated artifact is up to date")
+
+
+if __name__ == "__main__":
+    print("Run tests using: pytest backend/test_build_nearby_food.py -v")
@@ -0,0 +1,98 @@
+"""
+Classification Table Tests 🗂️
+Tests that the generated classification table keeps the filter semantics the
+pages had when each one matched place types against its own copy of the
+groupings with substring checks.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+from cityquest.classification import CUISINE_GROUPS, TYPE_GROUPS, classification_table
+from cityquest.datasets import load_destinations, load_food_places
+
+
+# The pages' original rules, transcribed from the old script.js / food-script.js
+
+def _legacy_type_options(place_types):
+    options = set()
+    for place_type in place_types:
+        for part in (t.strip() for t in place_type.split(",")):
+            options.add(next((group for group, members in TYPE_GROUPS.items() if part in members), part))
+    return sorted(options)
+
+
+def _legacy_type_match(place_type, selected):
+    types = [t.strip() for t in place_type.split(",")]
+    if selected in TYPE_GROUPS:
+        return any(t in TYPE_GROUPS[selected] for t in types)
+    return selected in types
+
+
+def _legacy_cuisine_options(place_types):
+    options = set()
+    for place_type in place_types:
+        clean = place_type.replace("Restaurant - ", "", 1).strip()
+        options.add(next((group for group, members in CUISINE_GROUPS.items()
+                          if any(clean == m or m in clean or clean in m for m in members)), clean))
+    return sorted(options)
+
+
+def _legacy_cuisine_match(place_type, selected):
+    clean = place_type.replace("Restaurant - ", "", 1).strip()
+    if selected in CUISINE_GROUPS:
+        return any(clean == m or m in clean or clean in m for m in CUISINE_GROUPS[selected])
+    return selected in clean or clean in selected
+
+
+def _table():
+    return classification_table(
+        [d["place_type"] for d in load_destinations()],
+        [p["place_type"] for p in load_food_places()],
+    )
+
+
+def test_options_match_legacy_pages():
+    """
+    Classification Test 1: both pages offer the same filter options as before.
+    """
+    table = _table()
+    assert table["destinations"]["options"] == _legacy_type_options(table["destinations"]["groups"])
+    assert table["food"]["options"] == _legacy_cuisine_options(table["food"]["groups"])
+    print(f"✅ Options test passed - {len(table['destinations']['options'])} types, "
+          f"{len(table['food']['options'])} cuisines")
+
+
+def test_lookups_match_legacy_substring_semantics():
+    """
+    Classification Test 2: for every raw place_type and every option, the
+    table lookup agrees with the old per-click substring matching, including
+    the loose cuisine matches (e.g. Street Food / Chaat under Quick Bites).
+    """
+    table = _table()
+    for section, legacy_match in (("destinations", _legacy_type_match), ("food", _legacy_cuisine_match)):
+        options, groups = table[section]["options"], table[section]["groups"]
+        for place_type, labels in groups.items():
+            expected = [option for option in options if legacy_match(place_type, option)]
+            assert labels == expected, (section, place_type)
+
+    assert "Street Food - Quick Bites" in table["food"]["groups"]["Street Food / Chaat"]
+    print("✅ Legacy substring semantics test passed")
+
+
+def test_table_covers_every_place_type():
+    """
+    Classification Test 3: every record's place_type has an entry, and every
+    option matches at least one place.
+    """
+    table = _table()
+    for section, rows in (("destinations", load_destinations()), ("food", load_food_places())):
+        groups = table[section]["groups"]
+        assert {row["place_type"] for row in rows} == set(groups)
+        matched = {label for labels in groups.values() for label in labels}
+        assert matched == set(table[section]["options"]), section
+    print("✅ Coverage test passed")
+
+
+if __name__ == "__main__":
+    print("Run tests using: pytest backend/test_classification.py -v")
@@ -0,0 +1,87 @@
+"""
+Compiled Dataset Tests 🧾
+Tests for the build step that normalizes data.json and food_places.json.
+"""
+
+import copy
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+from cityquest.build import BuildError, read_json, read_ndjson
+from cityquest.build.compile_datasets import (
+    CLASSIFICATION_OUTPUTS, FOOD_PLACES_STREAM_OUTPUT,
+    compile_classification, compile_destinations, compile_food_places, parse_entry_fee,
+)
+from cityquest.datasets import load_destinations, load_food_places
+
+
+@pytest.mark.parametrize("text, fees", [
+    ("₹25 (Indians), ₹300 (Foreigners)", {"Indians": 25, "Foreigners": 300}),
+    ("Starting from ₹1261 (Adult), ₹1009 (Child)", {"Adult": 1261, "Child": 1009}),
+    ("Starting from ₹125 per student", {"Student": 125}),
+    ("₹20", {"General": 20}),
+    ("Free", {"General": 0}),
+])
+def test_entry_fees_parse_per_visitor_category(text, fees):
+    """
+    Compile Test 1: entry_fee strings become integer fees per visitor category.
+    """
+    assert parse_entry_fee(text) == fees
+
+
+def test_compiled_records_are_normalized():
+    """
+    Compile Test 2: ids, headline fees, budgets and type lists are precomputed.
+    """
+    destinations = compile_destinations(load_destinations())
+    golconda = destinations[0]
+    assert golconda["id"] == "golconda-fort"
+    assert golconda["fee"] == 25
+    assert golconda["types"] == ["Fort", "Monument", "Heritage"]
+    assert len({d["id"] for d in destinations}) == len(destinations)
+
+    food = compile_food_places(load_food_places())
+    chaat = next(p for p in food if p["place_type"] == "Street Food / Chaat")
+    assert isinstance(chaat["budget"], int)
+
+    print(f"✅ Normalized records test passed - {len(destinations)} destinations, {len(food)} food places")
+
+
+def test_unparseable_rows_fail_loudly():
+    """
+    Compile Test 3: bad fees, budgets and clashing ids name the offending row.
+    """
+    destinations = copy.deepcopy(load_destinations())
+    destinations[2]["entry_fee"] = "Ask at the gate"
+    with pytest.raises(BuildError, match=r"data.json row 3 .*entry_fee"):
+        compile_destinations(destinations)
+
+    food = copy.deepcopy(load_food_places())
+    food[0]["max_budget_for_one"] = "about 300"
+    with pytest.raises(BuildError, match="food_places.json row 1"):
+        compile_food_places(food)
+
+    clash = copy.deepcopy(load_destinations())
+    clash[1]["name"] = clash[0]["name"].upper()
+    with pytest.raises(BuildError, match="golconda-fort"):
+        compile_destinations(clash)
+
+    print("✅ Compile validation test passed")
+
+
+def test_committed_artifacts_are_current():
+    """
+    Compile Test 4: Devops/generated/ matches the datasets.
+    Run `python -m cityquest.build` after editing data.json or food_places.json.
+    """
+    assert read_ndjson(FOOD_PLACES_STREAM_OUTPUT) == compile_food_places(load_food_places())
+    classification = compile_classification(load_destinations(), load_food_places())
+    for page, path in CLASSIFICATION_OUTPUTS.items():
+        assert read_json(path) == classification[page], path
+
+    print("✅ Compiled datasets are up to date")
+
+
+if __name__ == "__main__":
+    print("Run tests using: pytest backend/test_compile_datasets.py -v")
@@ -0,0 +1,82 @@
+"""
+Destination Payload Tests 📦
+Tests for the build step that splits destinations into a slim list payload
+and detail chunks fetched on demand.
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(__file__))
+from cityquest.build import nearby_food, read_json, read_ndjson
+from cityquest.build.compile_datasets import compile_destinations
+from cityquest.build.destination_payloads import (
+    DETAIL_FIELDS, LIST_FIELDS, LIST_STREAM_OUTPUT, build, chunk_path, stream_lines,
+)
+from cityquest.datasets import DESTINATIONS_PATH, load_destinations
+
+
+def test_list_payload_is_a_tenth_of_data_json():
+    """
+    Payload Test 1: the list the places page loads up front is at most a
+    tenth of data.json, byte for byte.
+    """
+    budget = os.path.getsize(DESTINATIONS_PATH) / 10
+    size = os.path.getsize(LIST_STREAM_OUTPUT)
+    assert size <= budget, f"{os.path.basename(LIST_STREAM_OUTPUT)} is {size} bytes, budget {budget:.0f}"
+
+    print(f"✅ List payload budget test passed - {size} bytes (budget {budget:.0f})")
+
+
+def test_list_and_details_hold_every_field():
+    """
+    Payload Test 2: a record's list row plus its detail entry give back its
+    fields, and the details carry its nearest food places from the join.
+    """
+    destinations = compile_destinations(load_destinations())
+    artifact = read_json(nearby_food.OUTPUT_PATH)
+    listing, chunks = build(destinations, artifact, chunk_size=3)
+
+    assert len(chunks) == (len(destinations) + 2) // 3
+    for position, record in enumerate(destinations):
+        row = dict(zip(listing["fields"], listing["rows"][position]))
+        detail = chunks[position // 3][position % 3]
+        assert row == {field: record[field] for field in LIST_FIELDS}
+        assert {field: detail[field] for field in DETAIL_FIELDS} == {field: record[field] for field in DETAIL_FIELDS}
+        expected = [artifact["food"][food_row] + [km] for food_row, km in artifact["nearby"][record["id"]]]
+        assert detail["nearby_food"] == expected
+
+    print(f"✅ List/detail split test passed - {len(destinations)} destinations")
+
+
+def test_committed_payloads_are_current():
+    """
+    Payload Test 3: Devops/generated/ holds the payloads for the datasets.
+    Run `python -m cityquest.build` after editing data.json.
+    """
+    listing, chunks = build(compile_destinations(load_destinations()), read_json(nearby_food.OUTPUT_PATH))
+    assert read_ndjson(LIST_STREAM_OUTPUT) == stream_lines(listing)
+    for chunk, details in enumerate(chunks):
+        assert read_json(chunk_path(chunk)) == details
+    assert not os.path.exists(chunk_path(len(chunks)))
+
+    print(f"✅ Payloads are up to date - {len(chunks)} detail chunks")
+
+
+def test_streamed_list_matches_the_list_payload():
+    """
+    Payload Test 4: the streamed list is a header with the fields and chunk
+    size, then the list rows in order, one per line.
+    """
+    listing, _ = build(compile_destinations(load_destinations()))
+    header, *rows = stream_lines(listing)
+
+    assert header == {"fields": LIST_FIELDS, "chunkSize": listing["chunkSize"]}
+    assert rows == listing["rows"]
+    with open(LIST_STREAM_OUTPUT, encoding="utf-8") as f:
+        assert sum(1 for line in f) == len(listing["rows"]) + 1
+
+    print(f"✅ Streamed list test passed - {len(rows)} rows")
+
+
+if __name__ == "__main__":
+    print("Run tests using: pytest backend/test_destination_payloads.py -v")
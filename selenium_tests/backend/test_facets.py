@@ -0,0 +1,137 @@
+"""
+Facet Engine Tests 🧮
+Tests for the bitset facet engine the filter panels run on
+(cityquest/facets.py, mirrored by Devops/facet-engine.js).
+"""
+
+import random
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+from cityquest.facets import Facet, FacetIndex, bits_to_indexes
+
+
+def _facets():
+    return [
+        Facet("colour", {colour: (lambda c: lambda r: c in r["colours"])(colour)
+                         for colour in ("red", "green", "blue")}),
+        Facet("size", {"small": lambda r: r["size"] <= 3, "large": lambda r: r["size"] >= 3}),
+    ]
+
+
+def _records(count, seed=3):
+    rng = random.Random(seed)
+    return [
+        {"colours": rng.sample(["red", "green", "blue"], rng.randint(0, 2)), "size": rng.randint(1, 5)}
+        for _ in range(count)
+    ]
+
+
+def _brute_force(records, facets, selection, exclude=None):
+    options = {facet.name: facet.options for facet in facets}
+    return [
+        i for i, record in enumerate(records)
+        if all(any(options[name][value](record) for value in values)
+               for name, values in selection.items() if values and name != exclude)
+    ]
+
+
+def test_matches_equal_a_plain_scan():
+    """
+    Facet Test 1: OR within a facet and AND across facets matches a per-record scan.
+    """
+    records, facets = _records(1000), _facets()
+    index = FacetIndex(records, facets)
+    for selection in (
+        {},
+        {"colour": ["red"]},
+        {"colour": ["red", "blue"], "size": []},
+        {"colour": ["green"], "size": ["small", "large"]},
+        {"size": ["large"]},
+    ):
+        matches, _ = index.query(selection)
+        assert matches == _brute_force(records, facets, selection), selection
+
+    print("✅ Facet matches test passed")
+
+
+def test_counts_apply_every_other_facet():
+    """
+    Facet Test 2: each option's count is what ticking it alone in its facet
+    would show, with the other facets' selections applied.
+    """
+    records, facets = _records(500), _facets()
+    index = FacetIndex(records, facets)
+    selection = {"colour": ["red"], "size": ["small"]}
+    _, counts = index.query(selection)
+
+    for facet in facets:
+        for value in facet.options:
+            expected = _brute_force(records, facets, {**selection, facet.name: [value]})
+            assert counts[facet.name][value] == len(expected), (facet.name, value)
+
+    # An unticked colour's count is what ticking it (alone) would show
+    assert counts["colour"]["blue"] == len(_brute_force(records, facets, {"colour": ["blue"], "size": ["small"]}))
+    print("✅ Facet counts test passed")
+
+
+def test_rebuilding_a_facet_picks_up_changed_records():
+    """
+    Facet Test 3: rebuild_facet refreshes one facet after its inputs change.
+    """
+    records, facets = _records(100), _facets()
+    index = FacetIndex(records, facets)
+    for record in records:
+        record["size"] = 5
+    index.rebuild_facet("size")
+
+    matches, counts = index.query({"size": ["small"]})
+    assert matches == []
+    assert counts["size"] == {"small": 0, "large": 100}
+    print("✅ Facet rebuild test passed")
+
+
+def test_within_narrows_matches_and_counts():
+    """
+    Facet Test 4: `within` (e.g. search results) limits matches and counts.
+    """
+    records, facets = _records(300), _facets()
+    index = FacetIndex(records, facets)
+    allowed = list(range(0, 300, 3))
+    matches, counts = index.query({"colour": ["red"]}, within=index.bits_of(allowed))
+
+    assert matches == [i for i in _brute_force(records, facets, {"colour": ["red"]}) if i % 3 == 0]
+    assert counts["size"]["large"] == len([i for i in matches if records[i]["size"] >= 3])
+    print("✅ Facet within test passed")
+
+
+def test_appending_batches_equals_one_build():
+    """
+    Facet Test 5: records appended in batches, as a stream delivers them,
+    give the same bitsets as indexing them all at once.
+    """
+    records, facets = _records(1000), _facets()
+    streamed = FacetIndex([], facets)
+    for start in range(0, len(records), 77):
+        streamed.append(records[start:start + 77])
+    whole = FacetIndex(records, facets)
+
+    assert streamed.all_bits == whole.all_bits
+    assert streamed.bits == whole.bits
+    selection = {"colour": ["green", "blue"], "size": ["large"]}
+    assert streamed.query(selection) == whole.query(selection)
+    print("✅ Facet append test passed")
+
+
+def test_bits_to_indexes():
+    """
+    Facet Test 6: set bits come back as indexes, lowest first.
+    """
+    assert bits_to_indexes(0) == []
+    assert bits_to_indexes(0b1011) == [0, 1, 3]
+    assert bits_to_indexes(1 << 70 | 1 << 8) == [8, 70]
+    print("✅ Bits to indexes test passed")
+
+
+if __name__ == "__main__":
+    print("Run tests using: pytest test_facets.py -v")
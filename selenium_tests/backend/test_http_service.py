@@ -0,0 +1,75 @@
+"""
+JSON Service Tests 🔌
+Tests for the HTTP handler the routing stand-in and nearest API share.
+"""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+from cityquest.http_service import make_handler, query_params
+
+
+class EchoService:
+    """Answers /echo with its query and fails on /boom."""
+
+    def handle(self, path, query=""):
+        if path == "/boom":
+            raise RuntimeError("boom")
+        return 200, {"code": "Ok", "path": path, "params": query_params(query)}
+
+
+@pytest.fixture
+def echo_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(EchoService(), prefix="/api"))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _get(url):
+    try:
+        with urllib.request.urlopen(url) as response:
+            return response.status, response.headers, json.load(response)
+    except urllib.error.HTTPError as err:
+        return err.code, err.headers, json.load(err)
+
+
+def test_handler_answers_from_the_service(echo_url):
+    """
+    Service Test 1: requests under the prefix reach handle() without it, and
+    the JSON answer allows any origin.
+    """
+    status, headers, body = _get(f"{echo_url}/api/echo?k=3&k=5&kind=food")
+
+    assert status == 200
+    assert headers["Access-Control-Allow-Origin"] == "*"
+    assert body == {"code": "Ok", "path": "/echo", "params": {"k": "5", "kind": "food"}}
+
+    print("✅ Service handler test passed")
+
+
+def test_handler_reports_unknown_paths_and_failures(echo_url, capsys):
+    """
+    Service Test 2: paths outside the prefix get a JSON 404 and a failing
+    service a JSON 500, with the traceback logged.
+    """
+    status, _, body = _get(f"{echo_url}/echo")
+    assert status == 404 and body["code"] == "NotFound"
+
+    status, _, body = _get(f"{echo_url}/api/boom")
+    assert status == 500 and body["code"] == "InternalError"
+    assert "RuntimeError: boom" in capsys.readouterr().err
+
+    print("✅ Service error test passed")
+
+
+if __name__ == "__main__":
+    print("Run tests using: pytest backend/test_http_service.py -v")
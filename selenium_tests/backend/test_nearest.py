@@ -0,0 +1,101 @@
+"""
+Nearest Engine Tests 📍
+Tests for the KD-tree k-nearest / radius engine and the /api/nearest service.
+"""
+
+import numpy as np
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+from cityquest.datasets import haversine_km
+from cityquest.nearest import GeoIndex, NearestService
+from selenium_tests.helpers import HITEC_CITY
+
+CHARMINAR = (17.3616, 78.4747)
+
+
+def _brute_force(index, lat, lon, kind=None):
+    """(km, index) for every point, nearest first, the slow way."""
+    rows = [(haversine_km(lat, lon, index.lats[i], index.lons[i]), i) for i in range(len(index))
+            if kind is None or index.records[i]["kind"] == kind]
+    return sorted(rows)
+
+
+def test_knn_matches_haversine_for_many_locations():
+    """
+    Nearest Test 1: one batched query agrees with a per-point haversine scan.
+    """
+    index = GeoIndex.from_site_data()
+    lats = [HITEC_CITY["latitude"], CHARMINAR[0], 17.50]
+    lons = [HITEC_CITY["longitude"], CHARMINAR[1], 78.30]
+
+    km, indexes = index.nearest(lats, lons, k=5)
+
+    assert km.shape == indexes.shape == (3, 5)
+    for row, (lat, lon) in enumerate(zip(lats, lons)):
+        expected = [d for d, _ in _brute_force(index, lat, lon)[:5]]
+        assert np.allclose(km[row], expected)
+
+    print(f"✅ Batched k-nearest test passed - {len(index)} points")
+
+
+def test_kind_and_radius_filters():
+    """
+    Nearest Test 2: kind-filtered and within-radius queries are exact.
+    """
+    index = GeoIndex.from_site_data()
+    lat, lon = CHARMINAR
+
+    km, indexes = index.nearest(lat, lon, k=4, kind="food")
+    assert all(index.records[i]["kind"] == "food" for i in indexes[0])
+    assert np.allclose(km[0], [d for d, _ in _brute_force(index, lat, lon, kind="food")[:4]])
+
+    (radius_km, radius_indexes), = index.within_radius(lat, lon, 3.0)
+    expected = [i for d, i in _brute_force(index, lat, lon) if d <= 3.0]
+    assert sorted(radius_indexes.tolist()) == sorted(expected)
+    assert (np.diff(radius_km) >= 0).all()
+
+    print(f"✅ Kind and radius test passed - {len(expected)} places within 3 km")
+
+
+def test_api_nearest_endpoint():
+    """
+    Nearest Test 3: /api/nearest answers batches and rejects bad queries.
+    """
+    service = NearestService()
+    points = f"{HITEC_CITY['latitude']},{HITEC_CITY['longitude']};{CHARMINAR[0]},{CHARMINAR[1]}"
+
+    status, body = service.handle("/nearest", f"points={points}&k=3&kind=destination")
+
+    assert status == 200 and body["code"] == "Ok"
+    assert [len(result["places"]) for result in body["results"]] == [3, 3]
+    first = body["results"][1]["places"]
+    assert first[0]["kind"] == "destination"
+    assert [p["distance_km"] for p in first] == sorted(p["distance_km"] for p in first)
+
+    for query in ("", "points=17.4", "points=95,78", f"points={points}&k=0", f"points={points}&kind=bar"):
+        status, body = service.handle("/nearest", query)
+        assert status == 400 and body["code"] == "InvalidQuery", query
+
+    print("✅ /api/nearest endpoint test passed")
+
+
+def test_kind_missing_from_index():
+    """
+    Nearest Test 4: asking for a kind the index has none of finds nothing.
+    """
+    food_only = [{"name": "Stall", "kind": "food"}, {"name": "Cafe", "kind": "food"}]
+    index = GeoIndex([CHARMINAR[0], 17.40], [CHARMINAR[1], 78.45], food_only)
+
+    km, indexes = index.nearest(*CHARMINAR, k=3, kind="destination")
+    assert km.shape == indexes.shape == (1, 0)
+
+    status, body = NearestService(index).handle("/nearest", "points=17.44,78.38&kind=destination")
+    assert status == 200 and body["code"] == "Ok"
+    assert body["results"][0]["places"] == []
+
+    print("✅ Missing kind test passed")
+
+
+if __name__ == "__main__":
+    print("Run tests using: pytest backend/test_nearest.py -v")
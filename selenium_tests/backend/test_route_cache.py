@@ -0,0 +1,103 @@
+"""
+Route Cache Tests 🗃️
+Tests for the LRU/TTL road-distance cache in front of the routing backend.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+from cityquest.routing import OsrmStandIn, RouteCache
+
+
+class CountingBackend:
+    """Fake routing backend that counts how often it is asked."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def distance_m(self, origin, destination):
+        self.calls += 1
+        return 1000.0 * self.calls
+
+
+CHARMINAR = (17.3616, 78.4747)
+GOLCONDA = (17.3833, 78.4011)
+
+
+def test_nearby_origins_share_one_entry():
+    """
+    Cache Test 1: origins in the same grid cell hit; another cell misses.
+    """
+    backend = CountingBackend()
+    cache = RouteCache(backend, grid_degrees=0.005)
+
+    first = cache.distance_m((17.44350, 78.37720), GOLCONDA)
+    second = cache.distance_m((17.44360, 78.37710), GOLCONDA)
+    cache.distance_m((17.45500, 78.37720), GOLCONDA)
+
+    assert first == second
+    assert backend.calls == 2
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 2
+
+    print("✅ Grid quantization test passed")
+
+
+def test_least_recently_used_entry_is_evicted():
+    """
+    Cache Test 2: the cache never grows past max_entries and drops the LRU entry.
+    """
+    backend = CountingBackend()
+    cache = RouteCache(backend, max_entries=2)
+
+    cache.distance_m(CHARMINAR, GOLCONDA)
+    cache.distance_m(CHARMINAR, (17.4062, 78.4691))
+    cache.distance_m(CHARMINAR, GOLCONDA)          # refresh GOLCONDA
+    cache.distance_m(CHARMINAR, (17.3580, 78.4717))  # evicts the second one
+
+    assert len(cache) == 2
+    cache.distance_m(CHARMINAR, GOLCONDA)
+    assert backend.calls == 3
+    cache.distance_m(CHARMINAR, (17.4062, 78.4691))
+    assert backend.calls == 4
+
+    print("✅ LRU eviction test passed")
+
+
+def test_entries_expire_after_ttl():
+    """
+    Cache Test 3: an entry older than the TTL is fetched again.
+    """
+    now = [0.0]
+    backend = CountingBackend()
+    cache = RouteCache(backend, ttl_seconds=60, clock=lambda: now[0])
+
+    cache.distance_m(CHARMINAR, GOLCONDA)
+    now[0] = 59
+    cache.distance_m(CHARMINAR, GOLCONDA)
+    now[0] = 121
+    cache.distance_m(CHARMINAR, GOLCONDA)
+
+    assert backend.calls == 2
+
+    print("✅ TTL expiry test passed")
+
+
+def test_stats_endpoint_exposes_counters():
+    """
+    Cache Test 4: GET /stats on the routing service reports hits and misses.
+    """
+    stand_in = OsrmStandIn(RouteCache(CountingBackend()))
+    path = f"/route/v1/driving/{CHARMINAR[1]},{CHARMINAR[0]};{GOLCONDA[1]},{GOLCONDA[0]}"
+    stand_in.handle(path)
+    stand_in.handle(path)
+
+    status, body = stand_in.handle("/stats")
+
+    assert status == 200
+    assert body["cache"]["hits"] == 1 and body["cache"]["misses"] == 1
+
+    print("✅ Stats endpoint test passed")
+
+
+if __name__ == "__main__":
+    print("Run tests using: pytest backend/test_route_cache.py -v")
@@ -0,0 +1,92 @@
+"""
+Routing Stand-in Tests 🛣️
+Tests for the local OSRM-compatible /route and /table service.
+"""
+
+import json
+import urllib.request
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+from cityquest.datasets import load_destinations
+from cityquest.routing import OsrmStandIn, RoadDistanceMatrix, estimate_road_meters
+from selenium_tests.helpers import HITEC_CITY
+
+
+def _coords(*points):
+    return ";".join(f"{lon},{lat}" for lat, lon in points)
+
+
+def test_route_matches_osrm_shape():
+    """
+    Routing Test 1: /route answers with OSRM's code/routes/waypoints layout.
+    """
+    stand_in = OsrmStandIn()
+    golconda = load_destinations()[0]
+    origin = (HITEC_CITY["latitude"], HITEC_CITY["longitude"])
+    destination = (golconda["latitude"], golconda["longitude"])
+
+    status, body = stand_in.handle(f"/route/v1/driving/{_coords(origin, destination)}", "overview=false")
+
+    assert status == 200
+    assert body["code"] == "Ok"
+    assert abs(body["routes"][0]["distance"] - estimate_road_meters(*origin, *destination)) < 1
+    assert body["waypoints"][1]["location"] == [golconda["longitude"], golconda["latitude"]]
+
+    print(f"✅ Route shape test passed - {body['routes'][0]['distance'] / 1000:.2f} km")
+
+
+def test_table_uses_precomputed_matrix():
+    """
+    Routing Test 2: /table between dataset points reads the precomputed matrix.
+    """
+    matrix = RoadDistanceMatrix.from_site_data()
+    stand_in = OsrmStandIn(matrix)
+    points = matrix.points[:4]
+
+    status, body = stand_in.handle(
+        f"/table/v1/driving/{_coords(*points)}", "sources=0&annotations=distance,duration"
+    )
+
+    assert status == 200
+    assert body["distances"][0] == [round(matrix.meters[0][j], 1) for j in range(4)]
+    assert len(body["durations"][0]) == 4
+
+    print("✅ Table matrix test passed")
+
+
+def test_invalid_requests_report_osrm_errors():
+    """
+    Routing Test 3: malformed requests get OSRM-style error codes.
+    """
+    stand_in = OsrmStandIn()
+
+    assert stand_in.handle("/nearest/v1/driving/78.1,17.1;78.2,17.2")[1]["code"] == "InvalidService"
+    assert stand_in.handle("/route/v1/driving/not,numbers;78.2,17.2")[1]["code"] == "InvalidUrl"
+    assert stand_in.handle("/table/v1/driving/78.1,17.1;78.2,17.2", "sources=5")[0] == 400
+
+    print("✅ Error response test passed")
+
+
+def test_responses_answered_quickly(static_server):
+    """
+    Routing Test 4: the test server answers without going anywhere slow.
+
+    The bound is on the server's own handling time and leaves a wide margin
+    for a busy CI machine; benchmarks/bench_routing.py measures the actual
+    per-request cost.
+    """
+    origin = (HITEC_CITY["latitude"], HITEC_CITY["longitude"])
+    targets = [(d["latitude"], d["longitude"]) for d in load_destinations()[:10]]
+    url = f"{static_server.base_url}/osrm/table/v1/driving/{_coords(origin, *targets)}?sources=0&annotations=distance"
+
+    with urllib.request.urlopen(url) as response:
+        assert len(json.load(response)["distances"][0]) == 11
+
+    count, total_ms, _ = static_server.stats["/osrm/*"]
+    assert total_ms / count < 50, f"Server-side handling took {total_ms / count:.3f} ms"
+
+    print(f"✅ Latency test passed - {total_ms / count:.3f} ms per request on the server")
+
+if __name__ == "__main__":
+    print("Run tests using: pytest backend/test_routing.py -v")
@@ -0,0 +1,82 @@
+"""
+Search Index Tests 🔎
+Tests for the full-text and prefix search index behind both pages' search
+boxes (cityquest/search.py and the search-index build step).
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+from cityquest.build import read_json
+from cityquest.build import search_index
+from cityquest.build.compile_datasets import compile_destinations, compile_food_places
+from cityquest.datasets import load_destinations, load_food_places
+from cityquest.search import SearchIndex, build_search_index, tokenize
+
+
+def _names(records, positions):
+    return [records[i]["name"] for i in positions]
+
+
+def test_tokenize_folds_case_accents_and_punctuation():
+    """
+    Search Test 1: words are lower-case ASCII, split on anything else.
+    """
+    assert tokenize("Double Ka Meetha") == ["double", "ka", "meetha"]
+    assert tokenize("Café Niloufer (Lakdi-ka-pul)") == ["cafe", "niloufer", "lakdi", "ka", "pul"]
+    assert tokenize("  ,; ") == []
+    print("✅ Tokenize test passed")
+
+
+def test_dishes_and_names_are_found_by_prefix():
+    """
+    Search Test 2: every word of a query must match, each as a term prefix,
+    and stronger fields rank first.
+    """
+    food = compile_food_places(load_food_places())
+    index = SearchIndex(build_search_index(food))
+
+    dessert = _names(food, index.search("double ka meetha"))
+    assert set(dessert) == {"Paradise Biryani", "Ram Ki Bandi"}
+    assert _names(food, index.search("doub ka mee")) == dessert
+    assert index.search("double ka qubani") == []
+    assert index.search("  ") is None
+
+    destinations = compile_destinations(load_destinations())
+    index = SearchIndex(build_search_index(destinations))
+    assert _names(destinations, index.search("golc"))[0] == "Golconda Fort"
+    print(f"✅ Prefix search test passed - {dessert}")
+
+
+def test_exact_terms_and_stronger_fields_rank_higher():
+    """
+    Search Test 3: a name match outranks a description match, an exact term
+    outranks a longer term it prefixes, and ties keep dataset order.
+    """
+    records = [
+        {"name": "Lakeside", "description": "Biryani nearby"},
+        {"name": "Biryani House", "description": ""},
+        {"name": "Biryanis Corner", "description": ""},
+        {"name": "Another Biryani House", "description": ""},
+    ]
+    index = SearchIndex(build_search_index(records))
+    assert index.search("biryani") == [1, 3, 2, 0]
+    assert index.search("biry") == [1, 2, 3, 0]
+    print("✅ Ranking test passed")
+
+
+def test_committed_index_is_current():
+    """
+    Search Test 4: Devops/generated/search-index-*.json match the datasets.
+    Run `python -m cityquest.build` after editing data.json or food_places.json.
+    """
+    expected = search_index.build(
+        compile_destinations(load_destinations()), compile_food_places(load_food_places())
+    )
+    for page, path in search_index.OUTPUT_PATHS.items():
+        assert read_json(path) == expected[page], path
+    print("✅ Search index is up to date")
+
+
+if __name__ == "__main__":
+    print("Run tests using: pytest backend/test_search_index.py -v")
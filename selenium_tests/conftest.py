@@ -1,140 +1,192 @@
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 import os
-import threading
-import http.server
-import socketserver
 import time
+import urllib.request
 
-# Global server instance
-server = None
-server_thread = None
-PORT = 9999
-
-@pytest.fixture(scope="session", autouse=True)
-def start_server():
-    """
-    Start a local HTTP server to serve the project files.
-    This runs once for the entire test session.
-    Uses ThreadingTCPServer for parallel test execution.
-    """
-    global server, server_thread
-    
-    # Get project directory
-    project_path = os.path.join(os.path.dirname(__file__), "..", "Devops")
-    
-    # Change to project directory
-    os.chdir(project_path)
-    
-    # Create threaded HTTP server handler
-    Handler = http.server.SimpleHTTPRequestHandler
-    
-    # Use ThreadingTCPServer for handling concurrent requests
-    class ThreadedHTTPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
-        allow_reuse_address = True
-        daemon_threads = True
-    
-    try:
-        server = ThreadedHTTPServer(("", PORT), Handler)
-        print(f"\n🚀 Starting threaded HTTP server on http://localhost:{PORT}")
-        
-        # Run server in a separate thread
-        server_thread = threading.Thread(target=server.serve_forever)
-        server_thread.daemon = True
-        server_thread.start()
-        
-        # Give server time to start
-        time.sleep(2)
-        print(f"✅ Server running at http://localhost:{PORT}")
-        
-    except OSError as e:
-        if e.errno == 10048:  # Port already in use
-            print(f"⚠️  Port {PORT} already in use. Using existing server.")
-        else:
-            raise
-    
-    yield
-    
-    # Shutdown server
-    if server:
-        print(f"\n🛑 Shutting down server...")
+from cityquest.nearest import NearestService
+from cityquest.routing import OsrmStandIn, RoadDistanceMatrix, RouteCache
+from selenium_tests.driver_pool import DriverPool
+from selenium_tests.helpers import HITEC_CITY, wait_for_app_event
+from selenium_tests.static_server import StaticServer, format_stats, merge_stats
+from selenium_tests.synthetic_data import SCALE_TEST_RECORDS, SyntheticDatasets
+
+# Site served to the browsers, by absolute path (no os.chdir)
+DEVOPS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "Devops"))
+
+# Where the routing stand-in is mounted on the test server
+OSRM_PREFIX = "/osrm"
+# ...and the nearest-places API (GET /api/nearest)
+API_PREFIX = "/api"
+# ...and the scaled-up datasets the scale tests load
+SYNTHETIC_PREFIX = "/synthetic"
+
+# Per-path request stats, merged across xdist workers for the session summary
+SERVER_STATS_KEY = "static_server_stats"
+_server_stats = pytest.StashKey()
+
+
+def wait_until_ready(url, timeout=10):
+    """Poll `url` until it answers 200, instead of sleeping a fixed time."""
+    deadline = time.monotonic() + timeout
+    while True:
         try:
-            server.shutdown()
-            server.server_close()
-        except Exception as e:
-            print(f"⚠️  Error shutting down server: {e}")
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+        time.sleep(0.01)
+
+
+@pytest.fixture(scope="session")
+def static_server(pytestconfig):
+    """
+    Start the in-memory asyncio server that serves Devops/.
+    Each xdist worker (or the single process without -n) gets its own server
+    on an ephemeral port, so parallel workers never collide or share one.
+    The OSRM routing stand-in (behind a RouteCache) is mounted under /osrm,
+    the nearest-places API under /api and the synthetic datasets (built on
+    first use) under /synthetic on the same server.
+    """
+    server = StaticServer(DEVOPS_DIR)
+    server.mount(OSRM_PREFIX, OsrmStandIn(RouteCache(RoadDistanceMatrix.from_site_data())).handle)
+    server.mount(API_PREFIX, NearestService().handle)
+    server.mount(SYNTHETIC_PREFIX, SyntheticDatasets(SCALE_TEST_RECORDS).handle)
+    url = server.start()
+    wait_until_ready(f"{url}/index.html")
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    print(f"\n🚀 [{worker_id}] Serving {DEVOPS_DIR} at {url}")
+
+    yield server
+
+    server.stop()
+    if hasattr(pytestconfig, "workeroutput"):
+        pytestconfig.workeroutput[SERVER_STATS_KEY] = server.stats
+    else:
+        merge_stats(pytestconfig.stash.setdefault(_server_stats, {}), server.stats)
+
+
+@pytest.fixture(scope="session")
+def base_url(static_server):
+    """Base URL of this worker's test server."""
+    return static_server.base_url
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Collect an xdist worker's server stats on the controller."""
+    stats = getattr(node, "workeroutput", {}).get(SERVER_STATS_KEY)
+    if stats:
+        merge_stats(node.config.stash.setdefault(_server_stats, {}), stats)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    stats = config.stash.get(_server_stats, None)
+    if stats:
+        terminalreporter.section("static server requests")
+        terminalreporter.write_line(format_stats(stats))
+
+
+@pytest.fixture(scope="session")
+def driver_pool(base_url):
+    """
+    One headless Chrome per worker, kept alive for the whole session.
+    Each page fixture below borrows a fresh browser context from it.
+    """
+    pool = DriverPool(base_url, page_config={
+        "routingBaseUrl": base_url + OSRM_PREFIX,
+    }).start()
+    yield pool
+    pool.stop()
 
 
 @pytest.fixture
-def browser():
-    """
-    Setup and teardown for Selenium WebDriver.
-    This fixture runs before each test and provides a fresh browser instance.
-    """
-    # --- Setup ---
-    # Configure Chrome options
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option('useAutomationExtension', False)
-    # Allow local file access for CORS
-    chrome_options.add_argument('--disable-web-security')
-    chrome_options.add_argument('--allow-file-access-from-files')
-    
-    # Initialize Chrome driver
-    driver = webdriver.Chrome(options=chrome_options)
-    driver.implicitly_wait(10)  # Wait up to 10s for elements to appear
-    driver.maximize_window()
-    
-    # Open via HTTP server
-    driver.get(f'http://localhost:{PORT}/index.html')
-    
-    yield driver  # This is where the test runs
-    
-    # --- Teardown ---
-    driver.quit()  # Close the browser after the test is done
+def browser(driver_pool):
+    """
+    Tourist places page in a fresh browser context.
+    """
+    yield driver_pool.open_context('index.html')
+    driver_pool.close_context()
 
 
 @pytest.fixture
-def home_browser():
+def home_browser(driver_pool):
     """
     Setup for testing the home page.
     """
-    chrome_options = Options()
-
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-    chrome_options.add_argument('--disable-web-security')
-    chrome_options.add_argument('--allow-file-access-from-files')
-    
-    driver = webdriver.Chrome(options=chrome_options)
-    driver.implicitly_wait(10)
-    driver.maximize_window()
-    driver.get(f'http://localhost:{PORT}/home.html')
-    
-    yield driver
-    
-    driver.quit()
+    yield driver_pool.open_context('home.html')
+    driver_pool.close_context()
 
 
 @pytest.fixture
-def food_browser():
+def food_browser(driver_pool):
     """
     Setup for testing the food places page.
     """
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-    chrome_options.add_argument('--disable-web-security')
-    chrome_options.add_argument('--allow-file-access-from-files')
-    
-    driver = webdriver.Chrome(options=chrome_options)
-    driver.implicitly_wait(10)
-    driver.maximize_window()
-    driver.get(f'http://localhost:{PORT}/food-places.html')
-    
+    yield driver_pool.open_context('food-places.html')
+    driver_pool.close_context()
+
+
+@pytest.fixture
+def geo_browser(driver_pool, request):
+    """
+    Tourist places page with a mocked user location (Hitec City by default).
+    Permission is granted and the location applied before the page loads;
+    the fixture returns once the page has published 'location-resolved'.
+    Parametrize indirectly with a latitude/longitude/accuracy dict to move the user.
+    """
+    location = getattr(request, 'param', HITEC_CITY)
+    driver = driver_pool.open_context('index.html', geolocation=location)
+    wait_for_app_event(driver, 'location-resolved')
     yield driver
-    
-    driver.quit()
+    driver_pool.close_context()
+
+
+@pytest.fixture
+def food_geo_browser(driver_pool, request):
+    """
+    Food places page with a mocked user location (Hitec City by default).
+    Parametrize indirectly with a latitude/longitude/accuracy dict to move the user.
+    """
+    location = getattr(request, 'param', HITEC_CITY)
+    driver = driver_pool.open_context('food-places.html', geolocation=location)
+    wait_for_app_event(driver, 'location-resolved')
+    yield driver
+    driver_pool.close_context()
+
+
+@pytest.fixture
+def open_scale_page(driver_pool):
+    """
+    Opener for the tourist places page loading SCALE_TEST_RECORDS synthetic
+    destinations, with the user in Hitec City unless `location` moves them.
+    Call it with CityQuestConfig overrides; each call replaces the previous
+    page and returns once the location is resolved.
+    """
+    def open_page(location=HITEC_CITY, **config):
+        driver = driver_pool.open_context('index.html', geolocation=location,
+                                          config={"dataBaseUrl": SYNTHETIC_PREFIX, **config})
+        wait_for_app_event(driver, 'location-resolved', timeout=25)
+        return driver
+
+    yield open_page
+    driver_pool.close_context()
+
+
+@pytest.fixture
+def scale_browser(open_scale_page):
+    """
+    Tourist places page loading SCALE_TEST_RECORDS synthetic destinations,
+    with the user in Hitec City. Returns once the location is resolved.
+    """
+    yield open_scale_page()
+
+
+@pytest.fixture
+def food_scale_browser(driver_pool):
+    """
+    Food places page loading SCALE_TEST_RECORDS synthetic food places.
+    """
+    yield driver_pool.open_context('food-places.html', config={"dataBaseUrl": SYNTHETIC_PREFIX})
+    driver_pool.close_context()
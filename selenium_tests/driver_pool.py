@@ -0,0 +1,156 @@
+"""
+Pooled Chrome Driver for City Quest Tests
+Keeps one headless Chrome alive per worker for the whole session and hands
+each test a fresh, isolated browser context (its own cookies, storage and
+geolocation overrides) instead of launching a new Chrome per test.
+"""
+
+import json
+import time
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+
+WINDOW_WIDTH = 1920
+WINDOW_HEIGHT = 1080
+
+
+def chrome_options():
+    """Build the headless Chrome options shared by every test browser."""
+    options = Options()
+    options.add_argument("--headless")
+    options.add_argument(f"--window-size={WINDOW_WIDTH},{WINDOW_HEIGHT}")
+    options.add_argument('--disable-blink-features=AutomationControlled')
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+    # Allow local file access for CORS
+    options.add_argument('--disable-web-security')
+    options.add_argument('--allow-file-access-from-files')
+    # Accept stray alert() dialogs instead of failing the next command
+    options.unhandled_prompt_behavior = 'accept'
+    return options
+
+
+def launch_chrome():
+    """Start a brand new headless Chrome (the expensive part we want to pool)."""
+    driver = webdriver.Chrome(options=chrome_options())
+    driver.implicitly_wait(10)  # Wait up to 10s for elements to appear
+    return driver
+
+
+class DriverPool:
+    """
+    One long-lived Chrome per worker process.
+
+    Every call to open_context() creates a new CDP browser context (an
+    incognito-like profile) with a single tab, switches the driver to it and
+    navigates to the requested page. close_context() throws the whole context
+    away, so nothing leaks from one test into the next.
+
+    `page_config` entries are injected as window.CityQuestConfig before any
+    page script runs (see Devops/config.js), e.g. to point the pages at the
+    local routing stand-in.
+    """
+
+    def __init__(self, base_url, page_config=None):
+        self.base_url = base_url.rstrip('/')
+        self.page_config = dict(page_config or {})
+        self.driver = None
+        self._home_handle = None
+        self._context_id = None
+        self._target_id = None
+
+    def start(self):
+        """Launch the pooled Chrome. Called once per session."""
+        self.driver = launch_chrome()
+        self._home_handle = self.driver.current_window_handle
+        return self
+
+    def open_context(self, path, geolocation=None, config=None, scripts=()):
+        """
+        Open `path` in a fresh browser context and return the driver.
+
+        Args:
+            path: Page path relative to the server root (e.g. 'index.html')
+            geolocation: Optional dict with latitude/longitude/accuracy that is
+                granted and applied before the page loads, or 'denied' to
+                refuse the permission
+            config: Optional CityQuestConfig overrides for this page only
+            scripts: JavaScript sources run before any page script, e.g. to
+                stub a browser API
+        """
+        if self._context_id is not None:
+            self.close_context()
+
+        driver = self.driver
+        context = driver.execute_cdp_cmd(
+            "Target.createBrowserContext", {"disposeOnDetach": True}
+        )
+        self._context_id = context["browserContextId"]
+        target = driver.execute_cdp_cmd("Target.createTarget", {
+            "url": "about:blank",
+            "browserContextId": self._context_id,
+            "width": WINDOW_WIDTH,
+            "height": WINDOW_HEIGHT,
+        })
+        self._target_id = target["targetId"]
+        self._switch_to_target(self._target_id)
+
+        page_config = {**self.page_config, **(config or {})}
+        if page_config:
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+                "source": f"window.CityQuestConfig = {json.dumps(page_config)};"
+            })
+
+        for source in scripts:
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": source})
+
+        if geolocation == "denied":
+            driver.execute_cdp_cmd("Browser.setPermission", {
+                "permission": {"name": "geolocation"},
+                "setting": "denied",
+                "origin": self.base_url,
+                "browserContextId": self._context_id,
+            })
+        elif geolocation is not None:
+            driver.execute_cdp_cmd("Browser.grantPermissions", {
+                "permissions": ["geolocation"],
+                "origin": self.base_url,
+                "browserContextId": self._context_id,
+            })
+            driver.execute_cdp_cmd("Emulation.setGeolocationOverride", geolocation)
+
+        driver.get(f"{self.base_url}/{path.lstrip('/')}")
+        return driver
+
+    def close_context(self):
+        """Close the current test tab and dispose of its browser context."""
+        driver = self.driver
+        try:
+            if self._target_id is not None:
+                driver.execute_cdp_cmd("Target.closeTarget", {"targetId": self._target_id})
+            if self._context_id is not None:
+                driver.execute_cdp_cmd(
+                    "Target.disposeBrowserContext", {"browserContextId": self._context_id}
+                )
+        finally:
+            self._target_id = None
+            self._context_id = None
+            driver.switch_to.window(self._home_handle)
+
+    def stop(self):
+        """Quit the pooled Chrome at the end of the session."""
+        if self.driver is not None:
+            self.driver.quit()
+            self.driver = None
+
+    def _switch_to_target(self, target_id, timeout=5):
+        # ChromeDriver uses the CDP target id as the window handle, but it can
+        # take a moment before a freshly created target shows up in the list.
+        deadline = time.monotonic() + timeout
+        while target_id not in self.driver.window_handles:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Browser context tab {target_id} never appeared")
+            time.sleep(0.01)
+        self.driver.switch_to.window(target_id)
@@ -4,7 +4,6 @@ Tests for filtering food places by budget ranges (Under ₹200, ₹200-₹500, e
 """
 
 from selenium.webdriver.common.by import By
-import time
 import sys
 import os
 sys.path.insert(0, os.path.dirname(__file__))
@@ -12,7 +11,8 @@ from selenium_tests.helpers import (
     wait_for_food_cards_to_load, 
     get_visible_food_cards,
     click_budget_filter_checkbox,
-    get_clear_filters_button
+    get_clear_filters_button,
+    click_and_wait
 )
 
 
@@ -28,7 +28,6 @@ def test_filter_by_affordable_budget(food_browser):
     
     # Click 'Under ₹200' budget filter
     click_budget_filter_checkbox(food_browser, "Under ₹200")
-    time.sleep(1)
     
     # Get filtered cards
     filtered_cards = get_visible_food_cards(food_browser)
@@ -49,7 +48,6 @@ def test_filter_by_mid_range_budget(food_browser):
     
     # Click 'Moderate (₹200 - ₹400)' budget filter
     click_budget_filter_checkbox(food_browser, "Moderate (₹200 - ₹400)")
-    time.sleep(1)
     
     # Get filtered cards
     filtered_cards = get_visible_food_cards(food_browser)
@@ -67,7 +65,6 @@ def test_filter_by_premium_budget(food_browser):
     
     # Click 'Premium (₹400 - ₹600)' budget filter
     click_budget_filter_checkbox(food_browser, "Premium (₹400 - ₹600)")
-    time.sleep(1)
     
     # Get filtered cards
     filtered_cards = get_visible_food_cards(food_browser)
@@ -91,14 +88,12 @@ def test_combined_cuisine_and_budget_filters(food_browser):
         By.CSS_SELECTOR,
         "input.cuisine-checkbox[data-cuisine='Biryani & Hyderabadi']"
     )
-    biryani_checkbox.click()
-    time.sleep(1)
+    click_and_wait(food_browser, biryani_checkbox)
     
     cuisine_filtered = len(get_visible_food_cards(food_browser))
     
     # Apply Budget Friendly (Under ₹200) filter
     click_budget_filter_checkbox(food_browser, "Budget Friendly (Under ₹200)")
-    time.sleep(1)
     
     # Get cards with both filters
     both_filtered = get_visible_food_cards(food_browser)
@@ -123,7 +118,6 @@ def test_clear_budget_filters(food_browser):
     
     # Apply budget filter
     click_budget_filter_checkbox(food_browser, "Under ₹200")
-    time.sleep(1)
     
     # Verify filter is active
     filtered_count = len(get_visible_food_cards(food_browser))
@@ -131,8 +125,7 @@ def test_clear_budget_filters(food_browser):
     
     # Click clear filters
     clear_btn = get_clear_filters_button(food_browser)
-    clear_btn.click()
-    time.sleep(1)
+    click_and_wait(food_browser, clear_btn)
     
     # Verify all cards are back
     final_count = len(get_visible_food_cards(food_browser))
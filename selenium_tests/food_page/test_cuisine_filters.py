@@ -3,17 +3,31 @@ Cuisine Filter Tests for Food Places Page 🍽️
 Tests for filtering food places by cuisine type (Biryani, Street Food, etc.)
 """
 
-from selenium.webdriver.common.by import By
-import time
 import sys
 import os
+from urllib.parse import parse_qs, urlsplit
 sys.path.insert(0, os.path.dirname(__file__))
 from selenium_tests.helpers import (
     wait_for_food_cards_to_load, 
     get_visible_food_cards,
+    get_visible_food_card_data,
     click_cuisine_filter_checkbox,
-    get_clear_filters_button
+    click_budget_filter_checkbox,
+    get_clear_filters_button,
+    get_filter_option_counts,
+    click_and_wait
 )
+from cityquest.build import read_json, read_ndjson
+from cityquest.build.compile_datasets import CLASSIFICATION_OUTPUTS, FOOD_PLACES_STREAM_OUTPUT
+from cityquest.facets import Facet, FacetIndex
+
+# The page's budget options (FOOD_BUDGET_RANGES in food-script.js)
+FOOD_BUDGET_RANGES = {
+    "Budget Friendly (Under ₹200)": (0, 200),
+    "Moderate (₹200 - ₹400)": (200, 400),
+    "Premium (₹400 - ₹600)": (400, 600),
+    "Fine Dining (Above ₹600)": (600, 999999),
+}
 
 
 def test_filter_by_biryani(food_browser):
@@ -28,7 +42,6 @@ def test_filter_by_biryani(food_browser):
     
     # Click Biryani filter
     click_cuisine_filter_checkbox(food_browser, "Biryani & Hyderabadi")
-    time.sleep(1)
     
     # Get filtered cards
     filtered_cards = get_visible_food_cards(food_browser)
@@ -39,9 +52,8 @@ def test_filter_by_biryani(food_browser):
     assert filtered_count <= initial_count, "Filtered count should be less than or equal to initial"
     
     # Verify all visible cards have restaurant info
-    for card in filtered_cards:
-        place_type = card.find_element(By.CLASS_NAME, "place-type").text
-        assert len(place_type) > 0, "Place type should not be empty"
+    for card in get_visible_food_card_data(food_browser):
+        assert len(card["type"]) > 0, "Place type should not be empty"
     
     print(f"✅ Biryani & Hyderabadi filter test passed - {filtered_count}/{initial_count} places shown")
 
@@ -54,7 +66,6 @@ def test_filter_by_street_food(food_browser):
     
     # Click Street Food filter
     click_cuisine_filter_checkbox(food_browser, "Street Food - Quick Bites")
-    time.sleep(1)
     
     # Get filtered cards
     filtered_cards = get_visible_food_cards(food_browser)
@@ -62,9 +73,8 @@ def test_filter_by_street_food(food_browser):
     assert len(filtered_cards) > 0, "No cards visible after Street Food filter"
     
     # Verify all visible cards have place type
-    for card in filtered_cards:
-        place_type = card.find_element(By.CLASS_NAME, "place-type").text
-        assert len(place_type) > 0
+    for card in get_visible_food_card_data(food_browser):
+        assert len(card["type"]) > 0
     
     print(f"✅ Street Food - Quick Bites filter test passed - {len(filtered_cards)} places shown")
 
@@ -77,7 +87,6 @@ def test_filter_by_cafe(food_browser):
     
     # Click Cafe filter
     click_cuisine_filter_checkbox(food_browser, "Cafes & Bakeries")
-    time.sleep(1)
     
     # Get filtered cards
     filtered_cards = get_visible_food_cards(food_browser)
@@ -99,7 +108,6 @@ def test_clear_cuisine_filters(food_browser):
     
     # Apply Biryani filter
     click_cuisine_filter_checkbox(food_browser, "Biryani & Hyderabadi")
-    time.sleep(1)
     
     # Verify filter is active
     filtered_cards = get_visible_food_cards(food_browser)
@@ -107,8 +115,7 @@ def test_clear_cuisine_filters(food_browser):
     
     # Click clear filters
     clear_btn = get_clear_filters_button(food_browser)
-    clear_btn.click()
-    time.sleep(1)
+    click_and_wait(food_browser, clear_btn)
     
     # Verify all cards are back
     final_cards = get_visible_food_cards(food_browser)
@@ -117,5 +124,56 @@ def test_clear_cuisine_filters(food_browser):
     print(f"✅ Clear cuisine filters test passed - Restored {len(final_cards)} places")
 
 
+def test_option_counts_match_reference_engine(food_browser):
+    """
+    Cuisine Filter Test 5: the count next to every cuisine and budget option
+    matches the Python facet engine over the same compiled records, before
+    and after ticking a cuisine.
+    """
+    wait_for_food_cards_to_load(food_browser)
+    places = read_ndjson(FOOD_PLACES_STREAM_OUTPUT)
+    table = read_json(CLASSIFICATION_OUTPUTS["food"])
+    cuisines = table["options"]
+    index = FacetIndex(places, [
+        Facet("cuisine", {c: (lambda c: lambda p: c in table["groups"][p["place_type"]])(c) for c in cuisines}),
+        Facet("budget", {label: (lambda lo, hi: lambda p: lo <= p["budget"] <= hi)(*bounds)
+                         for label, bounds in FOOD_BUDGET_RANGES.items()}),
+    ])
+
+    for selection in ({}, {"cuisine": ["Biryani & Hyderabadi"]}):
+        if selection:
+            click_cuisine_filter_checkbox(food_browser, "Biryani & Hyderabadi")
+        matches, expected = index.query(selection)
+        assert get_filter_option_counts(food_browser, "cuisine-checkbox") == expected["cuisine"]
+        assert get_filter_option_counts(food_browser, "budget-checkbox") == expected["budget"]
+        assert len(get_visible_food_cards(food_browser)) == len(matches)
+
+    print(f"✅ Option counts test passed - {len(cuisines)} cuisines, {len(FOOD_BUDGET_RANGES)} budgets")
+
+
+def test_filters_survive_reload_through_the_url(food_browser):
+    """
+    Cuisine Filter Test 6: the selected cuisine, budget and search text are
+    mirrored in the query string, so a reload shows the same places.
+    """
+    wait_for_food_cards_to_load(food_browser)
+    click_budget_filter_checkbox(food_browser, "Budget Friendly (Under ₹200)")
+    applied = click_cuisine_filter_checkbox(food_browser, "Biryani & Hyderabadi")
+    
+    query = parse_qs(urlsplit(food_browser.current_url).query)
+    assert query == {"cuisine": ["Biryani & Hyderabadi"], "budget": ["0-200"]}, f"Query string is {query}"
+    
+    food_browser.refresh()
+    reloaded = wait_for_food_cards_to_load(food_browser)
+    checked = food_browser.execute_script(
+        "return Array.from(document.querySelectorAll('.cuisine-checkbox:checked, .budget-checkbox:checked'),"
+        " cb => cb.dataset.cuisine || cb.dataset.minBudget)")
+    assert sorted(checked) == ["0", "Biryani & Hyderabadi"]
+    assert reloaded["count"] == applied["count"], \
+        f"{reloaded['count']} places after the reload, {applied['count']} before"
+    
+    print(f"✅ URL filter test passed - {applied['count']} places after a reload")
+
+
 if __name__ == "__main__":
     print("Run tests using: pytest test_food_suites/test_cuisine_filters.py -v")
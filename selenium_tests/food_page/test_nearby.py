@@ -0,0 +1,109 @@
+"""
+Nearby Food Places Tests 📍
+Tests for "Show Nearby Places": nearest-first ranking from the spatial grid,
+distance badges and the radius filter, with the user location mocked
+through Chrome DevTools Protocol (food_geo_browser fixture).
+"""
+
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+from cityquest.datasets import haversine_km, load_food_places
+from selenium_tests.helpers import (
+    wait_for_food_cards_to_load,
+    get_visible_food_card_data,
+    show_nearby_food_places,
+    select_radius_filter,
+    click_budget_filter_checkbox,
+    get_clear_filters_button,
+    click_and_wait,
+    HITEC_CITY
+)
+
+CHARMINAR = {"latitude": 17.3616, "longitude": 78.4747, "accuracy": 100}
+
+
+def _expected_nearby(location, count=None, radius_km=None, places=None):
+    """(name, km) of the nearest food places, computed the slow way."""
+    ranked = sorted(
+        (haversine_km(location["latitude"], location["longitude"], p["latitude"], p["longitude"]), p["name"])
+        for p in (places or load_food_places())
+    )
+    if radius_km is not None:
+        ranked = [row for row in ranked if row[0] <= radius_km]
+    if count is not None:
+        ranked = ranked[:count]
+    return [(name, km) for km, name in ranked]
+
+
+@pytest.mark.parametrize("food_geo_browser", [HITEC_CITY, CHARMINAR], indirect=True,
+                         ids=["hitec-city", "charminar"])
+def test_show_nearby_ranks_nearest_first(food_geo_browser):
+    """
+    Nearby Test 1: the 10 nearest places are shown nearest first, each with
+    a distance badge matching the haversine distance.
+    """
+    wait_for_food_cards_to_load(food_geo_browser)
+    location = food_geo_browser.execute_script("return {latitude: userLat, longitude: userLon};")
+
+    ranked = show_nearby_food_places(food_geo_browser)
+
+    cards = get_visible_food_card_data(food_geo_browser)
+    expected = _expected_nearby(location, count=10)
+    assert ranked["count"] == len(cards) == 10
+    assert [card["name"] for card in cards] == [name for name, _ in expected]
+    for card, (_, km) in zip(cards, expected):
+        assert abs(card["distance"] - km) < 0.01, f"{card['name']}: {card['distance']} vs {km:.2f}"
+
+    print(f"✅ Nearest-first test passed - closest is {cards[0]['name']} ({cards[0]['distance']} km)")
+
+
+def test_radius_filter_limits_results(food_geo_browser):
+    """
+    Nearby Test 2: a 5 km radius shows exactly the places within 5 km, and
+    combines with the budget filter.
+    """
+    wait_for_food_cards_to_load(food_geo_browser)
+
+    select_radius_filter(food_geo_browser, 5)
+    cards = get_visible_food_card_data(food_geo_browser)
+    expected = _expected_nearby(HITEC_CITY, radius_km=5)
+    assert [card["name"] for card in cards] == [name for name, _ in expected]
+    assert all(card["distance"] <= 5 for card in cards)
+
+    click_budget_filter_checkbox(food_geo_browser, "Under ₹200")
+    affordable = [p for p in load_food_places() if p["max_budget_for_one"] <= 200]
+    cards = get_visible_food_card_data(food_geo_browser)
+    assert [card["name"] for card in cards] == [
+        name for name, _ in _expected_nearby(HITEC_CITY, radius_km=5, places=affordable)
+    ]
+
+    click_and_wait(food_geo_browser, get_clear_filters_button(food_geo_browser))
+    cards = get_visible_food_card_data(food_geo_browser)
+    assert len(cards) == len(load_food_places())
+    assert all(card["distance"] is None for card in cards), "Badges should go with nearby mode"
+
+    print(f"✅ Radius filter test passed - {len(expected)} places within 5 km")
+
+
+def test_nearby_lookup_uses_grid_not_scan(food_geo_browser):
+    """
+    Nearby Test 3: ranking is fast and only examines places around the user.
+    """
+    wait_for_food_cards_to_load(food_geo_browser)
+
+    ranked = show_nearby_food_places(food_geo_browser)
+    small_radius = select_radius_filter(food_geo_browser, 1)
+
+    total = len(load_food_places())
+    assert ranked["elapsedMs"] < 50, f"Nearby ranking took {ranked['elapsedMs']:.1f}ms"
+    assert ranked["examined"] < total, "Show Nearby examined every place"
+    assert small_radius["examined"] < ranked["examined"]
+
+    print(f"✅ Spatial grid test passed - examined {ranked['examined']}/{total} places "
+          f"in {ranked['elapsedMs']:.2f}ms")
+
+
+if __name__ == "__main__":
+    print("Run tests using: pytest food_page/test_nearby.py -v")
@@ -0,0 +1,81 @@
+"""
+Scale Tests for Food Places Page 📈
+Tests for the food page with 50k synthetic food places.
+"""
+
+from selenium.webdriver.common.by import By
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+from selenium_tests.synthetic_data import SCALE_TEST_RECORDS
+from selenium_tests.helpers import (
+    app_event_time,
+    wait_for_app_event,
+    wait_for_food_cards_to_load,
+    click_cuisine_filter_checkbox,
+    find_food_card,
+    get_filter_option_counts,
+    measure_scroll_frames
+)
+
+
+def test_scrolling_keeps_dom_bounded(food_scale_browser):
+    """
+    Scale Test 1: Verify scrolling through 50k food places keeps the DOM
+    small and frames short.
+    """
+    applied = wait_for_food_cards_to_load(food_scale_browser, timeout=25)
+    assert applied["count"] == applied["total"] == SCALE_TEST_RECORDS
+    
+    result = measure_scroll_frames(food_scale_browser, "#food-places-container")
+    
+    assert result["maxCards"] <= 150, f"{result['maxCards']} cards in the page"
+    assert result["maxElements"] <= 5000, f"{result['maxElements']} elements in the page"
+    assert result["p95Ms"] < 50, f"95th percentile frame took {result['p95Ms']:.1f} ms"
+    
+    print(f"✅ Food scroll test passed - p95 frame {result['p95Ms']:.1f} ms, max {result['maxMs']:.1f} ms")
+
+
+def test_filter_and_find_at_scale(food_scale_browser):
+    """
+    Scale Test 2: Verify a cuisine filter's count matches its results and a
+    filtered card far down the list can still be found by name.
+    """
+    wait_for_food_cards_to_load(food_scale_browser, timeout=25)
+    
+    counts = get_filter_option_counts(food_scale_browser, "cuisine-checkbox")
+    cuisine, expected = max(counts.items(), key=lambda item: item[1])
+    applied = click_cuisine_filter_checkbox(food_scale_browser, cuisine)
+    assert applied["count"] == expected
+    
+    last_name = food_scale_browser.execute_script("""
+        const container = document.getElementById('food-places-container');
+        const shown = WindowedGrid.of(container).shown;
+        return shown[shown.length - 1].name;
+    """)
+    card = find_food_card(food_scale_browser, last_name)
+    assert card.find_element(By.CLASS_NAME, "restaurant-name").text == last_name
+    
+    print(f"✅ Food scale filter test passed - '{cuisine}': {expected} of {SCALE_TEST_RECORDS}")
+
+
+def test_first_cards_arrive_before_all_places(food_scale_browser):
+    """
+    Scale Test 3: Verify the first food cards are drawn from the first
+    streamed records, well before all 50k places are in.
+    """
+    first = wait_for_app_event(food_scale_browser, "first-cards", timeout=25)
+    wait_for_food_cards_to_load(food_scale_browser, timeout=25)
+    first_ms = app_event_time(food_scale_browser, "first-cards")
+    complete_ms = app_event_time(food_scale_browser, "data-loaded")
+    
+    assert 0 < first["count"] < SCALE_TEST_RECORDS, f"First batch held {first['count']} places"
+    assert first_ms < complete_ms / 2, \
+        f"First cards at {first_ms:.0f} ms, all data at {complete_ms:.0f} ms"
+    
+    print(f"✅ Food streaming test passed - first cards at {first_ms:.0f} ms ({first['count']} places), "
+          f"all {SCALE_TEST_RECORDS} at {complete_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    print("Run tests using: pytest test_scale.py -v")
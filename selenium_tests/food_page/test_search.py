@@ -0,0 +1,88 @@
+"""
+Food Search Tests 🔎
+Tests for the food page's search box: ranked results as the user types,
+combined with the cuisine and budget filters.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+from cityquest.build import read_json, read_ndjson
+from cityquest.build.compile_datasets import CLASSIFICATION_OUTPUTS, FOOD_PLACES_STREAM_OUTPUT
+from cityquest.build.search_index import OUTPUT_PATHS as SEARCH_INDEX_OUTPUTS
+from cityquest.search import SearchIndex
+from selenium_tests.helpers import (
+    wait_for_food_cards_to_load,
+    get_visible_food_card_names,
+    click_cuisine_filter_checkbox,
+    get_clear_filters_button,
+    click_and_wait,
+    search_and_wait
+)
+
+
+def _expected(text):
+    places = read_ndjson(FOOD_PLACES_STREAM_OUTPUT)
+    index = SearchIndex(read_json(SEARCH_INDEX_OUTPUTS["food"]))
+    return [places[i]["name"] for i in index.search(text)]
+
+
+def test_search_ranks_dishes_as_you_type(food_browser):
+    """
+    Search Test 1: every keystroke of "double ka meetha" shows the places
+    the reference index ranks for it, in the same order.
+    """
+    wait_for_food_cards_to_load(food_browser)
+    
+    query = "double ka meetha"
+    for end in range(1, len(query) + 1):
+        search_and_wait(food_browser, query[:end])
+        assert get_visible_food_card_names(food_browser) == _expected(query[:end]), query[:end]
+    
+    final = get_visible_food_card_names(food_browser)
+    assert set(final) == {"Paradise Biryani", "Ram Ki Bandi"}
+    print(f"✅ Search as you type test passed - {final}")
+
+
+def test_search_combines_with_checkbox_filters(food_browser):
+    """
+    Search Test 2: search results are narrowed by the cuisine filter and keep
+    their ranking; option counts only count search results.
+    """
+    wait_for_food_cards_to_load(food_browser)
+    
+    detail = search_and_wait(food_browser, "meetha")
+    assert detail["count"] == len(_expected("meetha"))
+    
+    click_cuisine_filter_checkbox(food_browser, "Biryani & Hyderabadi")
+    names = get_visible_food_card_names(food_browser)
+    groups = read_json(CLASSIFICATION_OUTPUTS["food"])["groups"]
+    biryani_places = {p["name"] for p in read_ndjson(FOOD_PLACES_STREAM_OUTPUT)
+                      if "Biryani & Hyderabadi" in groups[p["place_type"]]}
+    assert names and names == [name for name in _expected("meetha") if name in biryani_places]
+    
+    badge = food_browser.find_element(
+        "css selector", "input.cuisine-checkbox[data-cuisine='Biryani & Hyderabadi'] ~ .option-count"
+    )
+    assert badge.text == f"({len(names)})"
+    print(f"✅ Search with filters test passed - {names}")
+
+
+def test_clear_filters_clears_search(food_browser):
+    """
+    Search Test 3: "Clear All Filters" empties the search box and restores every place.
+    """
+    wait_for_food_cards_to_load(food_browser)
+    total = len(get_visible_food_card_names(food_browser))
+    
+    search_and_wait(food_browser, "chai")
+    assert 0 < len(get_visible_food_card_names(food_browser)) < total
+    
+    click_and_wait(food_browser, get_clear_filters_button(food_browser))
+    assert len(get_visible_food_card_names(food_browser)) == total
+    assert food_browser.find_element("id", "search-input").get_attribute("value") == ""
+    print("✅ Clear search test passed")
+
+
+if __name__ == "__main__":
+    print("Run tests using: pytest food_page/test_search.py -v")
@@ -10,7 +10,13 @@ import time
 import sys
 import os
 sys.path.insert(0, os.path.dirname(__file__))
-from selenium_tests.helpers import wait_for_food_cards_to_load, get_visible_food_cards
+from selenium_tests.helpers import (
+    wait_for_food_cards_to_load,
+    get_visible_food_cards,
+    click_and_wait,
+    click_burst,
+    measure_filter_toggles
+)
 
 
 def test_food_card_structure_and_content(food_browser):
@@ -169,8 +175,7 @@ def test_results_count_display(food_browser):
         By.CSS_SELECTOR,
         "input.budget-checkbox"
     )
-    affordable_checkbox.click()
-    time.sleep(1)
+    click_and_wait(food_browser, affordable_checkbox)
     
     # Verify count updated
     filtered_text = results_count.text
@@ -199,5 +204,47 @@ def test_hero_banner_present(food_browser):
     print("✅ Hero banner test passed - Banner present with relevant content")
 
 
+
+def test_cards_survive_filter_changes(food_browser):
+    """
+    UI Test 8: Verify filtering reuses the same card elements - a card that
+    is filtered out and back in is the same element, and clicking it still
+    expands it through the container's single listener.
+    """
+    wait_for_food_cards_to_load(food_browser)
+    
+    first_card = get_visible_food_cards(food_browser)[0]
+    checkbox = food_browser.find_element(By.CLASS_NAME, "cuisine-checkbox")
+    click_and_wait(food_browser, checkbox)
+    click_and_wait(food_browser, checkbox)
+    
+    assert get_visible_food_cards(food_browser)[0] == first_card, "Card was rebuilt by a filter change"
+    first_card.find_element(By.CLASS_NAME, "restaurant-name").click()
+    assert "expanded" in first_card.get_attribute("class"), "Card did not expand after filtering"
+    
+    result = measure_filter_toggles(food_browser, ".cuisine-checkbox, .budget-checkbox")
+    assert result["createdPerToggle"] == 0, f"{result['createdPerToggle']:.1f} elements built per toggle"
+    
+    print(f"✅ Card reuse test passed - {result['msPerToggle']:.2f} ms per filter toggle")
+
+
+def test_rapid_filter_clicks_render_once(food_browser):
+    """
+    UI Test 9: Verify cuisine and budget filters clicked back to back are
+    applied in one filter run and one render.
+    """
+    wait_for_food_cards_to_load(food_browser)
+    checkboxes = (food_browser.find_elements(By.CLASS_NAME, "cuisine-checkbox")[:2] +
+                  food_browser.find_elements(By.CLASS_NAME, "budget-checkbox")[:2])
+    
+    burst = click_burst(food_browser, checkboxes)
+    
+    assert burst["requests"] == len(checkboxes)
+    assert burst["runs"] == burst["renders"] == burst["events"] == 1, \
+        f"{burst['runs']} runs / {burst['renders']} renders for one burst of clicks"
+    
+    print(f"✅ Rapid click test passed - {len(checkboxes)} clicks, 1 render of {burst['last']['count']} places")
+
+
 if __name__ == "__main__":
     print("Run tests using: pytest test_food_suites/test_ui_ux.py -v")
@@ -0,0 +1,4 @@
+"""
+Test Harness Suites
+Checks for the shared test infrastructure (driver pool, server, wait helpers)
+"""
@@ -0,0 +1,65 @@
+"""
+App Lifecycle Event Tests 📡
+Verifies both pages publish the readiness signals the wait helpers block on.
+"""
+
+from selenium.webdriver.common.by import By
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+from selenium_tests.helpers import (
+    wait_for_app_event,
+    wait_for_cards_to_load,
+    wait_for_food_cards_to_load,
+    get_visible_cards,
+    click_and_wait,
+    HITEC_CITY
+)
+
+
+def test_places_page_publishes_lifecycle(geo_browser):
+    """
+    Event Test 1: data-loaded, location-resolved and filters-applied fire in
+    order on the tourist places page, with counts matching the rendered cards.
+    """
+    loaded = wait_for_app_event(geo_browser, "data-loaded")
+    location = wait_for_app_event(geo_browser, "location-resolved")
+    applied = wait_for_cards_to_load(geo_browser)
+
+    assert loaded["count"] == applied["total"]
+    assert location["granted"] is True
+    assert location["latitude"] == HITEC_CITY["latitude"]
+    assert applied["count"] == len(get_visible_cards(geo_browser))
+
+    print(f"✅ Places lifecycle test passed - {applied['count']} cards after data-loaded")
+
+
+def test_filter_click_reports_result_count(browser):
+    """
+    Event Test 2: a filter click publishes filters-applied with the new count.
+    """
+    wait_for_cards_to_load(browser)
+
+    heritage = browser.find_element(By.CSS_SELECTOR, "input.filter-checkbox[data-type='Heritage']")
+    applied = click_and_wait(browser, heritage)
+
+    assert 0 < applied["count"] < applied["total"]
+    assert applied["count"] == len(get_visible_cards(browser))
+
+    print(f"✅ Filter event test passed - {applied['count']} of {applied['total']}")
+
+
+def test_food_page_publishes_lifecycle(food_browser):
+    """
+    Event Test 3: the food page publishes data-loaded and filters-applied.
+    """
+    loaded = wait_for_app_event(food_browser, "data-loaded")
+    applied = wait_for_food_cards_to_load(food_browser)
+
+    assert loaded["count"] == applied["count"] == applied["total"]
+
+    print(f"✅ Food lifecycle test passed - {loaded['count']} food places")
+
+
+if __name__ == "__main__":
+    print("Run tests using: pytest harness/test_app_events.py -v")
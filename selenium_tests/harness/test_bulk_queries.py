@@ -0,0 +1,64 @@
+"""
+Bulk DOM Query Tests 📦
+Verifies the card and filter helpers need a constant number of WebDriver
+round trips, no matter how many cards are on the page.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+from selenium_tests.helpers import (
+    wait_for_cards_to_load,
+    wait_for_food_cards_to_load,
+    get_visible_cards,
+    get_visible_card_data,
+    get_visible_food_card_data,
+    click_budget_filter_checkbox,
+    count_round_trips
+)
+
+
+def test_destination_card_data_in_one_round_trip(browser):
+    """
+    Bulk Test 1: all 40 destinations are read with a single command.
+    """
+    wait_for_cards_to_load(browser)
+
+    with count_round_trips(browser) as trips:
+        cards = get_visible_card_data(browser)
+
+    assert trips.count == 1, f"Expected 1 round trip, got {trips.count}"
+    assert len(cards) == 40
+    assert all(card["name"] and card["type"] and card["budget"] for card in cards)
+
+    with count_round_trips(browser) as trips:
+        elements = get_visible_cards(browser)
+
+    assert trips.count == 1
+    assert len(elements) == len(cards)
+
+    print(f"✅ Destination bulk query test passed - {len(cards)} cards in 1 round trip")
+
+
+def test_food_card_data_and_label_click_constant_round_trips(food_browser):
+    """
+    Bulk Test 2: all 44 food places are read, and a budget filter is clicked
+    by its label and awaited, with one command each.
+    """
+    wait_for_food_cards_to_load(food_browser)
+
+    with count_round_trips(food_browser) as trips:
+        cards = get_visible_food_card_data(food_browser)
+        applied = click_budget_filter_checkbox(food_browser, "Budget Friendly (Under ₹200)")
+        filtered = get_visible_food_card_data(food_browser)
+
+    assert trips.count == 3, f"Expected 3 round trips, got {trips.count}"
+    assert len(cards) == 44
+    assert applied["count"] == len(filtered)
+    assert all(card["budget"] <= 200 for card in filtered)
+
+    print(f"✅ Food bulk query test passed - {len(cards)} -> {len(filtered)} cards in 3 round trips")
+
+
+if __name__ == "__main__":
+    print("Run tests using: pytest harness/test_bulk_queries.py -v")
@@ -0,0 +1,68 @@
+"""
+Driver Pool Tests ♻️
+Verifies pooled browser contexts are isolated and measures the startup cost
+they save compared with launching a new Chrome for every test.
+"""
+
+import time
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+from selenium_tests.driver_pool import launch_chrome
+from selenium_tests.helpers import wait_for_cards_to_load
+
+
+def test_contexts_do_not_share_storage(driver_pool):
+    """
+    Isolation Test: cookies and localStorage set in one context are gone in the next.
+    """
+    driver = driver_pool.open_context('index.html')
+    driver.execute_script("localStorage.setItem('leak', 'yes'); document.cookie = 'leak=yes';")
+    driver_pool.close_context()
+
+    driver = driver_pool.open_context('index.html')
+    leaked = driver.execute_script("return [localStorage.getItem('leak'), document.cookie];")
+    driver_pool.close_context()
+
+    assert leaked == [None, ''], f"State leaked between browser contexts: {leaked}"
+    print("✅ Context isolation test passed")
+
+
+def test_pooled_context_is_cheaper_than_new_chrome(driver_pool):
+    """
+    Timing Comparison: cold Chrome launch + quit vs. pooled context open + close.
+    Both variants load the same page so only the browser startup cost differs.
+    """
+    runs = 3
+
+    cold_total = 0.0
+    for _ in range(runs):
+        start = time.perf_counter()
+        driver = launch_chrome()
+        driver.get(f'{driver_pool.base_url}/index.html')
+        wait_for_cards_to_load(driver)
+        driver.quit()
+        cold_total += time.perf_counter() - start
+
+    pooled_total = 0.0
+    for _ in range(runs):
+        start = time.perf_counter()
+        driver = driver_pool.open_context('index.html')
+        wait_for_cards_to_load(driver)
+        driver_pool.close_context()
+        pooled_total += time.perf_counter() - start
+
+    cold_ms = cold_total / runs * 1000
+    pooled_ms = pooled_total / runs * 1000
+
+    assert pooled_ms < cold_ms, \
+        f"Pooled context ({pooled_ms:.0f} ms) was not faster than a new Chrome ({cold_ms:.0f} ms)"
+
+    print(f"✅ Driver pool timing test passed")
+    print(f"   - New Chrome per test: {cold_ms:.0f} ms")
+    print(f"   - Pooled context:      {pooled_ms:.0f} ms")
+    print(f"   - Saved per test:      {cold_ms - pooled_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    print("Run tests using: pytest harness/test_driver_pool.py -v")
@@ -0,0 +1,68 @@
+"""
+Test Server Tests 🛰️
+Verifies the per-worker static server serves Devops/ by absolute path,
+from memory, with keep-alive, conditional requests and gzip.
+"""
+
+import gzip
+import http.client
+import json
+import urllib.request
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+
+def test_server_serves_site_without_chdir(base_url):
+    """
+    Server Test 1: data.json is served and the working directory is untouched.
+    """
+    with urllib.request.urlopen(f"{base_url}/data.json") as response:
+        destinations = json.load(response)
+
+    assert len(destinations) == 40
+    assert not os.getcwd().endswith("Devops"), "Server should not chdir into Devops/"
+
+    print(f"✅ Server test passed - {base_url} serves {len(destinations)} destinations")
+
+
+def test_server_uses_ephemeral_port(base_url):
+    """
+    Server Test 2: the port is picked by the OS, not hard-coded.
+    """
+    port = int(base_url.rsplit(":", 1)[1])
+    assert port != 9999, "Server should not bind the old hard-coded port"
+
+    print(f"✅ Ephemeral port test passed - port {port}")
+
+
+def test_keep_alive_etag_and_gzip(static_server):
+    """
+    Server Test 3: one connection serves a gzip response, then a 304 for the
+    same ETag, and the request counts show up in the per-path stats.
+    """
+    before = static_server.stats.get("/data.json", [0])[0]
+    connection = http.client.HTTPConnection(static_server.host, static_server.port)
+
+    connection.request("GET", "/data.json", headers={"Accept-Encoding": "gzip"})
+    response = connection.getresponse()
+    body = response.read()
+    etag = response.getheader("ETag")
+
+    assert response.status == 200
+    assert response.getheader("Content-Encoding") == "gzip"
+    assert len(json.loads(gzip.decompress(body))) == 40
+
+    connection.request("GET", "/data.json", headers={"If-None-Match": etag})
+    response = connection.getresponse()
+    response.read()
+    connection.close()
+
+    assert response.status == 304
+    assert static_server.stats["/data.json"][0] == before + 2
+
+    print(f"✅ Keep-alive/ETag/gzip test passed - {len(body)} gzip bytes, then 304")
+
+
+if __name__ == "__main__":
+    print("Run tests using: pytest harness/test_server.py -v")
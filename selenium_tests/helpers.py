@@ -2,22 +2,262 @@
 Helper Functions for City Quest Tests
 Shared utilities used across multiple test files
 
-Note: Tests now use a local HTTP server (http://localhost:8888) 
-instead of file:// protocol to properly load data.json files.
+Note: Tests use a local HTTP server (one per xdist worker, on an ephemeral
+port - see the base_url fixture) instead of file:// protocol to properly
+load data.json files.
 """
 
+import re
+from contextlib import contextmanager
+
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import time
+
+
+# Mock location used by the geolocation and distance tests
+HITEC_CITY = {
+    "latitude": 17.4435,
+    "longitude": 78.3772,
+    "accuracy": 100
+}
+
+
+# Shared tail of the event scripts below: resolves `done` with the detail of
+# the first `name` event published after event number `since` (see
+# Devops/app-events.js), or with a timeout marker.
+_AWAIT_EVENT_JS = """
+const find = () => (window.cityQuestEvents || []).find(e => e.seq > since && e.name === name);
+const hit = find();
+if (hit) { done({ found: true, detail: hit.detail }); return; }
+const timer = setTimeout(() => done({ found: false }), timeoutMs);
+document.addEventListener('cityquest:' + name, () => {
+    clearTimeout(timer);
+    done({ found: true, detail: find().detail });
+}, { once: true });
+"""
+
+_WAIT_FOR_EVENT_JS = """
+const [name, since, timeoutMs, done] = arguments;
+""" + _AWAIT_EVENT_JS
+
+# Clicks `element` first so the click and the wait share one round trip.
+_CLICK_AND_WAIT_JS = """
+const [element, name, timeoutMs, done] = arguments;
+const since = (window.cityQuestEvents || []).length;
+element.click();
+""" + _AWAIT_EVENT_JS
+
+# Finds a checkbox by the text of its <label>, clicks it and waits.
+_CLICK_LABEL_AND_WAIT_JS = """
+const [checkboxSelector, labelText, name, timeoutMs, done] = arguments;
+const checkbox = Array.from(document.querySelectorAll(checkboxSelector))
+    .find(cb => cb.parentElement.textContent.includes(labelText));
+if (!checkbox) { done({ found: false, missing: true }); return; }
+const since = (window.cityQuestEvents || []).length;
+checkbox.click();
+""" + _AWAIT_EVENT_JS
+
+# Clicks every element back to back, as a quick user would, waits for the
+# page to publish `name` and then for two more frames, so a late extra
+# render would be seen. Reports how many `name` events there were and the
+# change in the page's filter stats (see Devops/filter-scheduler.js).
+_CLICK_BURST_JS = """
+const [elements, name, timeoutMs, done] = arguments;
+const since = (window.cityQuestEvents || []).length;
+const stats = () => ({ ...window.cityQuestFilterRuns.stats });
+const before = stats();
+elements.forEach(element => element.click());
+const timer = setTimeout(() => done({ found: false }), timeoutMs);
+document.addEventListener('cityquest:' + name, () => {
+    clearTimeout(timer);
+    requestAnimationFrame(() => requestAnimationFrame(() => {
+        const after = stats();
+        const published = window.cityQuestEvents.filter(e => e.seq > since && e.name === name);
+        done({ found: true, detail: {
+            events: published.length,
+            last: published[published.length - 1].detail,
+            requests: after.requests - before.requests,
+            runs: after.runs - before.runs,
+            renders: after.renders - before.renders
+        } });
+    }));
+}, { once: true });
+"""
+
+# Picks an <option> by value and fires 'change' the way a user would.
+_SELECT_AND_WAIT_JS = """
+const [select, value, name, timeoutMs, done] = arguments;
+const since = (window.cityQuestEvents || []).length;
+select.value = value;
+select.dispatchEvent(new Event('change', { bubbles: true }));
+""" + _AWAIT_EVENT_JS
+
+# Types into a text box the way a user would: one 'input' event per change.
+_TYPE_AND_WAIT_JS = """
+const [input, text, name, timeoutMs, done] = arguments;
+const since = (window.cityQuestEvents || []).length;
+input.value = text;
+input.dispatchEvent(new Event('input', { bubbles: true }));
+""" + _AWAIT_EVENT_JS
+
+_IS_VISIBLE_JS = """
+const isVisible = el => el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden';
+"""
+
+_VISIBLE_ELEMENTS_JS = _IS_VISIBLE_JS + """
+return Array.from(document.querySelectorAll(arguments[0])).filter(isVisible);
+"""
+
+# Reads the text of a few child elements of every visible card in one go.
+_VISIBLE_CARD_TEXT_JS = _IS_VISIBLE_JS + """
+const [cardSelector, fields] = arguments;
+return Array.from(document.querySelectorAll(cardSelector)).filter(isVisible).map(card => {
+    const row = {};
+    for (const [key, selector] of Object.entries(fields)) {
+        const el = card.querySelector(selector);
+        row[key] = el ? el.textContent.trim() : null;
+    }
+    return row;
+});
+"""
+
+DESTINATION_CARD_FIELDS = {
+    "name": ".destination-name",
+    "type": ".place-type",
+    "budget": ".entry-fee",
+    "distance": ".distance-value",
+}
+
+FOOD_CARD_FIELDS = {
+    "name": ".restaurant-name",
+    "type": ".place-type",
+    "budget": ".budget-badge",
+    "distance": ".distance-badge",
+}
+
+
+def app_event_count(browser):
+    """Number of lifecycle events the page has published so far."""
+    return browser.execute_script("return (window.cityQuestEvents || []).length;")
+
+
+def wait_for_app_event(browser, name, since=0, timeout=10):
+    """
+    Block until the page publishes a lifecycle event.
+
+    Args:
+        browser: Selenium WebDriver instance
+        name: Event name ('first-cards', 'data-loaded', 'location-resolved',
+            'filters-applied', 'nearest-ranked' or 'nearest-refined')
+        since: Only accept events published after this many events
+            (use app_event_count() before triggering an action)
+        timeout: Maximum time to wait in seconds
+
+    Returns:
+        dict: The event detail (e.g. {'count': 12, 'total': 40})
+    """
+    result = browser.execute_async_script(_WAIT_FOR_EVENT_JS, name, since, int(timeout * 1000))
+    return _event_detail(result, f"Page did not publish '{name}' within {timeout}s")
+
+
+def app_event_time(browser, name):
+    """performance.now() of the page's first `name` event, in ms (None if not published)."""
+    return browser.execute_script(
+        "const hit = (window.cityQuestEvents || []).find(e => e.name === arguments[0]);"
+        "return hit ? hit.time : null;", name)
+
+
+def _wait_for_loaded_cards(browser, timeout):
+    # The pages draw cards as data streams in and publish data-loaded after
+    # the last of it; older revisions (see benchmarks/) drew them afterwards
+    wait_for_app_event(browser, "data-loaded", timeout=timeout)
+    applied = browser.execute_script(
+        "const applied = window.cityQuestEvents.filter(e => e.name === 'filters-applied');"
+        "return applied.length ? applied[applied.length - 1].detail : null;")
+    return applied or wait_for_app_event(browser, "filters-applied", timeout=timeout)
+
+
+def click_and_wait(browser, element, event="filters-applied", timeout=10):
+    """
+    Click an element and block until the page publishes `event` in response.
+
+    Returns:
+        dict: The event detail
+    """
+    result = browser.execute_async_script(_CLICK_AND_WAIT_JS, element, event, int(timeout * 1000))
+    return _event_detail(result, f"Page did not publish '{event}' within {timeout}s of the click")
+
+
+def click_burst(browser, elements, event="filters-applied", timeout=10):
+    """
+    Click `elements` back to back in one go and wait for the page to settle.
+
+    Returns:
+        dict: 'events' (how many `event`s were published), 'last' (the last
+            one's detail) and the 'requests', 'runs' and 'renders' of the
+            page's filter scheduler the clicks caused
+    """
+    result = browser.execute_async_script(_CLICK_BURST_JS, elements, event, int(timeout * 1000))
+    return _event_detail(result, f"Page did not publish '{event}' within {timeout}s of the clicks")
+
+
+def click_filter_by_label(browser, checkbox_class, label, event="filters-applied", timeout=10):
+    """
+    Click the filter checkbox whose label contains `label` and wait for `event`.
+    Lookup, click and wait all happen in a single WebDriver round trip.
+
+    Args:
+        browser: Selenium WebDriver instance
+        checkbox_class: CSS class of the checkboxes (e.g. 'budget-checkbox')
+        label: Text (or part of it) shown next to the checkbox
+        event: Lifecycle event to wait for after the click
+        timeout: Maximum time to wait in seconds
+
+    Returns:
+        dict: The event detail
+    """
+    result = browser.execute_async_script(
+        _CLICK_LABEL_AND_WAIT_JS, f"input.{checkbox_class}", label, event, int(timeout * 1000)
+    )
+    if result.get("missing"):
+        raise Exception(f"Filter '{label}' not found")
+    return _event_detail(result, f"Page did not publish '{event}' within {timeout}s of the click")
+
+
+def _event_detail(result, timeout_message):
+    if not result["found"]:
+        raise TimeoutException(timeout_message)
+    return result["detail"]
+
+
+def show_nearest_places(browser, timeout=20):
+    """
+    Click 'Show Nearest 5 Places' and wait until the refinement has finished.
+
+    Returns:
+        dict: The 'nearest-refined' event detail
+    """
+    nearest_btn = browser.find_element(By.ID, "find-nearby-btn")
+    return click_and_wait(browser, nearest_btn, event="nearest-refined", timeout=timeout)
+
+
+# Scrolls a windowed results grid (Devops/windowed-grid.js) to the first
+# shown card whose name contains the text, so the card is in the page.
+_REVEAL_CARD_JS = """
+const [containerSelector, name] = arguments;
+const grid = WindowedGrid.of(document.querySelector(containerSelector));
+if (grid) grid.reveal(item => item.name.includes(name));
+"""
 
 
 def find_card(browser, name):
     """
     Helper function to find a destination card by its name.
-    Uses <h3> tag for card titles.
+    Uses <h3> tag for card titles. Large result grids only keep the cards
+    near the viewport in the page, so the card is scrolled into view first.
     """
     try:
+        browser.execute_script(_REVEAL_CARD_JS, "#destinations-container", name)
         return browser.find_element(
             By.XPATH, 
             f"//div[contains(@class, 'destination-card')][.//h3[contains(text(), '{name}')]]"
@@ -27,16 +267,38 @@ def find_card(browser, name):
 
 
 def wait_for_cards_to_load(browser, timeout=10):
-    """Wait for destination cards to be loaded and visible."""
-    WebDriverWait(browser, timeout).until(
-        EC.presence_of_element_located((By.CLASS_NAME, "destination-card"))
-    )
+    """Wait until every destination has loaded and its cards have been rendered."""
+    return _wait_for_loaded_cards(browser, timeout)
 
 
 def get_visible_cards(browser):
-    """Get all currently visible destination cards."""
-    cards = browser.find_elements(By.CLASS_NAME, "destination-card")
-    return [card for card in cards if card.is_displayed()]
+    """Get all currently visible destination cards (one round trip)."""
+    return browser.execute_script(_VISIBLE_ELEMENTS_JS, ".destination-card")
+
+
+def get_visible_card_data(browser):
+    """
+    Read every visible destination card as plain Python data in one round trip.
+
+    Returns:
+        list: One dict per card with 'name', 'type' (list of types),
+            'budget' (entry fee text) and 'distance' (km as float, or None)
+    """
+    rows = browser.execute_script(_VISIBLE_CARD_TEXT_JS, ".destination-card", DESTINATION_CARD_FIELDS)
+    return [
+        {
+            "name": row["name"],
+            "type": [t.strip() for t in _strip_label(row["type"]).split(",")],
+            "budget": _strip_label(row["budget"]),
+            "distance": _parse_km(row["distance"]),
+        }
+        for row in rows
+    ]
+
+
+def get_visible_card_names(browser):
+    """Names of the visible destination cards, in display order."""
+    return [card["name"] for card in get_visible_card_data(browser)]
 
 
 def click_filter_checkbox(browser, filter_class, data_attribute, value):
@@ -52,9 +314,9 @@ def click_filter_checkbox(browser, filter_class, data_attribute, value):
         By.CSS_SELECTOR, 
         f"input.{filter_class}[data-{data_attribute}='{value}']"
     )
-    checkbox.click()
-    time.sleep(1)  # Allow filtering to complete
-    
+    return click_and_wait(browser, checkbox)
+
+
 def find_food_card(browser, name):
     """
     Finds a food card element based on the restaurant/place name.
@@ -66,6 +328,7 @@ def find_food_card(browser, name):
     Returns:
         WebElement: The food card element
     """
+    browser.execute_script(_REVEAL_CARD_JS, "#food-places-container", name)
     return browser.find_element(
         By.XPATH, 
         f"//div[contains(@class, 'food-place-card')][.//h3[contains(text(), '{name}')]]"
@@ -74,15 +337,16 @@ def find_food_card(browser, name):
 
 def wait_for_food_cards_to_load(browser, timeout=15):
     """
-    Wait for food cards to be loaded on the page.
+    Wait until every food place has loaded and its cards have been rendered.
     
     Args:
         browser: Selenium WebDriver instance
         timeout: Maximum time to wait in seconds
+    
+    Returns:
+        dict: The filters-applied detail of the cards on screen
     """
-    WebDriverWait(browser, timeout).until(
-        EC.presence_of_element_located((By.CLASS_NAME, "food-place-card"))
-    )
+    return _wait_for_loaded_cards(browser, timeout)
 
 
 def get_visible_food_cards(browser):
@@ -95,8 +359,32 @@ def get_visible_food_cards(browser):
     Returns:
         list: List of visible food card WebElements
     """
-    all_cards = browser.find_elements(By.CLASS_NAME, "food-place-card")
-    return [card for card in all_cards if card.is_displayed()]
+    return browser.execute_script(_VISIBLE_ELEMENTS_JS, ".food-place-card")
+
+
+def get_visible_food_card_data(browser):
+    """
+    Read every visible food card as plain Python data in one round trip.
+
+    Returns:
+        list: One dict per card with 'name', 'type' (cuisine text),
+            'budget' (max budget for one as int) and 'distance' (km as float, or None)
+    """
+    rows = browser.execute_script(_VISIBLE_CARD_TEXT_JS, ".food-place-card", FOOD_CARD_FIELDS)
+    return [
+        {
+            "name": row["name"],
+            "type": row["type"],
+            "budget": int(row["budget"].lstrip("₹")) if row["budget"] else None,
+            "distance": _parse_km(row["distance"]),
+        }
+        for row in rows
+    ]
+
+
+def get_visible_food_card_names(browser):
+    """Names of the visible food cards, in display order."""
+    return [card["name"] for card in get_visible_food_card_data(browser)]
 
 
 def click_cuisine_filter_checkbox(browser, cuisine_type):
@@ -111,7 +399,7 @@ def click_cuisine_filter_checkbox(browser, cuisine_type):
         By.CSS_SELECTOR,
         f"input.cuisine-checkbox[data-cuisine='{cuisine_type}']"
     )
-    checkbox.click()
+    return click_and_wait(browser, checkbox)
 
 
 def click_budget_filter_checkbox(browser, budget_label):
@@ -123,14 +411,7 @@ def click_budget_filter_checkbox(browser, budget_label):
         budget_label: Budget label text (e.g., 'Budget Friendly (Under ₹200)')
     """
     # Find by label text since data attributes are min/max budget values
-    checkboxes = browser.find_elements(By.CSS_SELECTOR, "input.budget-checkbox")
-    for checkbox in checkboxes:
-        parent_label = checkbox.find_element(By.XPATH, "..")
-        if budget_label in parent_label.text:
-            checkbox.click()
-            time.sleep(0.5)  # Wait for filter to apply
-            return
-    raise Exception(f"Budget filter '{budget_label}' not found")
+    return click_filter_by_label(browser, "budget-checkbox", budget_label)
 
 
 def get_clear_filters_button(browser):
@@ -145,3 +426,256 @@ def get_clear_filters_button(browser):
     """
     return browser.find_element(By.ID, "clear-filters")
 
+
+def get_filter_option_counts(browser, checkbox_class):
+    """
+    The live result count shown next to each filter option.
+
+    Args:
+        browser: Selenium WebDriver instance
+        checkbox_class: CSS class of the checkboxes (e.g. 'cuisine-checkbox')
+
+    Returns:
+        dict: {option label: count}, read in a single round trip
+    """
+    rows = browser.execute_script("""
+        return Array.from(document.querySelectorAll('input.' + arguments[0])).map(cb => {
+            const badge = cb.parentElement.querySelector('.option-count');
+            return [cb.nextElementSibling.textContent, badge ? badge.textContent : null];
+        });
+    """, checkbox_class)
+    return {label: int(count.strip("()")) if count else None for label, count in rows}
+
+
+def show_nearby_food_places(browser, timeout=10):
+    """
+    Click '📍 Show Nearby Places' and wait for the nearest-first ranking.
+
+    Returns:
+        dict: The 'nearby-ranked' event detail (count, examined, elapsedMs)
+    """
+    nearby_btn = browser.find_element(By.ID, "show-nearby")
+    return click_and_wait(browser, nearby_btn, event="nearby-ranked", timeout=timeout)
+
+
+def select_radius_filter(browser, km, event="nearby-ranked", timeout=10):
+    """
+    Choose a radius in the food page's distance dropdown and wait for `event`.
+
+    Args:
+        browser: Selenium WebDriver instance
+        km: Radius option value (e.g. 2), or '' for 'Any distance'
+    """
+    select = browser.find_element(By.ID, "radius-filter")
+    result = browser.execute_async_script(
+        _SELECT_AND_WAIT_JS, select, str(km), event, int(timeout * 1000)
+    )
+    return _event_detail(result, f"Page did not publish '{event}' within {timeout}s of the change")
+
+
+def search_and_wait(browser, text, event="filters-applied", timeout=10):
+    """
+    Put `text` in the page's search box and wait for `event`.
+
+    Returns:
+        dict: The event detail
+    """
+    search_input = browser.find_element(By.ID, "search-input")
+    result = browser.execute_async_script(
+        _TYPE_AND_WAIT_JS, search_input, text, event, int(timeout * 1000)
+    )
+    return _event_detail(result, f"Page did not publish '{event}' within {timeout}s of typing")
+
+
+# Toggles every checkbox matching a selector on and off. A first pass warms
+# up (builds whatever the page caches); the measured pass counts elements
+# the page creates and the main-thread time of each toggle, layout included.
+_MEASURE_TOGGLES_JS = """
+const [selector, repeat] = arguments;
+const checkboxes = Array.from(document.querySelectorAll(selector));
+const seen = new WeakSet(document.querySelectorAll('*'));
+const observer = new MutationObserver(() => {});
+observer.observe(document.body, { childList: true, subtree: true });
+
+// Elements added since the last call that the page never showed before
+const countCreated = () => {
+    let created = 0;
+    observer.takeRecords().forEach(record => record.addedNodes.forEach(node => {
+        if (node.nodeType !== Node.ELEMENT_NODE) return;
+        [node, ...node.querySelectorAll('*')].forEach(element => {
+            if (!seen.has(element)) { seen.add(element); created++; }
+        });
+    }));
+    return created;
+};
+const toggleAll = totals => checkboxes.forEach(checkbox => [0, 1].forEach(() => {
+    const started = performance.now();
+    checkbox.click();
+    if (window.cityQuestFilterRuns) window.cityQuestFilterRuns.flush();  // don't wait for the next frame
+    document.body.offsetHeight;  // include style and layout
+    totals.ms += performance.now() - started;
+    totals.created += countCreated();
+}));
+
+toggleAll({ ms: 0, created: 0 });
+const totals = { ms: 0, created: 0 };
+for (let i = 0; i < repeat; i++) toggleAll(totals);
+observer.disconnect();
+const toggles = checkboxes.length * 2 * repeat;
+return { toggles, createdPerToggle: totals.created / toggles, msPerToggle: totals.ms / toggles };
+"""
+
+
+def measure_filter_toggles(browser, checkbox_selector, repeat=3):
+    """
+    Toggle every filter checkbox matching `checkbox_selector` on and off,
+    `repeat` times after one warm-up pass, all inside the page.
+
+    Returns:
+        dict: 'toggles', 'createdPerToggle' (elements the page built per
+            toggle) and 'msPerToggle' (main-thread ms per toggle)
+    """
+    return browser.execute_script(_MEASURE_TOGGLES_JS, checkbox_selector, repeat)
+
+
+# Scrolls the page down by `step` pixels every animation frame and records
+# the time between frames and the size of the DOM along the way.
+_SCROLL_FRAMES_JS = """
+const [containerSelector, frames, step, done] = arguments;
+const container = document.querySelector(containerSelector);
+const intervals = [];
+let maxCards = 0, maxElements = 0, last = null;
+const tick = now => {
+    if (last !== null) intervals.push(now - last);
+    last = now;
+    maxCards = Math.max(maxCards, container.children.length);
+    maxElements = Math.max(maxElements, document.getElementsByTagName('*').length);
+    if (intervals.length >= frames) {
+        intervals.sort((a, b) => a - b);
+        done({
+            frames: intervals.length,
+            p95Ms: intervals[Math.floor(intervals.length * 0.95)],
+            maxMs: intervals[intervals.length - 1],
+            maxCards, maxElements,
+            scrollHeight: document.documentElement.scrollHeight
+        });
+        return;
+    }
+    window.scrollBy(0, step);
+    requestAnimationFrame(tick);
+};
+requestAnimationFrame(tick);
+"""
+
+
+def measure_scroll_frames(browser, container_selector, frames=120, step_px=600):
+    """
+    Scroll down `step_px` per animation frame for `frames` frames.
+
+    Returns:
+        dict: 'p95Ms' and 'maxMs' (time between frames), 'maxCards' (most
+            children the results container had), 'maxElements' (most
+            elements in the document) and the final 'scrollHeight'
+    """
+    return browser.execute_async_script(_SCROLL_FRAMES_JS, container_selector, frames, step_px)
+
+
+# Clicks a checkbox `repeat` times, each time waiting for the page to
+# publish filters-applied and for the frame after it to be painted. A
+# requestAnimationFrame loop runs throughout to find the longest frame, i.e.
+# the longest the main thread was too busy to paint.
+_INPUT_TO_PAINT_JS = """
+const [checkbox, repeat, done] = arguments;
+const latencies = [];
+let longestFrame = 0, last = null, running = true;
+const tick = now => {
+    if (last !== null) longestFrame = Math.max(longestFrame, now - last);
+    last = now;
+    if (running) requestAnimationFrame(tick);
+};
+requestAnimationFrame(tick);
+
+const round = () => {
+    if (latencies.length >= repeat) {
+        running = false;
+        const sorted = latencies.slice().sort((a, b) => a - b);
+        done({ latencies, medianMs: sorted[Math.floor(sorted.length / 2)],
+               maxMs: sorted[sorted.length - 1], longestFrameMs: longestFrame });
+        return;
+    }
+    const started = performance.now();
+    document.addEventListener('cityquest:filters-applied', () => {
+        requestAnimationFrame(() => setTimeout(() => {
+            latencies.push(performance.now() - started);
+            round();
+        }, 0));
+    }, { once: true });
+    checkbox.click();
+};
+requestAnimationFrame(() => requestAnimationFrame(round));
+"""
+
+
+def measure_input_to_paint(browser, checkbox, repeat=6):
+    """
+    Click `checkbox` `repeat` times and time each click until the filtered
+    cards are painted.
+
+    Returns:
+        dict: 'latencies', 'medianMs' and 'maxMs' (click to paint) and
+            'longestFrameMs' (longest gap between painted frames meanwhile)
+    """
+    return browser.execute_async_script(_INPUT_TO_PAINT_JS, checkbox, repeat)
+
+
+@contextmanager
+def throttle_cpu(browser, rate):
+    """
+    Slow the page's CPU down `rate` times inside the block, like a low-end
+    phone.
+    """
+    browser.execute_cdp_cmd("Emulation.setCPUThrottlingRate", {"rate": rate})
+    try:
+        yield
+    finally:
+        browser.execute_cdp_cmd("Emulation.setCPUThrottlingRate", {"rate": 1})
+
+
+@contextmanager
+def count_round_trips(browser):
+    """
+    Count WebDriver commands (HTTP round trips) issued inside the block.
+
+    Usage:
+        with count_round_trips(browser) as trips:
+            get_visible_card_data(browser)
+        assert trips.count == 1
+    """
+    class _Counter:
+        count = 0
+
+    counter = _Counter()
+    execute = browser.execute
+
+    def counting_execute(*args, **kwargs):
+        counter.count += 1
+        return execute(*args, **kwargs)
+
+    browser.execute = counting_execute
+    try:
+        yield counter
+    finally:
+        del browser.execute
+
+
+def _strip_label(text):
+    # "Type: Fort, Monument" -> "Fort, Monument"
+    if text is None:
+        return ""
+    return text.split(":", 1)[1].strip() if ":" in text else text
+
+
+def _parse_km(text):
+    # "12.34 km" or "📍 12.34 km" -> 12.34, "N/A" or missing -> None
+    match = re.search(r"\d+(?:\.\d+)?", text or "")
+    return float(match.group()) if match else None
@@ -4,11 +4,18 @@ Tests for budget-based filtering functionality (Free, Under ₹50, etc.)
 """
 
 from selenium.webdriver.common.by import By
-import time
 import sys
 import os
 sys.path.insert(0, os.path.dirname(__file__))
-from selenium_tests.helpers import wait_for_cards_to_load, get_visible_cards
+from cityquest.build.compile_datasets import compile_destinations
+from cityquest.datasets import load_destinations
+from selenium_tests.helpers import (
+    wait_for_cards_to_load,
+    get_visible_cards,
+    get_visible_card_names,
+    click_and_wait,
+    click_filter_by_label
+)
 
 
 def test_filter_by_budget_free(browser):
@@ -24,8 +31,7 @@ def test_filter_by_budget_free(browser):
             By.CSS_SELECTOR,
             "input.budget-filter-checkbox[data-min='0'][data-max='0']"
         )
-        free_checkbox.click()
-        time.sleep(1)
+        click_and_wait(browser, free_checkbox)
         
         filtered_cards = get_visible_cards(browser)
         assert len(filtered_cards) > 0, "No free places found"
@@ -46,8 +52,7 @@ def test_filter_by_budget_under_50(browser):
             By.CSS_SELECTOR,
             "input.budget-filter-checkbox[data-min='1'][data-max='50']"
         )
-        under_50_checkbox.click()
-        time.sleep(1)
+        click_and_wait(browser, under_50_checkbox)
         
         filtered_cards = get_visible_cards(browser)
         assert len(filtered_cards) > 0, "No places under ₹50 found"
@@ -69,8 +74,7 @@ def test_combined_type_and_budget_filter(browser):
             By.CSS_SELECTOR,
             "input.filter-checkbox[data-type='Heritage']"
         )
-        heritage_checkbox.click()
-        time.sleep(1)
+        click_and_wait(browser, heritage_checkbox)
         
         heritage_count = len(get_visible_cards(browser))
         
@@ -79,8 +83,7 @@ def test_combined_type_and_budget_filter(browser):
             By.CSS_SELECTOR,
             "input.budget-filter-checkbox[data-min='0'][data-max='0']"
         )
-        free_checkbox.click()
-        time.sleep(1)
+        click_and_wait(browser, free_checkbox)
         
         combined_count = len(get_visible_cards(browser))
         
@@ -92,5 +95,21 @@ def test_combined_type_and_budget_filter(browser):
         print(f"⚠️ Combined filter test failed: {e}")
 
 
+def test_filter_by_budget_above_1000(browser):
+    """
+    Budget Test 4: 'Above ₹1000' (open-ended range) shows exactly the places
+    whose headline fee is over ₹1000.
+    """
+    wait_for_cards_to_load(browser)
+    
+    click_filter_by_label(browser, "budget-filter-checkbox", "Above ₹1000")
+    
+    expected = [d["name"] for d in compile_destinations(load_destinations()) if d["fee"] >= 1000]
+    assert expected, "Dataset has no places above ₹1000"
+    assert get_visible_card_names(browser) == expected
+    
+    print(f"✅ Above ₹1000 filter test passed - {len(expected)} places found")
+
+
 if __name__ == "__main__":
     print("Run tests using: pytest test_budget_filters.py -v")
@@ -4,11 +4,10 @@ Tests for unusual scenarios and error handling.
 """
 
 from selenium.webdriver.common.by import By
-import time
 import sys
 import os
 sys.path.insert(0, os.path.dirname(__file__))
-from selenium_tests.helpers import wait_for_cards_to_load, get_visible_cards
+from selenium_tests.helpers import wait_for_cards_to_load, get_visible_cards, click_and_wait
 
 
 def test_no_results_message(browser):
@@ -23,8 +22,7 @@ def test_no_results_message(browser):
         
         # Click multiple filters to potentially get no results
         for i, checkbox in enumerate(checkboxes[:3]):
-            checkbox.click()
-            time.sleep(0.5)
+            click_and_wait(browser, checkbox)
         
         # Check if no-results message appears
         try:
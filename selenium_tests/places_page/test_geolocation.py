@@ -1,62 +1,246 @@
 """
 Geolocation Test 🗺️
 Tests for geolocation and nearest places functionality.
-Uses Chrome DevTools Protocol to mock user location.
+Uses the geo_browser fixture, which mocks the user location (Hitec City)
+through Chrome DevTools Protocol before the page loads.
 """
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import time
 import sys
 import os
 sys.path.insert(0, os.path.dirname(__file__))
-from selenium_tests.helpers import wait_for_cards_to_load, get_visible_cards
+from cityquest.routing import estimate_road_meters
+from selenium_tests.helpers import (
+    wait_for_cards_to_load,
+    get_visible_cards,
+    show_nearest_places,
+    find_card,
+    wait_for_app_event,
+    app_event_count,
+    app_event_time,
+    click_and_wait,
+    HITEC_CITY
+)
 
+# A permission prompt nobody answers: the browser never calls back
+_PENDING_LOCATION_JS = "navigator.geolocation.getCurrentPosition = () => {};"
 
-def test_geolocation_mock_and_nearest_places(browser):
+# Records alert() calls instead of blocking on them
+_RECORD_ALERTS_JS = "window.cityQuestAlerts = []; window.alert = message => window.cityQuestAlerts.push(message);"
+
+LOCATION_TIMEOUT_MS = 3000
+
+# A walk from Charminar: (metres north, metres east) of the start at each
+# step, and whether it is far enough from the last ranking (50 m) to re-rank
+CHARMINAR = {"latitude": 17.3616, "longitude": 78.4747, "accuracy": 10}
+WALK = [(10, 0, False), (30, 10, False), (200, 40, True), (210, 45, False), (500, 300, True), (520, 290, False)]
+
+# The "Follow Me" ranking, and the nearest places from scratch at the same spot
+_LIVE_RANKING_JS = """
+const ranked = window.liveNearestRanking.map(dest => dest.name);
+const expected = window.allDestinations
+    .map(dest => [dest.name, getHaversine(window.userLat, window.userLon, dest.latitude, dest.longitude)])
+    .sort((a, b) => a[1] - b[1]).slice(0, ranked.length).map(([name]) => name);
+return { ranked, expected };
+"""
+
+# Counts cards put into the results container from now on (a moved card is
+# removed and inserted again)
+_COUNT_CARD_INSERTS_JS = """
+window.cardInserts = 0;
+new MutationObserver(records => records.forEach(record => { window.cardInserts += record.addedNodes.length; }))
+    .observe(document.getElementById('destinations-container'), { childList: true });
+"""
+
+
+def test_geolocation_mock_and_nearest_places(geo_browser):
     """
     Geolocation Test: Mock user location and test nearest places functionality.
     Uses button ID 'find-nearby-btn' for reliable selection.
     """
-    wait_for_cards_to_load(browser)
+    wait_for_cards_to_load(geo_browser)
+    
+    # Click the nearest places button and wait for the refinement to finish
+    refined = show_nearest_places(geo_browser)
+    
+    # Verify cards are still visible
+    cards_after_sort = get_visible_cards(geo_browser)
+    assert len(cards_after_sort) > 0, "No cards visible after sorting by distance"
+    assert len(cards_after_sort) == refined["count"]
     
+    print(f"✅ Geolocation test passed - {len(cards_after_sort)} nearest places shown")
+
+
+def test_get_distance_uses_local_routing(geo_browser):
+    """
+    Geolocation Test 2: 'Get Distance' is answered by the local routing
+    stand-in configured through CityQuestConfig.routingBaseUrl.
+    """
+    wait_for_cards_to_load(geo_browser)
+    
+    card = find_card(geo_browser, "Golconda Fort")
+    card.find_element(By.CLASS_NAME, "calc-distance-btn").click()
+    distance = card.find_element(By.CLASS_NAME, "distance-value")
+    WebDriverWait(geo_browser, 5).until(lambda d: distance.text.endswith(" km"))
+    
+    expected_km = estimate_road_meters(
+        HITEC_CITY["latitude"], HITEC_CITY["longitude"], 17.3833, 78.4011
+    ) / 1000
+    assert abs(float(distance.text.split()[0]) - expected_km) < 0.01
+    
+    print(f"✅ Local routing test passed - Golconda Fort is {distance.text} away")
+
+
+def test_nearest_count_is_configurable(driver_pool):
+    """
+    Geolocation Test 3: CityQuestConfig.nearestCount ranks more than 5 places.
+    """
+    browser = driver_pool.open_context('index.html', geolocation=HITEC_CITY, config={"nearestCount": 8})
     try:
-        # Mock Hitec City coordinates using Chrome DevTools Protocol
-        hitec_city_coords = {
-            "latitude": 17.4435,
-            "longitude": 78.3772,
-            "accuracy": 100
-        }
-        browser.execute_cdp_cmd("Emulation.setGeolocationOverride", hitec_city_coords)
+        wait_for_app_event(browser, 'location-resolved')
+        wait_for_cards_to_load(browser)
         
-        # Wait a moment for the page to process location
-        time.sleep(2)
+        refined = show_nearest_places(browser)
         
-        # Click the nearest places button using its ID
-        nearest_btn = browser.find_element(By.ID, "find-nearby-btn")
-        nearest_btn.click()
+        assert refined["count"] == 8
+        assert len(get_visible_cards(browser)) == 8
+        assert "8" in browser.find_element(By.ID, "find-nearby-btn").text
+    finally:
+        driver_pool.close_context()
+    
+    print("✅ Configurable nearest count test passed - 8 places refined")
+
+
+def test_repeat_nearest_needs_no_routing_calls(geo_browser, static_server):
+    """
+    Geolocation Test 4: road distances are cached per neighbourhood and
+    destination id, so showing the nearest places again - even after a
+    reload - makes no routing requests.
+    """
+    wait_for_cards_to_load(geo_browser)
+    show_nearest_places(geo_browser)
+    
+    cached_ids = geo_browser.execute_script(
+        "return Array.from(window.roadDistanceCache.entries.keys(), key => key.split('|')[1]);")
+    card_ids = [card.get_attribute("id").removeprefix("dest-")
+                for card in geo_browser.find_elements(By.CSS_SELECTOR, "#destinations-container .destination-card")]
+    assert set(card_ids) <= set(cached_ids), f"Cache keys {cached_ids} are not keyed on destination ids"
+    
+    routing_requests = static_server.stats["/osrm/*"][0]
+    
+    show_nearest_places(geo_browser)
+    geo_browser.refresh()
+    wait_for_app_event(geo_browser, 'location-resolved')
+    show_nearest_places(geo_browser)
+    
+    cache_stats = geo_browser.execute_script("return window.roadDistanceCache.stats;")
+    assert static_server.stats["/osrm/*"][0] == routing_requests, "Cached distances were fetched again"
+    assert cache_stats["hits"] == 5 and cache_stats["misses"] == 0
+    
+    print(f"✅ Road distance cache test passed - {cache_stats['hits']} hits after reload")
+
+
+def test_cards_and_filters_do_not_wait_for_the_location(driver_pool):
+    """
+    Geolocation Test 5: with the location pending, granted or denied, the
+    cards are drawn and the filters respond as soon as the data is in;
+    the location only fills in distances afterwards, with no alert.
+    """
+    modes = {
+        "pending": {"scripts": [_PENDING_LOCATION_JS]},
+        "granted": {"geolocation": HITEC_CITY},
+        "denied": {"geolocation": "denied"},
+    }
+    results = {}
+    try:
+        for mode, options in modes.items():
+            scripts = [_RECORD_ALERTS_JS] + options.pop("scripts", [])
+            browser = driver_pool.open_context('index.html', config={"locationTimeoutMs": LOCATION_TIMEOUT_MS},
+                                               scripts=scripts, **options)
+            wait_for_cards_to_load(browser)
+            interactive_ms = app_event_time(browser, "data-loaded")
+            checkbox = browser.find_element(By.CLASS_NAME, "filter-checkbox")
+            applied = click_and_wait(browser, checkbox)
+            assert applied["count"] == len(get_visible_cards(browser))
+            click_and_wait(browser, checkbox)
+            
+            location = wait_for_app_event(browser, "location-resolved", timeout=LOCATION_TIMEOUT_MS / 1000 + 5)
+            if mode == "granted":
+                assert location["granted"] is True
+                distance = get_visible_cards(browser)[0].find_element(By.CLASS_NAME, "distance-value")
+                WebDriverWait(browser, 5).until(lambda _: distance.get_attribute("textContent") != "N/A")
+            else:
+                assert location == {"granted": False, "reason": "timeout" if mode == "pending" else "denied"}
+                assert browser.find_element(By.CLASS_NAME, "location-notice").is_displayed()
+            if mode == "pending":
+                assert interactive_ms < app_event_time(browser, "location-resolved"), \
+                    "Cards waited for the location"
+            assert browser.execute_script("return window.cityQuestAlerts") == []
+            results[mode] = interactive_ms
+    finally:
+        driver_pool.close_context()
+    
+    assert results["pending"] < LOCATION_TIMEOUT_MS, f"Interactive after {results['pending']:.0f} ms with the location pending"
+    
+    print("✅ Location-independent loading test passed - time to interactive: " +
+          ", ".join(f"{mode} {ms:.0f} ms" for mode, ms in results.items()))
+
+
+def _walk_to(browser, north_m, east_m):
+    # Rough metres -> degrees near Hyderabad's latitude
+    browser.execute_cdp_cmd("Emulation.setGeolocationOverride", {
+        "latitude": CHARMINAR["latitude"] + north_m / 111_320,
+        "longitude": CHARMINAR["longitude"] + east_m / 106_250,
+        "accuracy": 10,
+    })
+
+
+def test_follow_me_reranks_only_after_real_moves(driver_pool, static_server):
+    """
+    Geolocation Test 6: "Follow Me" re-ranks the nearest places as the user
+    walks from Charminar, but only after moves past the threshold, with at
+    most one routing request per re-rank and only cards whose rank changed
+    moved.
+    """
+    browser = driver_pool.open_context('index.html', geolocation=CHARMINAR)
+    try:
+        wait_for_cards_to_load(browser)
+        wait_for_app_event(browser, 'location-resolved')
+        routing_requests = static_server.stats["/osrm/*"][0]
+        browser.execute_script(_COUNT_CARD_INSERTS_JS)
         
-        # Wait for loading spinner to appear and disappear
-        try:
-            spinner = browser.find_element(By.ID, "loading-spinner")
-            WebDriverWait(browser, 3).until(
-                EC.visibility_of(spinner)
-            )
-            WebDriverWait(browser, 20).until(
-                EC.invisibility_of_element_located((By.ID, "loading-spinner"))
-            )
-        except:
-            time.sleep(3)  # Fallback wait
+        since = app_event_count(browser)
+        browser.find_element(By.ID, "live-nearest-btn").click()
+        updates = [wait_for_app_event(browser, "nearest-updated", since=since, timeout=15)]
         
-        # Verify cards are still visible
-        cards_after_sort = get_visible_cards(browser)
-        assert len(cards_after_sort) > 0, "No cards visible after sorting by distance"
+        for step, (north_m, east_m, moves) in enumerate(WALK, start=2):
+            since = app_event_count(browser)
+            _walk_to(browser, north_m, east_m)
+            WebDriverWait(browser, 10).until(lambda b: b.execute_script(
+                "const w = window.liveNearest; return w.stats.positions >= arguments[0] && !w.running;", step))
+            if moves:
+                updates.append(wait_for_app_event(browser, "nearest-updated", since=since, timeout=15))
+                ranking = browser.execute_script(_LIVE_RANKING_JS)
+                assert ranking["ranked"] == ranking["expected"], f"Stale ranking after step {step - 1}"
         
-        print(f"✅ Geolocation test passed - {len(cards_after_sort)} nearest places shown")
-            
-    except Exception as e:
-        print(f"⚠️ Geolocation test failed: {e}")
+        stats = browser.execute_script("return window.liveNearest.stats;")
+        published = browser.execute_script(
+            "return window.cityQuestEvents.filter(e => e.name === 'nearest-updated').length;")
+        assert stats["moves"] == published == 1 + sum(moves for _, _, moves in WALK), \
+            f"{published} re-ranks for {stats['positions']} positions"
+        assert all(update["routed"] <= update["count"] for update in updates)
+        assert static_server.stats["/osrm/*"][0] - routing_requests <= len(updates), "More than one routing request per re-rank"
+        inserted = browser.execute_script("return window.cardInserts;")
+        assert inserted <= sum(update["changed"] for update in updates), f"{inserted} cards moved"
+        
+        browser.find_element(By.ID, "live-nearest-btn").click()
+        assert browser.execute_script("return window.liveNearest.active;") is False
+    finally:
+        driver_pool.close_context()
+    
+    print(f"✅ Follow Me test passed - {stats['positions']} positions, {stats['moves']} re-ranks, "
+          f"{sum(update['changed'] for update in updates)} cards moved")
 
 
 if __name__ == "__main__":
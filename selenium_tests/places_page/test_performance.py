@@ -4,11 +4,23 @@ Tests for page load time and dynamic content generation.
 """
 
 from selenium.webdriver.common.by import By
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.support.ui import WebDriverWait
 import time
 import sys
 import os
 sys.path.insert(0, os.path.dirname(__file__))
-from selenium_tests.helpers import wait_for_cards_to_load
+from selenium_tests.helpers import (
+    wait_for_cards_to_load,
+    wait_for_app_event,
+    click_and_wait,
+    click_burst,
+    get_visible_card_data,
+    app_event_count,
+    measure_filter_toggles,
+    find_card
+)
+from cityquest.datasets import DESTINATIONS_PATH
 
 
 def test_page_loads_within_timeout(browser):
@@ -50,5 +62,189 @@ def test_filters_generate_dynamically(browser):
     print(f"   - Distance filters: {len(distance_checkboxes)}")
 
 
+def test_nearest_places_first_result_under_200ms(geo_browser):
+    """
+    Performance Test: "Show Nearest" renders haversine results immediately
+    (under 200 ms) and fills in road distances from the local routing
+    stand-in with a single table request afterwards.
+    """
+    wait_for_cards_to_load(geo_browser)
+    
+    since = app_event_count(geo_browser)
+    nearest_btn = geo_browser.find_element(By.ID, "find-nearby-btn")
+    ranked = click_and_wait(geo_browser, nearest_btn, event="nearest-ranked")
+    refined = wait_for_app_event(geo_browser, "nearest-refined", since=since)
+    
+    assert ranked["elapsedMs"] < 200, f"First result took {ranked['elapsedMs']:.0f} ms"
+    assert refined["count"] == ranked["count"] == 5
+    
+    cards = get_visible_card_data(geo_browser)
+    distances = [card["distance"] for card in cards]
+    assert len(cards) == 5 and None not in distances, f"Road distances missing: {distances}"
+    
+    print(f"✅ Nearest places timing test passed")
+    print(f"   - First result: {ranked['elapsedMs']:.1f} ms")
+    print(f"   - Road distances refined: {refined['elapsedMs']:.1f} ms")
+
+
+_FACET_BENCHMARK_JS = """
+const [count, repeat] = arguments;
+const groups = ['Heritage', 'Parks', 'Museums', 'Religious', 'Lakes', 'Entertainment'];
+const records = Array.from({ length: count }, (_, i) => ({
+    groups: [groups[i % groups.length], groups[(i * 7) % groups.length]],
+    fee: [0, 20, 50, 100, 250, 600, 1500][(i * 13) % 7],
+    user_distance: (i * 37) % 60
+}));
+const engine = new FacetEngine(records, {
+    type: groups.map(type => ({ value: type, test: r => r.groups.includes(type) })),
+    budget: BUDGET_RANGES.map(range => ({
+        value: rangeKey(range), test: r => r.fee >= range.min && r.fee <= range.max
+    })),
+    distance: DISTANCE_RANGES.map(range => ({
+        value: rangeKey(range), test: r => r.user_distance >= range.min && r.user_distance <= range.max
+    }))
+});
+const selection = {
+    type: ['Heritage', 'Parks'],
+    budget: [rangeKey(BUDGET_RANGES[2]), rangeKey(BUDGET_RANGES[3])],
+    distance: [rangeKey(DISTANCE_RANGES[0]), rangeKey(DISTANCE_RANGES[1])]
+};
+for (let i = 0; i < 20; i++) engine.query(selection);
+const started = performance.now();
+let result;
+for (let i = 0; i < repeat; i++) result = engine.query(selection);
+return {
+    averageMs: (performance.now() - started) / repeat,
+    matches: result.matches.length,
+    expected: records.filter(r =>
+        selection.type.some(t => r.groups.includes(t)) &&
+        ((r.fee >= 50 && r.fee <= 200) || (r.fee >= 200 && r.fee <= 500)) &&
+        r.user_distance <= 10).length
+};
+"""
+
+
+def test_facet_query_under_1ms_at_100k_records(browser):
+    """
+    Performance Test: the page's facet engine answers a three-facet query,
+    counts included, in under a millisecond over 100k synthetic records.
+    """
+    wait_for_cards_to_load(browser)
+    
+    result = browser.execute_script(_FACET_BENCHMARK_JS, 100_000, 200)
+    
+    assert result["matches"] == result["expected"]
+    assert result["averageMs"] < 1, f"Facet query took {result['averageMs']:.3f} ms"
+    
+    print(f"✅ Facet query timing test passed - {result['averageMs']:.3f} ms for {result['matches']} matches")
+
+
+
+def test_filter_toggles_reuse_cards(browser):
+    """
+    Performance Test: once every card has been shown, toggling type, budget
+    and distance filters only moves existing cards - no element is built.
+    """
+    wait_for_cards_to_load(browser)
+    
+    selector = ".filter-checkbox, .budget-filter-checkbox, .distance-filter-checkbox"
+    result = measure_filter_toggles(browser, selector)
+    
+    assert result["toggles"] > 0, "No filter checkboxes to toggle"
+    assert result["createdPerToggle"] == 0, f"{result['createdPerToggle']:.1f} elements built per toggle"
+    
+    print(f"✅ Filter toggle test passed - {result['msPerToggle']:.2f} ms per toggle over {result['toggles']} toggles")
+
+
+
+def test_rapid_filter_clicks_render_once(browser):
+    """
+    Performance Test: three type filters clicked back to back are applied
+    in one filter run and one render, with the same result as clicking
+    them one at a time.
+    """
+    wait_for_cards_to_load(browser)
+    checkboxes = browser.find_elements(By.CLASS_NAME, "filter-checkbox")[:3]
+    
+    burst = click_burst(browser, checkboxes)
+    
+    assert burst["requests"] == 3
+    assert burst["runs"] == 1, f"{burst['runs']} filter runs for one burst of clicks"
+    assert burst["renders"] == burst["events"] == 1, f"{burst['renders']} renders for one burst of clicks"
+    
+    for checkbox in checkboxes:
+        click_and_wait(browser, checkbox)
+    for checkbox in checkboxes:
+        applied = click_and_wait(browser, checkbox)
+    assert applied["count"] == burst["last"]["count"]
+    
+    print(f"✅ Rapid click test passed - 3 clicks, 1 render of {burst['last']['count']} cards")
+
+
+def test_repeated_filter_combinations_come_from_the_cache(browser):
+    """
+    Performance Test: flipping back to a filter combination shown before is
+    answered from the result cache, and the lookup is far below a frame.
+    """
+    wait_for_cards_to_load(browser)
+    checkbox = browser.find_element(By.CLASS_NAME, "filter-checkbox")
+    stats = "return { ...window.cityQuestFilterCache.stats }"
+    before = browser.execute_script(stats)
+    
+    counts = [click_and_wait(browser, checkbox)["count"] for _ in range(6)]
+    after = browser.execute_script(stats)
+    
+    hits = after["hits"] - before["hits"]
+    misses = after["misses"] - before["misses"]
+    assert counts[0::2] == [counts[0]] * 3 and counts[1::2] == [counts[1]] * 3
+    assert (hits, misses) == (5, 1), f"{hits} hits, {misses} misses over 6 flips"
+    lookup_ms = (after["lookupMs"] - before["lookupMs"]) / (hits + misses)
+    assert lookup_ms < 1, f"Cache lookups took {lookup_ms:.2f} ms"
+    
+    print(f"✅ Filter cache test passed - hit rate {hits / (hits + misses):.0%}, {lookup_ms:.3f} ms per lookup")
+
+
+# Bytes and URLs of the generated/ files the page has fetched so far
+_DATA_REQUESTS_JS = """
+return performance.getEntriesByType('resource')
+    .filter(entry => entry.name.includes('/generated/'))
+    .map(entry => ({ url: entry.name.split('/generated/')[1], bytes: entry.decodedBodySize }));
+"""
+
+
+def test_destination_data_loads_in_a_tenth_of_data_json(browser):
+    """
+    Performance Test: all the data fetched before any card is expanded -
+    the list, the filter classification, anything else under generated/ -
+    is at most a tenth of data.json. The search index waits for the first
+    search, and details arrive a chunk at a time when a card is hovered or
+    expanded.
+    """
+    wait_for_cards_to_load(browser)
+    budget = os.path.getsize(DESTINATIONS_PATH) / 10
+    
+    def detail_requests(driver):
+        return [r["url"] for r in driver.execute_script(_DATA_REQUESTS_JS)
+                if r["url"].startswith("destination-details/")]
+    
+    fetched = browser.execute_script(_DATA_REQUESTS_JS)
+    total = sum(r["bytes"] for r in fetched)
+    assert total <= budget, f"Fetched {total} bytes up front: {fetched}"
+    assert "destinations-list.ndjson" in [r["url"] for r in fetched]
+    assert not any(r["url"].startswith("search-index") for r in fetched), "Search index fetched before a search"
+    assert detail_requests(browser) == [], "Details fetched up front"
+    
+    # Hovering prefetches the card's chunk, expanding then needs no new request
+    card = find_card(browser, "Charminar")
+    ActionChains(browser).move_to_element(card).perform()
+    chunks = WebDriverWait(browser, 5).until(detail_requests)
+    assert len(chunks) == 1, f"Hover fetched {chunks}"
+    
+    click_and_wait(browser, card.find_element(By.CLASS_NAME, "destination-name"), event="details-loaded")
+    assert detail_requests(browser) == chunks, f"Expanding fetched again: {detail_requests(browser)}"
+    
+    print(f"✅ Data budget test passed - {total} bytes up front (budget {budget:.0f}), details from {chunks[0]}")
+
+
 if __name__ == "__main__":
     print("Run tests using: pytest test_performance.py -v")
@@ -0,0 +1,209 @@
+"""
+Scale Tests 📈
+Tests for the places page with 50k synthetic destinations: only the cards
+near the viewport are in the page, scrolling stays smooth and filters,
+"Show Nearest" and card lookups keep working, with filtering moved off the
+main thread.
+"""
+
+from selenium.webdriver.common.by import By
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+from selenium_tests.synthetic_data import SCALE_TEST_RECORDS
+from selenium_tests.helpers import (
+    app_event_time,
+    wait_for_app_event,
+    wait_for_cards_to_load,
+    click_and_wait,
+    find_card,
+    get_filter_option_counts,
+    get_visible_card_data,
+    measure_input_to_paint,
+    measure_scroll_frames,
+    throttle_cpu
+)
+
+# Cards / elements the page may hold at once, whatever the dataset size
+MAX_CARDS = 150
+MAX_ELEMENTS = 5000
+
+# CPU slowdown for the input latency test, roughly a low-end phone
+CPU_THROTTLING_RATE = 4
+
+# A user nowhere near Hyderabad
+LONDON = {"latitude": 51.5074, "longitude": -0.1278, "accuracy": 100}
+
+# Names of the `k` destinations nearest to (lat, lon), checking every one
+_BRUTE_FORCE_NEAREST_JS = """
+const [lat, lon, k] = arguments;
+return window.allDestinations
+    .map(dest => ({ name: dest.name, km: haversineKm(lat, lon, dest.latitude, dest.longitude) }))
+    .sort((a, b) => a.km - b.km)
+    .slice(0, k)
+    .map(dest => dest.name);
+"""
+
+# Where a card ends relative to the bottom of the results grid
+_CARD_OFFSET_FROM_END_JS = """
+const [card, container] = arguments;
+const style = getComputedStyle(container);
+return {
+    gap: container.getBoundingClientRect().bottom - parseFloat(style.paddingBottom) - card.getBoundingClientRect().bottom,
+    height: card.getBoundingClientRect().height
+};
+"""
+
+
+def test_scrolling_keeps_dom_bounded(scale_browser):
+    """
+    Scale Test 1: Verify scrolling through 50k destinations keeps the DOM
+    small and frames short.
+    """
+    applied = wait_for_cards_to_load(scale_browser, timeout=25)
+    assert applied["count"] == applied["total"] == SCALE_TEST_RECORDS
+    
+    result = measure_scroll_frames(scale_browser, "#destinations-container")
+    
+    assert result["maxCards"] <= MAX_CARDS, f"{result['maxCards']} cards in the page"
+    assert result["maxElements"] <= MAX_ELEMENTS, f"{result['maxElements']} elements in the page"
+    assert result["p95Ms"] < 50, f"95th percentile frame took {result['p95Ms']:.1f} ms"
+    
+    print(f"✅ Scroll test passed - p95 frame {result['p95Ms']:.1f} ms, max {result['maxMs']:.1f} ms")
+    print(f"   - At most {result['maxCards']} cards / {result['maxElements']} elements in the page")
+
+
+def test_find_card_reaches_the_last_destination(scale_browser):
+    """
+    Scale Test 2: Verify a card far down the list can be found by name and
+    the scroll height ends right after the last card.
+    """
+    wait_for_cards_to_load(scale_browser, timeout=25)
+    last_name = scale_browser.execute_script(
+        "return window.allDestinations[window.allDestinations.length - 1].name")
+    
+    card = find_card(scale_browser, last_name)
+    assert card is not None, f"Card '{last_name}' not found"
+    
+    container = scale_browser.find_element(By.ID, "destinations-container")
+    offset = scale_browser.execute_script(_CARD_OFFSET_FROM_END_JS, card, container)
+    assert 0 <= offset["gap"] < 1, f"{offset['gap']:.0f}px of grid after the last card"
+    
+    print(f"✅ Last card test passed - found '{last_name}'")
+
+
+def test_expanded_card_survives_scrolling(scale_browser):
+    """
+    Scale Test 3: Verify an expanded card stays expanded after it is
+    scrolled out of the page and back.
+    """
+    wait_for_cards_to_load(scale_browser, timeout=25)
+    
+    card = find_card(scale_browser, "Golconda Fort #300")
+    card.click()
+    assert "expanded" in card.get_attribute("class")
+    
+    measure_scroll_frames(scale_browser, "#destinations-container", frames=30, step_px=2000)
+    assert not scale_browser.execute_script("return arguments[0].isConnected", card), \
+        "Card scrolled far away is still in the page"
+    card_again = find_card(scale_browser, "Golconda Fort #300")
+    
+    assert card_again == card, "Card was rebuilt after scrolling back"
+    assert "expanded" in card_again.get_attribute("class"), "Card collapsed after scrolling"
+    
+    print("✅ Expanded card test passed")
+
+
+def test_filters_and_nearest_at_scale(scale_browser):
+    """
+    Scale Test 4: Verify filter counts and "Show Nearest" work with 50k
+    destinations, ranking from the spatial grid rather than every record.
+    """
+    wait_for_cards_to_load(scale_browser, timeout=25)
+    
+    counts = get_filter_option_counts(scale_browser, "filter-checkbox")
+    label, expected = max(counts.items(), key=lambda item: item[1])
+    checkbox = scale_browser.find_element(By.CSS_SELECTOR, f"input.filter-checkbox[data-type='{label}']")
+    applied = click_and_wait(scale_browser, checkbox)
+    assert applied["count"] == expected, f"'{label}' shows {applied['count']}, its count said {expected}"
+    
+    nearest_btn = scale_browser.find_element(By.ID, "find-nearby-btn")
+    ranked = click_and_wait(scale_browser, nearest_btn, event="nearest-ranked")
+    assert ranked["count"] == 5
+    assert ranked["examined"] < SCALE_TEST_RECORDS / 10, f"Ranking looked at {ranked['examined']} destinations"
+    assert len(get_visible_card_data(scale_browser)) == 5
+    
+    print(f"✅ Scale filter test passed - '{label}': {expected} of {SCALE_TEST_RECORDS}")
+
+
+def test_first_cards_arrive_before_the_full_list(scale_browser):
+    """
+    Scale Test 5: Verify the first cards are drawn from the first streamed
+    rows, well before all 50k destinations are in.
+    """
+    first = wait_for_app_event(scale_browser, "first-cards", timeout=25)
+    wait_for_cards_to_load(scale_browser, timeout=25)
+    first_ms = app_event_time(scale_browser, "first-cards")
+    complete_ms = app_event_time(scale_browser, "data-loaded")
+    
+    assert 0 < first["count"] < SCALE_TEST_RECORDS, f"First batch held {first['count']} rows"
+    assert first_ms < complete_ms / 2, \
+        f"First cards at {first_ms:.0f} ms, all data at {complete_ms:.0f} ms"
+    
+    print(f"✅ Streaming test passed - first cards at {first_ms:.0f} ms ({first['count']} rows), "
+          f"all {SCALE_TEST_RECORDS} at {complete_ms:.0f} ms")
+
+
+def test_filter_worker_keeps_input_responsive(open_scale_page):
+    """
+    Scale Test 6: Verify that with a throttled CPU, toggling a filter over
+    50k destinations blocks the main thread less when the filter worker does
+    the work than when the page filters on the main thread.
+    """
+    results = {}
+    for mode, config in [("main thread", {"filterWorkerThreshold": 10 ** 9}), ("worker", {})]:
+        browser = open_scale_page(**config)
+        wait_for_cards_to_load(browser, timeout=25)
+        if mode == "worker":
+            ready = wait_for_app_event(browser, "filter-worker-ready", timeout=25)
+            assert ready["count"] == SCALE_TEST_RECORDS
+        
+        counts = get_filter_option_counts(browser, "filter-checkbox")
+        label = max(counts, key=counts.get)
+        checkbox = browser.find_element(By.CSS_SELECTOR, f"input.filter-checkbox[data-type='{label}']")
+        with throttle_cpu(browser, CPU_THROTTLING_RATE):
+            results[mode] = measure_input_to_paint(browser, checkbox)
+    
+    before, after = results["main thread"], results["worker"]
+    assert after["longestFrameMs"] <= before["longestFrameMs"], \
+        f"Longest frame {after['longestFrameMs']:.0f} ms with the worker, {before['longestFrameMs']:.0f} ms without"
+    
+    print(f"✅ Filter worker test passed at {CPU_THROTTLING_RATE}x CPU throttling")
+    for mode, result in results.items():
+        print(f"   - {mode}: input to paint median {result['medianMs']:.0f} ms, max {result['maxMs']:.0f} ms, "
+              f"longest frame {result['longestFrameMs']:.0f} ms")
+
+
+def test_nearest_from_far_away_stays_cheap(open_scale_page):
+    """
+    Scale Test 7: Verify "Show Nearest" for a user far from every
+    destination still ranks correctly from a small share of the 50k, rather
+    than walking the empty grid cells in between.
+    """
+    browser = open_scale_page(location=LONDON)
+    wait_for_cards_to_load(browser, timeout=25)
+    
+    nearest_btn = browser.find_element(By.ID, "find-nearby-btn")
+    ranked = click_and_wait(browser, nearest_btn, event="nearest-ranked")
+    expected = browser.execute_script(_BRUTE_FORCE_NEAREST_JS, LONDON["latitude"], LONDON["longitude"], 5)
+    
+    assert [card["name"] for card in get_visible_card_data(browser)] == expected
+    assert ranked["examined"] < SCALE_TEST_RECORDS / 10, f"Ranking looked at {ranked['examined']} destinations"
+    assert ranked["elapsedMs"] < 100, f"Ranking took {ranked['elapsedMs']:.0f} ms"
+    
+    print(f"✅ Far away nearest test passed - examined {ranked['examined']} of {SCALE_TEST_RECORDS} "
+          f"in {ranked['elapsedMs']:.1f} ms")
+
+
+if __name__ == "__main__":
+    print("Run tests using: pytest test_scale.py -v")
@@ -0,0 +1,147 @@
+"""
+Destination Search Tests 🔎
+Tests for the places page's search box: ranked prefix search combined with
+the checkbox filters, and keystroke latency at 100k records.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+from cityquest.build import read_json
+from cityquest.build.compile_datasets import compile_destinations
+from cityquest.build.search_index import OUTPUT_PATHS as SEARCH_INDEX_OUTPUTS
+from cityquest.datasets import load_destinations
+from cityquest.search import SearchIndex
+from selenium_tests.helpers import (
+    wait_for_cards_to_load,
+    get_visible_card_names,
+    click_filter_by_label,
+    search_and_wait
+)
+
+
+def _expected(text):
+    destinations = compile_destinations(load_destinations())
+    index = SearchIndex(read_json(SEARCH_INDEX_OUTPUTS["destinations"]))
+    return [destinations[i]["name"] for i in index.search(text)]
+
+
+def test_search_finds_places_by_name_prefix(browser):
+    """
+    Search Test 1: "golc" ranks Golconda Fort first, matching the reference index.
+    """
+    wait_for_cards_to_load(browser)
+    
+    search_and_wait(browser, "golc")
+    names = get_visible_card_names(browser)
+    assert names == _expected("golc")
+    assert names[0] == "Golconda Fort"
+    
+    detail = search_and_wait(browser, "golconda nowhere")
+    assert detail["count"] == 0
+    
+    # The page's own index, fetched once on the first search
+    fetched = browser.execute_script(
+        "return performance.getEntriesByType('resource').map(entry => entry.name)"
+        ".filter(name => name.includes('/generated/search-index'));")
+    assert len(fetched) == 1 and fetched[0].endswith("/search-index-destinations.json"), fetched
+    print(f"✅ Name prefix search test passed - {names}")
+
+
+def test_search_combines_with_budget_filter(browser):
+    """
+    Search Test 2: a budget filter narrows the search results and keeps their order.
+    """
+    wait_for_cards_to_load(browser)
+    
+    search_and_wait(browser, "lake")
+    click_filter_by_label(browser, "budget-filter-checkbox", "Free")
+    
+    free = {d["name"] for d in compile_destinations(load_destinations()) if d["fee"] == 0}
+    names = get_visible_card_names(browser)
+    assert names == [name for name in _expected("lake") if name in free]
+    print(f"✅ Search with budget filter test passed - {len(names)} free lake places")
+
+
+_KEYSTROKE_BENCHMARK_JS = """
+const [count, words] = arguments;
+const syllables = ['ka', 'ri', 'ma', 'bi', 'ya', 'ni', 'do', 'ub', 'le', 'me', 'et', 'ha',
+                   'sha', 'hi', 'pa', 'ra', 'di', 'se', 'qu', 'ta', 'la', 'na', 'ch', 'ai'];
+let seed = 7;
+const random = () => (seed = (seed * 1103515245 + 12345) % 2147483648) / 2147483648;
+const pick = list => list[Math.floor(random() * list.length)];
+const vocabulary = Array.from({ length: 20000 }, () =>
+    Array.from({ length: 2 + Math.floor(random() * 3) }, () => pick(syllables)).join(''));
+
+// Synthetic records and their index, in the layout cityquest/search.py emits
+const records = [];
+const postingsByTerm = new Map();
+for (let record = 0; record < count; record++) {
+    const name = Array.from({ length: words }, () => pick(vocabulary));
+    const weights = new Map();
+    name.forEach(term => weights.set(term, 8));
+    for (let i = 0; i < 10; i++) {
+        const term = pick(vocabulary);
+        weights.set(term, (weights.get(term) || 0) + 1);
+    }
+    weights.forEach((weight, term) => {
+        if (!postingsByTerm.has(term)) postingsByTerm.set(term, []);
+        postingsByTerm.get(term).push(record, weight);
+    });
+    records.push({ name: name.join(' '), fee: [0, 20, 50, 100, 250, 600, 1500][record % 7] });
+}
+const terms = Array.from(postingsByTerm.keys()).sort();
+const search = new SearchIndex({
+    terms,
+    counts: terms.map(term => postingsByTerm.get(term).length / 2),
+    postings: terms.flatMap(term => postingsByTerm.get(term))
+});
+const facets = new FacetEngine(records, {
+    budget: BUDGET_RANGES.map(range => ({
+        value: rangeKey(range), test: r => r.fee >= range.min && r.fee <= range.max
+    }))
+});
+const selection = { budget: [rangeKey(BUDGET_RANGES[0]), rangeKey(BUDGET_RANGES[2])] };
+
+// What filterDestinations does for each keystroke, minus painting the cards
+const keystrokes = text => Array.from(text, (_, i) => {
+    const started = performance.now();
+    const ranked = search.search(text.slice(0, i + 1));
+    const { bits } = facets.query(selection, ranked ? facets.bitsOf(ranked) : undefined);
+    const shown = ranked ? facets.recordsAt(ranked, bits) : records;
+    return { ms: performance.now() - started, shown };
+});
+keystrokes(records[4321].name);  // warm up
+const timings = keystrokes(records[1234].name);
+const final = timings[timings.length - 1].shown;
+return {
+    worstMs: Math.max(...timings.map(t => t.ms)),
+    averageMs: timings.reduce((sum, t) => sum + t.ms, 0) / timings.length,
+    keystrokes: timings.length,
+    firstResult: final.length ? final[0].name : null,
+    expected: records[1234].name,
+    expectedShown: [0, 50, 100, 200].includes(records[1234].fee)
+};
+"""
+
+
+def test_keystroke_latency_under_16ms_at_100k_records(browser):
+    """
+    Search Test 3: every keystroke of a three-word query - search, budget
+    filter and ranking together - stays under one 60 fps frame (16 ms) over
+    100k synthetic records.
+    """
+    wait_for_cards_to_load(browser)
+    
+    result = browser.execute_script(_KEYSTROKE_BENCHMARK_JS, 100_000, 3)
+    
+    if result["expectedShown"]:
+        assert result["firstResult"] == result["expected"]
+    assert result["worstMs"] < 16, f"Slowest keystroke took {result['worstMs']:.1f} ms"
+    
+    print(f"✅ Keystroke latency test passed - {result['keystrokes']} keystrokes, "
+          f"worst {result['worstMs']:.2f} ms, average {result['averageMs']:.2f} ms")
+
+
+if __name__ == "__main__":
+    print("Run tests using: pytest places_page/test_search.py -v")
@@ -4,11 +4,28 @@ Tests for place type filtering functionality (Heritage, Parks, Museums, etc.)
 """
 
 from selenium.webdriver.common.by import By
-import time
+from urllib.parse import parse_qs, urlsplit
 import sys
 import os
 sys.path.insert(0, os.path.dirname(__file__))
-from selenium_tests.helpers import wait_for_cards_to_load, get_visible_cards
+from selenium_tests.helpers import (
+    wait_for_cards_to_load, get_visible_cards, click_and_wait, click_filter_by_label,
+    get_filter_option_counts,
+)
+from cityquest.build import read_json
+from cityquest.build.compile_datasets import CLASSIFICATION_OUTPUTS, compile_destinations
+from cityquest.datasets import load_destinations
+from cityquest.facets import Facet, FacetIndex
+
+# The page's budget options (BUDGET_RANGES in script.js)
+BUDGET_RANGES = {
+    "Free": (0, 0),
+    "Under ₹50": (1, 50),
+    "₹50 - ₹200": (50, 200),
+    "₹200 - ₹500": (200, 500),
+    "₹500 - ₹1000": (500, 1000),
+    "Above ₹1000": (1000, float("inf")),
+}
 
 
 def test_filter_by_type_heritage(browser):
@@ -27,8 +44,7 @@ def test_filter_by_type_heritage(browser):
             By.CSS_SELECTOR, 
             "input.filter-checkbox[data-type='Heritage']"
         )
-        heritage_checkbox.click()
-        time.sleep(1)
+        click_and_wait(browser, heritage_checkbox)
         
         # Get filtered cards
         filtered_cards = get_visible_cards(browser)
@@ -50,8 +66,7 @@ def test_filter_by_type_parks(browser):
             By.CSS_SELECTOR, 
             "input.filter-checkbox[data-type='Parks']"
         )
-        parks_checkbox.click()
-        time.sleep(1)
+        click_and_wait(browser, parks_checkbox)
         
         filtered_cards = get_visible_cards(browser)
         assert len(filtered_cards) > 0, "No parks found after filtering"
@@ -73,15 +88,13 @@ def test_clear_filters_button(browser):
             By.CSS_SELECTOR, 
             "input.filter-checkbox[data-type='Heritage']"
         )
-        heritage_checkbox.click()
-        time.sleep(1)
+        click_and_wait(browser, heritage_checkbox)
         
         filtered_count = len(get_visible_cards(browser))
         
         # Click clear filters
         clear_btn = browser.find_element(By.ID, "clear-filters")
-        clear_btn.click()
-        time.sleep(1)
+        click_and_wait(browser, clear_btn)
         
         # Verify all cards are back
         final_count = len(get_visible_cards(browser))
@@ -92,5 +105,60 @@ def test_clear_filters_button(browser):
         print(f"⚠️ Clear filters test failed: {e}")
 
 
+def test_option_counts_match_reference_engine(browser):
+    """
+    Filter Test 4: every type and budget option shows how many places it
+    would give, matching the Python facet engine over the compiled records.
+    Without a location no distance bucket can match.
+    """
+    wait_for_cards_to_load(browser)
+    destinations = compile_destinations(load_destinations())
+    table = read_json(CLASSIFICATION_OUTPUTS["destinations"])
+    index = FacetIndex(destinations, [
+        Facet("type", {t: (lambda t: lambda d: t in table["groups"][d["place_type"]])(t)
+                       for t in table["options"]}),
+        Facet("budget", {label: (lambda lo, hi: lambda d: lo <= d["fee"] <= hi)(*bounds)
+                         for label, bounds in BUDGET_RANGES.items()}),
+    ])
+
+    heritage = browser.find_element(By.CSS_SELECTOR, "input.filter-checkbox[data-type='Heritage']")
+    for selection in ({}, {"type": ["Heritage"]}):
+        if selection:
+            click_and_wait(browser, heritage)
+        matches, expected = index.query(selection)
+        assert get_filter_option_counts(browser, "filter-checkbox") == expected["type"]
+        assert get_filter_option_counts(browser, "budget-filter-checkbox") == expected["budget"]
+        assert len(get_visible_cards(browser)) == len(matches)
+
+    distance_counts = get_filter_option_counts(browser, "distance-filter-checkbox")
+    assert set(distance_counts.values()) == {0}, distance_counts
+    print(f"✅ Option counts test passed - {len(matches)} Heritage places")
+
+
+def test_filters_survive_reload_through_the_url(browser):
+    """
+    Filter Test 5: the selected filters are mirrored in the query string, so
+    reloading the page (or opening a shared link) shows the same results.
+    """
+    wait_for_cards_to_load(browser)
+    checkbox = browser.find_element(By.CLASS_NAME, "filter-checkbox")
+    place_type = checkbox.get_attribute("data-type")
+    click_and_wait(browser, checkbox)
+    applied = click_filter_by_label(browser, "budget-filter-checkbox", "Free")
+    
+    query = parse_qs(urlsplit(browser.current_url).query)
+    assert query == {"type": [place_type], "budget": ["0-0"]}, f"Query string is {query}"
+    
+    browser.refresh()
+    reloaded = wait_for_cards_to_load(browser)
+    checked = browser.execute_script(
+        "return Array.from(document.querySelectorAll('#filter-container input:checked'), cb => cb.className)")
+    assert sorted(checked) == ["budget-filter-checkbox", "filter-checkbox"]
+    assert reloaded["count"] == applied["count"], \
+        f"{reloaded['count']} places after the reload, {applied['count']} before"
+    
+    print(f"✅ URL filter test passed - '{place_type}' + Free: {applied['count']} places after a reload")
+
+
 if __name__ == "__main__":
     print("Run tests using: pytest test_type_filters.py -v")
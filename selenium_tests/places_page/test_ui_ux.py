@@ -7,7 +7,8 @@ from selenium.webdriver.common.by import By
 import sys
 import os
 sys.path.insert(0, os.path.dirname(__file__))
-from selenium_tests.helpers import wait_for_cards_to_load, get_visible_cards
+from cityquest.build import nearby_food, read_json
+from selenium_tests.helpers import wait_for_cards_to_load, get_visible_cards, find_card, click_and_wait
 
 
 def test_card_structure_and_content(browser):
@@ -24,7 +25,10 @@ def test_card_structure_and_content(browser):
     assert first_card.find_element(By.CLASS_NAME, "destination-info")
     assert first_card.find_element(By.CLASS_NAME, "place-type")
     assert first_card.find_element(By.CLASS_NAME, "entry-fee")
-    assert first_card.find_element(By.CLASS_NAME, "description")
+    
+    # The description arrives with the details when the card is expanded
+    click_and_wait(browser, first_card.find_element(By.CLASS_NAME, "destination-name"), event="details-loaded")
+    assert first_card.find_element(By.CLASS_NAME, "description").text != ""
     
     print("✅ Card structure test passed - All elements present")
 
@@ -60,5 +64,26 @@ def test_navigation_links_work(browser):
     print("✅ Navigation links test passed")
 
 
+def test_expanded_card_lists_joined_food_places(browser):
+    """
+    UI Test 4: An expanded card lists the nearest food places from the
+    build-time join, each with distance, budget and cuisine group.
+    """
+    wait_for_cards_to_load(browser)
+    artifact = read_json(nearby_food.OUTPUT_PATH)
+    
+    card = find_card(browser, "Charminar")
+    click_and_wait(browser, card.find_element(By.CLASS_NAME, "destination-name"), event="details-loaded")
+    items = card.find_elements(By.CSS_SELECTOR, ".food-places li")
+    
+    expected = [artifact["food"][row] for row, _ in artifact["nearby"]["charminar"]]
+    assert [item.find_element(By.CLASS_NAME, "nearby-food-name").text for item in items] == \
+        [name for name, _, _ in expected]
+    first_meta = items[0].find_element(By.CLASS_NAME, "nearby-food-meta").text
+    assert "km" in first_meta and f"₹{expected[0][1]}" in first_meta and expected[0][2] in first_meta
+    
+    print(f"✅ Nearby food test passed - {len(items)} food places near Charminar")
+
+
 if __name__ == "__main__":
     print("Run tests using: pytest test_ui_ux.py -v")
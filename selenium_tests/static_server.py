@@ -0,0 +1,275 @@
+"""
+Asyncio Static Server for City Quest Tests
+Drop-in replacement for SimpleHTTPRequestHandler + ThreadingTCPServer.
+
+Every file under the site directory is read, hashed and gzip-compressed once
+at startup, then served from memory by a single asyncio event loop running
+in a background thread. Supports keep-alive, ETag / If-None-Match (304),
+gzip Content-Encoding and HEAD, and records per-path request counts and
+latencies so the suite can report them at session end.
+
+JSON services (such as the routing stand-in) can be mounted under a path
+prefix next to the static files, so the pages reach them same-origin.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import threading
+import time
+from urllib.parse import unquote, urlsplit
+
+
+# Types worth compressing; images and fonts are already compressed
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/x-ndjson", "application/javascript",
+                      "image/svg+xml")
+
+mimetypes.add_type("text/javascript", ".js")
+mimetypes.add_type("application/json", ".json")
+mimetypes.add_type("application/x-ndjson", ".ndjson")
+
+STATUS_TEXT = {
+    200: "OK",
+    304: "Not Modified",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+}
+
+
+class Asset:
+    """One preloaded file: raw body, optional gzip body and its ETag."""
+
+    __slots__ = ("body", "gzip_body", "etag", "content_type")
+
+    def __init__(self, body, content_type):
+        self.body = body
+        self.content_type = content_type
+        self.etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+        self.gzip_body = None
+        if content_type.startswith(COMPRESSIBLE_TYPES):
+            compressed = gzip.compress(body, compresslevel=9, mtime=0)
+            if len(compressed) < len(body):
+                self.gzip_body = compressed
+
+
+def load_site(directory):
+    """Read every file under `directory` into a {'/url/path': Asset} dict."""
+    assets = {}
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = [d for d in dirs if not d.startswith(".")]
+        for name in files:
+            if name.startswith("."):
+                continue
+            full_path = os.path.join(root, name)
+            url_path = "/" + os.path.relpath(full_path, directory).replace(os.sep, "/")
+            content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+            if content_type.startswith("text/") or content_type in ("application/json", "text/javascript"):
+                content_type += "; charset=utf-8"
+            with open(full_path, "rb") as f:
+                assets[url_path] = Asset(f.read(), content_type)
+    return assets
+
+
+class StaticServer:
+    """
+    In-memory static file server on its own asyncio loop.
+
+    Usage:
+        server = StaticServer(DEVOPS_DIR)
+        base_url = server.start()
+        ...
+        server.stop()
+        print(format_stats(server.stats))
+    """
+
+    def __init__(self, directory, host="127.0.0.1", port=0):
+        self.directory = directory
+        self.host = host
+        self.port = port
+        self.assets = load_site(directory)
+        # path -> [request count, total latency ms, max latency ms]
+        self.stats = {}
+        # prefix -> handler(path below prefix, query string) -> (status, payload)
+        self.mounts = {}
+        self._loop = None
+        self._thread = None
+        self._server = None
+        self._writers = set()
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def mount(self, prefix, handler):
+        """
+        Serve a JSON service under `prefix` (e.g. '/osrm').
+
+        Args:
+            prefix: URL path prefix, without a trailing slash
+            handler: Callable(path, query) returning (status, payload), where
+                payload is JSON-serialisable, or bytes sent as they are with
+                the content type of the path's extension, and `path` is
+                relative to the prefix
+        """
+        self.mounts[prefix.rstrip("/")] = handler
+
+    def start(self):
+        """Start serving in a background thread and return the base URL."""
+        self._loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def run():
+            asyncio.set_event_loop(self._loop)
+            self._server = self._loop.run_until_complete(
+                asyncio.start_server(self._handle_connection, self.host, self.port)
+            )
+            self.port = self._server.sockets[0].getsockname()[1]
+            ready.set()
+            self._loop.run_forever()
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="static-server", daemon=True)
+        self._thread.start()
+        ready.wait()
+        return self.base_url
+
+    def stop(self):
+        """Close the listener and any keep-alive connections, then stop the loop."""
+        if self._loop is None:
+            return
+
+        async def shutdown():
+            self._server.close()
+            for writer in list(self._writers):
+                writer.close()
+            await self._server.wait_closed()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop = None
+
+    async def _handle_connection(self, reader, writer):
+        self._writers.add(writer)
+        try:
+            while await self._handle_request(reader, writer):
+                pass
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _handle_request(self, reader, writer):
+        """Serve one request. Returns True if the connection stays open."""
+        request_line = await reader.readline()
+        if not request_line:
+            return False
+        started = time.perf_counter()
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        try:
+            method, target, version = request_line.decode("latin-1").split()
+        except ValueError:
+            await self._send(writer, 400, b"", "text/plain", {}, keep_alive=False)
+            return False
+
+        if "content-length" in headers:
+            await reader.readexactly(int(headers["content-length"]))
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+        url = urlsplit(target)
+        path = unquote(url.path)
+        if path.endswith("/"):
+            path += "index.html"
+
+        mount = self._find_mount(path)
+        if mount is not None and method in ("GET", "HEAD"):
+            status, payload = self.mounts[mount](path[len(mount):], url.query)
+            if isinstance(payload, bytes):
+                body, content_type = payload, mimetypes.guess_type(path)[0] or "application/octet-stream"
+            else:
+                body, content_type = json.dumps(payload).encode("utf-8"), "application/json; charset=utf-8"
+            await self._send(writer, status, body, content_type,
+                             {"Cache-Control": "no-store"}, keep_alive, head=method == "HEAD")
+            self._record(mount + "/*", (time.perf_counter() - started) * 1000)
+            return keep_alive
+
+        asset = self.assets.get(path)
+        if method not in ("GET", "HEAD"):
+            status, body, content_type, extra = 405, b"", "text/plain", {"Allow": "GET, HEAD"}
+        elif asset is None:
+            status, body, content_type, extra = 404, b"Not Found", "text/plain", {}
+        else:
+            extra = {"ETag": asset.etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+            content_type = asset.content_type
+            if asset.etag in headers.get("if-none-match", ""):
+                status, body = 304, b""
+            elif asset.gzip_body is not None and "gzip" in headers.get("accept-encoding", ""):
+                status, body = 200, asset.gzip_body
+                extra["Content-Encoding"] = "gzip"
+            else:
+                status, body = 200, asset.body
+
+        await self._send(writer, status, body, content_type, extra, keep_alive, head=method == "HEAD")
+        self._record(path, (time.perf_counter() - started) * 1000)
+        return keep_alive
+
+    def _find_mount(self, path):
+        for prefix in self.mounts:
+            if path == prefix or path.startswith(prefix + "/"):
+                return prefix
+        return None
+
+    async def _send(self, writer, status, body, content_type, extra, keep_alive, head=False):
+        lines = [
+            f"HTTP/1.1 {status} {STATUS_TEXT[status]}",
+            f"Content-Type: {content_type}",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        lines.extend(f"{name}: {value}" for name, value in extra.items())
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        if not head and status != 304:
+            writer.write(body)
+        await writer.drain()
+
+    def _record(self, path, elapsed_ms):
+        entry = self.stats.get(path)
+        if entry is None:
+            self.stats[path] = [1, elapsed_ms, elapsed_ms]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed_ms
+            entry[2] = max(entry[2], elapsed_ms)
+
+
+def merge_stats(into, other):
+    """Add the per-path stats in `other` to `into` (e.g. across xdist workers)."""
+    for path, (count, total_ms, max_ms) in other.items():
+        entry = into.setdefault(path, [0, 0.0, 0.0])
+        entry[0] += count
+        entry[1] += total_ms
+        entry[2] = max(entry[2], max_ms)
+    return into
+
+
+def format_stats(stats):
+    """Render per-path stats as a small text table, busiest paths first."""
+    lines = [f"{'path':<40} {'requests':>9} {'avg ms':>8} {'max ms':>8}"]
+    for path, (count, total_ms, max_ms) in sorted(stats.items(), key=lambda item: -item[1][0]):
+        lines.append(f"{path:<40} {count:>9} {total_ms / count:>8.2f} {max_ms:>8.2f}")
+    return "\n".join(lines)
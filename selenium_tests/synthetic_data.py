@@ -0,0 +1,93 @@
+"""
+Synthetic datasets for scale tests
+Serves the compiled datasets scaled up to any number of records, from a
+mount on the test server (see conftest.py). A page loads them instead of
+Devops/generated/ when CityQuestConfig.dataBaseUrl points at the mount.
+
+Copy n of a record keeps its fields, with " #n" appended to the name (and
+the id), a slightly moved location and the description cut to 200
+characters to keep the payloads manageable. The classification table and
+the destination list and detail payloads are built for the scaled records;
+the search index covers names only, which is all the scale tests search,
+and there is no nearby-food join (expanded cards fall back to each
+destination's own list).
+"""
+
+from cityquest.build import destination_payloads, ndjson_text
+from cityquest.build.compile_datasets import (
+    compile_classification, compile_destinations, compile_food_places,
+)
+from cityquest.datasets import load_destinations, load_food_places
+from cityquest.search import SEARCH_FIELDS, build_search_index
+
+# Records per dataset in the scale tests
+SCALE_TEST_RECORDS = 50_000
+# Longest description a synthetic record keeps
+DESCRIPTION_LENGTH = 200
+
+
+def scale_records(records, count):
+    """`count` records cycling through `records`, each copy made unique."""
+    scaled = []
+    for i in range(count):
+        copy, row = divmod(i, len(records))
+        record = dict(records[row])
+        if copy:
+            record["name"] = f"{record['name']} #{copy}"
+            record["id"] = f"{record['id']}-{copy}"
+            # Spread copies over ~1 km around the original
+            record["latitude"] += ((copy * 7919) % 200 - 100) * 1e-4
+            record["longitude"] += ((copy * 104729) % 200 - 100) * 1e-4
+        record["description"] = record.get("description", "")[:DESCRIPTION_LENGTH]
+        scaled.append(record)
+    return scaled
+
+
+class SyntheticDatasets:
+    """
+    JSON handler for a StaticServer mount serving `count` destinations and
+    `count` food places. The data is built on the first request.
+    """
+
+    def __init__(self, count):
+        self.count = count
+        self._files = None
+
+    def files(self):
+        """{file name: payload, or bytes for .ndjson files} for everything the pages load."""
+        if self._files is None:
+            destinations = scale_records(compile_destinations(load_destinations()), self.count)
+            food_places = scale_records(compile_food_places(load_food_places()), self.count)
+            names = lambda records: [{"name": record["name"]} for record in records]
+            listing, chunks = destination_payloads.build(destinations)
+            self._files = {
+                "destinations-list.ndjson": ndjson_text(destination_payloads.stream_lines(listing)).encode("utf-8"),
+                "food-places.ndjson": ndjson_text(food_places).encode("utf-8"),
+                "search-index-destinations.json": {
+                    "fields": {"name": SEARCH_FIELDS["name"]}, **build_search_index(names(destinations)),
+                },
+                "search-index-food.json": {
+                    "fields": {"name": SEARCH_FIELDS["name"]}, **build_search_index(names(food_places)),
+                },
+            }
+            for page, table in compile_classification(destinations, food_places).items():
+                self._files[f"classification-{page}.json"] = table
+            for chunk, details in enumerate(chunks):
+                self._files[f"destination-details/{chunk}.json"] = details
+        return self._files
+
+    def handle(self, path, query=""):
+        """
+        Answer one request.
+
+        Args:
+            path: File path below the mount, e.g. '/destinations-list.ndjson'
+            query: Raw query string (ignored)
+
+        Returns:
+            tuple: (HTTP status, JSON-serialisable payload or bytes)
+        """
+        payload = self.files().get(path.strip("/"))
+        if payload is None:
+            return 404, {"error": f"no synthetic {path.strip('/')}"}
+        return 200, payload